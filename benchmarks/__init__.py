@@ -0,0 +1,7 @@
+"""me_toolbox benchmark suite
+
+usage (from the repository root):
+    python -m benchmarks                       # run and write benchmark_results.json
+    python -m benchmarks -o new.json --compare old.json
+    python -m benchmarks --list
+"""
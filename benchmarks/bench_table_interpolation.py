@@ -0,0 +1,40 @@
+"""Micro-benchmark of the per-call latency of the table interpolation functions
+
+usage: python -m benchmarks.bench_table_interpolation
+"""
+from timeit import Timer
+
+import numpy as np
+
+from me_toolbox.tools import table_interpolation, TableInterpolator, get_table
+from me_toolbox.gears.gear import SPUR_YJ_TABLES
+
+
+def per_call(statement, number, repeat=5, calls_per_statement=1):
+    """Returns the best per-call time in [s] of the statement"""
+    best = min(Timer(statement).repeat(repeat=repeat, number=number))
+    return best / (number * calls_per_statement)
+
+
+def main():
+    data = get_table(*SPUR_YJ_TABLES[20])
+    interpolator = TableInterpolator(data)
+    x_row, x_col = 23.5, 41.7  # a point that needs interpolation on both axes
+
+    rng = np.random.default_rng(0)
+    size = 100_000
+    x_rows = rng.uniform(18, 1000, size)
+    x_cols = rng.uniform(1, 1000, size)
+
+    results = {
+        'table_interpolation': per_call(lambda: table_interpolation(x_row, x_col, data), 10_000),
+        'TableInterpolator (scalar)': per_call(lambda: interpolator(x_row, x_col), 100_000),
+        'TableInterpolator.batch (per point)': per_call(lambda: interpolator.batch(x_rows, x_cols),
+                                                        10, calls_per_statement=size),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<40}{seconds * 1e9:>12.1f} [ns/call]")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,193 @@
+"""module containing the benchmark cases, a case is a setup function (not timed)
+returning the call to time
+"""
+from collections import namedtuple
+from contextlib import redirect_stdout
+from functools import lru_cache
+from io import StringIO
+
+import numpy as np
+
+from me_toolbox.fasteners import Bolt, ThreadedFastener, BoltPattern
+from me_toolbox.fatigue import FatigueAnalysis
+from me_toolbox.gears import SpurGear, HelicalGear, Transmission
+from me_toolbox.springs import Spring, HelicalCompressionSpring, ExtensionSpring
+from me_toolbox.springs import HelicalTorsionSpring
+
+Case = namedtuple('Case', ['name', 'setup', 'number', 'repeat', 'slow'])
+
+CASES = []
+
+
+def case(name, number=1, repeat=5, slow=False):
+    """Register a benchmark case
+
+    :param str name: The case name (the key in the results)
+    :param int number: Number of calls per timing
+    :param int repeat: Number of timings (the case is set up before each one)
+    :param bool slow: Slow cases are only run when requested
+    """
+    def register(setup):
+        CASES.append(Case(name, setup, number, repeat, slow))
+        return setup
+    return register
+
+
+# springs
+def compression_spring_properties():
+    """The HelicalCompressionSpring example properties"""
+    return dict(max_force=500, wire_diameter=6, spring_diameter=50,
+                ultimate_tensile_strength=Spring.material_prop('music wire', 6),
+                shear_yield_percent=0.45, shear_modulus=75e3, elastic_modulus=205e3,
+                end_type='squared and ground', spring_rate=6, set_removed=False,
+                shot_peened=True, density=7800, zeta=0.25)
+
+
+@case('HelicalCompressionSpring.__init__', number=1000)
+def compression_spring_init():
+    properties = compression_spring_properties()
+    return lambda: HelicalCompressionSpring(**properties)
+
+
+@case('HelicalCompressionSpring.fatigue_analysis', number=1000)
+def compression_spring_fatigue():
+    spring = HelicalCompressionSpring(**compression_spring_properties())
+    return lambda: spring.fatigue_analysis(max_force=500, min_force=100, reliability=99.999)
+
+
+@case('ExtensionSpring.fatigue_analysis', number=1000)
+def extension_spring_fatigue():
+    spring = ExtensionSpring(max_force=22.24, initial_tension=5.29, wire_diameter=0.88,
+                             spring_diameter=5.41, hook_r1=2.69, hook_r2=2.672,
+                             ultimate_tensile_strength=1823.3, body_shear_yield_percent=0.45,
+                             hook_normal_yield_percent=0.75, hook_shear_yield_percent=0.4,
+                             shear_modulus=80e3, elastic_modulus=197.9e3, spring_rate=3.13,
+                             shot_peened=False, density=7800)
+    return lambda: spring.fatigue_analysis(max_force=22.24, min_force=6.67,
+                                           criterion='gerber', reliability=50)
+
+
+@case('HelicalTorsionSpring.static_analysis', number=1000)
+def torsion_spring_static():
+    wire_diameter = 1.829
+    with redirect_stdout(StringIO()):  # the example spring prints an arbor clearance note
+        spring = HelicalTorsionSpring(max_moment=851.27, wire_diameter=wire_diameter,
+                                      spring_diameter=15.081 - wire_diameter, leg1=25.4, leg2=25.4,
+                                      ultimate_tensile_strength=Spring.material_prop('music wire',
+                                                                                     wire_diameter),
+                                      yield_percent=0.45 / 0.577, shear_modulus=81e3,
+                                      elastic_modulus=196.5e3, spring_rate=525.11,
+                                      arbor_diameter=10.16, shot_peened=False, density=7800)
+    return spring.static_analysis
+
+
+# gears
+def spur_transmission():
+    """The spur gear example pinion and transmission"""
+    pinion = SpurGear(modulus=4, pressure_angle=25, teeth_num=25, rpm=1500, grade=2,
+                      Qv=11, crowned=False, adjusted=True, width=25, bearing_span=10,
+                      pinion_offset=2, enclosure='extra precision enclosed', hardness=400,
+                      number_of_cycles=1e8, material='steel', sensitive_use=True)
+    gearbox = Transmission(gear1=pinion, oil_temp=65, reliability=0.999, power=50e3,
+                           gear_ratio=3.1, driving_machine='light shock',
+                           driven_machine='moderate shock', SF=1.1, SH=1)
+    return pinion, gearbox
+
+
+def helical_transmission():
+    """The helical gear example gear and transmission"""
+    helical = HelicalGear(modulus=2, pressure_angle=20, teeth_num=37, rpm=2500, grade=1,
+                          Qv=12, crowned=False, adjusted=False, width=50, bearing_span=100,
+                          pinion_offset=22.4, enclosure='precision enclosed', hardness=160,
+                          number_of_cycles=1e6, material='steel', helix_angle=20,
+                          sensitive_use=True)
+    gearbox = Transmission(gear1=helical, oil_temp=100, reliability=0.999, power=50e3,
+                           gear_ratio=2.5, driving_machine='uniform', driven_machine='uniform',
+                           SF=1, SH=1)
+    return helical, gearbox
+
+
+@case('Transmission.optimize (SpurGear)', number=10)
+def spur_optimize():
+    pinion, gearbox = spur_transmission()
+    return lambda: gearbox.optimize(pinion)
+
+
+@case('Transmission.optimize (HelicalGear)', number=5)
+def helical_optimize():
+    helical, gearbox = helical_transmission()
+    return lambda: gearbox.optimize(helical)
+
+
+@case('Transmission.life_expectency (SpurGear)', number=1000)
+def spur_life():
+    pinion, gearbox = spur_transmission()
+    return lambda: gearbox.life_expectency(pinion)
+
+
+@case('Transmission.life_expectency (HelicalGear)', number=1000)
+def helical_life():
+    helical, gearbox = helical_transmission()
+    return lambda: gearbox.life_expectency(helical)
+
+
+# fasteners
+def bolt_pattern(num_of_bolts):
+    """A circular pattern of M10 fasteners loaded by an eccentric force"""
+    sy, sut, sp = Bolt.get_strength_prop(10, '9.8')
+    bolt = Bolt(10, 1.5, 33, 26, sy, sut, sp, 207e3)
+    fastener = ThreadedFastener(bolt, [[5, 207e3], [10, 207e3]], nut=True, preload=32062.5)
+    angles = np.linspace(0, 2 * np.pi, num_of_bolts, endpoint=False)
+    locations = [[100 * np.cos(angle), 150 + 100 * np.sin(angle), 0] for angle in angles]
+    return BoltPattern([fastener] * num_of_bolts, locations, [0, -8500, 0], [0, 0, 100],
+                       [[0, 0], [1, 0]], 'shank')
+
+
+def bolt_pattern_safety_factors(num_of_bolts):
+    """The static safety factors of a bolt pattern"""
+    pattern = bolt_pattern(num_of_bolts)
+
+    def safety_factors():
+        pattern.load_safety_factor()
+        pattern.separation_safety_factor()
+        pattern.proof_safety_factor()
+    return safety_factors
+
+
+@case('BoltPattern safety factors (4 bolts)', number=20)
+def bolt_pattern_4():
+    return bolt_pattern_safety_factors(4)
+
+
+@case('BoltPattern safety factors (100 bolts)', repeat=3)
+def bolt_pattern_100():
+    return bolt_pattern_safety_factors(100)
+
+
+# the pattern properties are recalculated inside per bolt loops, at 10,000 bolts this takes hours
+@case('BoltPattern safety factors (10,000 bolts)', repeat=1, slow=True)
+def bolt_pattern_10000():
+    return bolt_pattern_safety_factors(10_000)
+
+
+# fatigue
+@lru_cache(maxsize=None)
+def stress_groups(size, seed=0):
+    """Random [number_of_repetitions, maximum_stress, minimum_stress] groups
+    all in the high cycle fatigue range of Sut=480, Se=90 (created once per size and seed,
+    the groups aren't modified by Miner's rule)"""
+    rng = np.random.default_rng(seed)
+    repetitions = rng.integers(1, 1000, size)
+    mean = rng.uniform(0, 50, size)
+    alternating = rng.uniform(120, 250, size)
+    return np.column_stack([repetitions, mean + alternating, mean - alternating]).tolist()
+
+
+@case('FatigueAnalysis.miner_rule (1e6 groups)', repeat=3)
+def miner_rule():
+    analysis = FatigueAnalysis(modified_endurance_limit=90, stress_type='bending', ductile=True,
+                               ultimate_tensile_strength=480, yield_strength=410, Kf_bending=1,
+                               alt_bending_stress=150, mean_bending_stress=50)
+    # miner_rule doesn't modify the groups, so the same groups are used for every timing
+    groups = stress_groups(10 ** 6)
+    return lambda: analysis.miner_rule(groups, Sut=480, Se=90, Sy=410, z=-5.69)
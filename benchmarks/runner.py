@@ -0,0 +1,178 @@
+"""module containing the benchmark runner, the JSON results format and the results comparison"""
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from statistics import median
+from time import perf_counter
+
+import numpy as np
+
+# results format version, results of other versions can't be compared
+RESULTS_FORMAT_VERSION = 1
+
+
+def measure(case):
+    """Time a benchmark case, the case is set up before every repeat (not timed)
+
+    :param benchmarks.cases.Case case: The benchmark case
+
+    :returns: The per-call times of every repeat in [s]
+    :rtype: list[float]
+    """
+    times = []
+    for _ in range(case.repeat):
+        call = case.setup()
+        start = perf_counter()
+        for _ in range(case.number):
+            call()
+        times.append((perf_counter() - start) / case.number)
+    return times
+
+
+def run(cases, include_slow=False, verbose=True):
+    """Run the benchmark cases
+
+    :param list cases: The benchmark cases
+    :param bool include_slow: Run the cases marked as slow (skipped otherwise)
+    :param bool verbose: Print the results while running
+
+    :returns: The results (see :func:`save`)
+    :rtype: dict
+    """
+    results = {}
+    for case in cases:
+        if case.slow and not include_slow:
+            results[case.name] = {'skipped': 'slow case, run with --include-slow'}
+            if verbose:
+                print(f"{case.name:<55}{'skipped (slow)':>20}")
+            continue
+        times = measure(case)
+        results[case.name] = {'best': min(times), 'median': median(times), 'times': times,
+                              'repeat': case.repeat, 'number': case.number}
+        if verbose:
+            print(f"{case.name:<55}{_format_time(min(times)):>20}")
+    return {'format_version': RESULTS_FORMAT_VERSION, 'environment': environment(),
+            'results': results}
+
+
+def environment():
+    """Information about the environment the benchmarks ran in
+
+    :rtype: dict
+    """
+    return {'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'commit': _git_commit()}
+
+
+def save(results, path):
+    """Write the results to a JSON file"""
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+
+
+def load(path):
+    """Read results from a JSON file
+
+    :raises ValueError: if the results format version is different
+    """
+    with open(path, encoding='utf-8') as file:
+        results = json.load(file)
+    if results.get('format_version') != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"{path} results format version is {results.get('format_version')}, "
+                         f"expected {RESULTS_FORMAT_VERSION}")
+    return results
+
+
+def compare(baseline, current, threshold=0.2, verbose=True):
+    """Compare the best times of two results, a case is a regression if it is slower
+    than the baseline by more than the threshold (relative)
+
+    :param dict baseline: The baseline results
+    :param dict current: The current results
+    :param float threshold: Allowed relative slowdown (0.2 -> 20%)
+    :param bool verbose: Print the comparison table
+
+    :returns: The names of the regressed cases
+    :rtype: list[str]
+    """
+    regressions = []
+    for name, result in current['results'].items():
+        base = baseline['results'].get(name, {})
+        if 'best' not in result or 'best' not in base:
+            continue
+        ratio = result['best'] / base['best']
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        if verbose:
+            note = 'REGRESSION' if regressed else ('faster' if ratio < 1 - threshold else '')
+            print(f"{name:<55}{_format_time(base['best']):>12}{_format_time(result['best']):>12}"
+                  f"{ratio:>8.2f}x  {note}")
+    return regressions
+
+
+def _format_time(seconds):
+    """Format a time in [s] with a readable unit"""
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} [{unit}]"
+    return f"{seconds / 1e-9:.1f} [ns]"
+
+
+def _git_commit():
+    """The current git commit (None outside of a git repository)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    """Command line interface (python -m benchmarks -h)"""
+    import argparse  # pylint: disable=import-outside-toplevel
+    from benchmarks.cases import CASES  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Run the me_toolbox benchmark suite')
+    parser.add_argument('-o', '--output', default='benchmark_results.json',
+                        help='results JSON file (default: %(default)s)')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare with a baseline results JSON file')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed relative slowdown before a case is a regression '
+                             '(default: %(default)s)')
+    parser.add_argument('-k', '--filter', default='',
+                        help='run only the cases containing this text')
+    parser.add_argument('--include-slow', action='store_true',
+                        help='also run the cases marked as slow')
+    parser.add_argument('--list', action='store_true', help='list the cases and exit')
+    args = parser.parse_args(argv)
+
+    cases = [case for case in CASES if args.filter in case.name]
+    if args.list:
+        for case in cases:
+            print(case.name + (' (slow)' if case.slow else ''))
+        return 0
+
+    results = run(cases, include_slow=args.include_slow)
+    save(results, args.output)
+    print(f"results saved to {args.output}")
+
+    if args.compare:
+        print(f"\ncomparing with {args.compare}:")
+        regressions = compare(load(args.compare), results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
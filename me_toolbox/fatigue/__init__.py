@@ -1,4 +1,12 @@
 from me_toolbox.fatigue.failure_criteria import FailureCriteria
+from me_toolbox.fatigue.mean_stress import MeanStressCorrection
+from me_toolbox.fatigue.critical_plane import CriticalPlane
 from me_toolbox.fatigue.fatigue_analysis import FatigueAnalysis
 from me_toolbox.fatigue.endurance_limit import EnduranceLimit
-
+from me_toolbox.fatigue.sn_curve import SNCurve
+from me_toolbox.fatigue.strain_life import StrainLife
+from me_toolbox.fatigue.fatigue_analysis_batch import FatigueAnalysisBatch
+from me_toolbox.fatigue.damage_accumulator import DamageAccumulator
+from me_toolbox.fatigue.cycle_matrix import RangeMeanMatrix
+from me_toolbox.fatigue.monte_carlo import MonteCarloAnalysis
+from me_toolbox.fatigue.spectral import SpectralFatigue
@@ -0,0 +1,230 @@
+"""module containing the CriticalPlane class, critical plane multiaxial fatigue criteria
+(Findley, Matake and Fatemi-Socie) for proportional and non-proportional stress histories
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+# number of candidate planes of the coarse search (evenly spread on a hemisphere)
+COARSE_PLANES = 400
+
+# number of in-plane directions the shear stress is projected on
+SHEAR_DIRECTIONS = 12
+
+# maximum number of (time, plane, direction) projections evaluated at once
+CHUNK_ELEMENTS = 2 ** 22
+
+# the result of the critical plane searches
+CriticalPlaneResult = namedtuple('CriticalPlaneResult',
+                                 ['damage_parameter', 'normal', 'shear_amplitude',
+                                  'max_normal_stress', 'safety_factor'])
+
+
+class CriticalPlane:
+    """Bundling the critical plane criteria together, the stress history of a point
+    is given as (T, 3, 3) stress tensors (see :func:`me_toolbox.tools.stress_tensor`).
+
+    The planes are searched over a precomputed set of plane normals (Fibonacci lattice),
+    the best planes are then refined locally with finer and finer candidate grids
+    """
+
+    @staticmethod
+    def findley(stress_history, k, fatigue_limit=None, planes=COARSE_PLANES, refine=4,
+                seeds=3):
+        """Findley criterion, the critical plane maximizes τa + k * σn_max
+
+        Note: for fully reversed bending (σa) the parameter is σa/2 * (k + sqrt(1 + k^2)),
+        for fully reversed torsion (τa) it is τa * sqrt(1 + k^2)
+
+        :param np.ndarray stress_history: (T, 3, 3) stress tensors history
+        :param float k: The material's normal stress sensitivity
+        :param float or None fatigue_limit: The material's Findley parameter limit
+            (used for the safety factor)
+        :param int planes: Number of candidate planes of the coarse search
+        :param int refine: Number of refinement levels
+        :param int seeds: Number of coarse planes refined
+
+        :returns: The damage parameter, the plane normal, its shear amplitude and maximum
+            normal stress and the safety factor (None if no fatigue limit was given)
+        :rtype: CriticalPlaneResult
+        """
+        def parameter(shear_amplitude, max_normal_stress):
+            return shear_amplitude + k * max_normal_stress
+
+        return _search(stress_history, parameter, parameter, fatigue_limit, planes, refine,
+                       seeds)
+
+    @staticmethod
+    def matake(stress_history, k, fatigue_limit=None, planes=COARSE_PLANES, refine=4, seeds=3):
+        """Matake criterion, τa + k * σn_max on the plane of the maximum shear amplitude
+        (of the planes with the maximum shear amplitude the one with the largest normal stress)
+
+        :param np.ndarray stress_history: (T, 3, 3) stress tensors history
+        :param float k: The material's normal stress sensitivity
+        :param float or None fatigue_limit: The material's Matake parameter limit
+            (used for the safety factor)
+        :param int planes: Number of candidate planes of the coarse search
+        :param int refine: Number of refinement levels
+        :param int seeds: Number of coarse planes refined
+
+        :returns: The damage parameter, the plane normal, its shear amplitude and maximum
+            normal stress and the safety factor (None if no fatigue limit was given)
+        :rtype: CriticalPlaneResult
+        """
+        def objective(shear_amplitude, max_normal_stress):
+            return shear_amplitude
+
+        def parameter(shear_amplitude, max_normal_stress):
+            return shear_amplitude + k * max_normal_stress
+
+        return _search(stress_history, objective, parameter, fatigue_limit, planes, refine,
+                       seeds)
+
+    @staticmethod
+    def fatemi_socie(stress_history, k, yield_strength, shear_modulus=None, fatigue_limit=None,
+                     planes=COARSE_PLANES, refine=4, seeds=3):
+        """Fatemi-Socie criterion, the critical plane maximizes γa * (1 + k * σn_max / Sy),
+        with the elastic shear strain amplitude γa = τa / G if the shear modulus is given,
+        otherwise the stress form τa * (1 + k * σn_max / Sy)
+
+        :param np.ndarray stress_history: (T, 3, 3) stress tensors history
+        :param float k: The material's normal stress sensitivity
+        :param float yield_strength: Yield strength [MPa]
+        :param float or None shear_modulus: Shear modulus [MPa]
+        :param float or None fatigue_limit: The material's Fatemi-Socie parameter limit
+            (used for the safety factor)
+        :param int planes: Number of candidate planes of the coarse search
+        :param int refine: Number of refinement levels
+        :param int seeds: Number of coarse planes refined
+
+        :returns: The damage parameter, the plane normal, its shear amplitude and maximum
+            normal stress and the safety factor (None if no fatigue limit was given)
+        :rtype: CriticalPlaneResult
+        """
+        def parameter(shear_amplitude, max_normal_stress):
+            shear = shear_amplitude if shear_modulus is None else shear_amplitude / shear_modulus
+            return shear * (1 + k * max_normal_stress / yield_strength)
+
+        return _search(stress_history, parameter, parameter, fatigue_limit, planes, refine,
+                       seeds)
+
+    @staticmethod
+    def plane_stresses(stress_history, normals, directions=SHEAR_DIRECTIONS):
+        """Shear stress amplitude and maximum normal stress of a stress history on planes,
+        the shear amplitude is half the longest range of the shear stress projections on
+        in-plane directions (exact for proportional and circular shear paths)
+
+        :param np.ndarray stress_history: (T, 3, 3) stress tensors history
+        :param np.ndarray normals: (M, 3) unit plane normals
+        :param int directions: Number of in-plane directions (over 180°)
+
+        :returns: The (M,) shear amplitudes and maximum normal stresses
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        stress_history = np.asarray(stress_history, dtype=float).reshape(-1, 3, 3)
+        normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+        if len(stress_history) == 0:
+            raise ValueError("The stress history is empty")
+        shear_amplitude = np.empty(len(normals))
+        max_normal_stress = np.empty(len(normals))
+
+        # σn = n·S·n and the shear projections τk = n·S·dk are linear in the stress tensor,
+        # all the planes are evaluated with a single matrix product of the flattened tensors
+        flat_history = stress_history.reshape(-1, 9)
+        angles = np.pi * np.arange(directions) / directions
+        chunk = max(1, CHUNK_ELEMENTS // (len(stress_history) * (directions + 1)))
+        for start in range(0, len(normals), chunk):
+            index = slice(start, start + chunk)
+            normal = normals[index]
+            first, second = _plane_basis(normal)
+            # in-plane directions (M, K, 3)
+            in_plane = (np.cos(angles)[None, :, None] * first[:, None, :] +
+                        np.sin(angles)[None, :, None] * second[:, None, :])
+            # (M, K + 1, 3) the plane normal followed by the in-plane directions
+            projected = np.concatenate((normal[:, None, :], in_plane), axis=1)
+            weights = (normal[:, None, :, None] * projected[:, :, None, :]).reshape(-1, 9)
+
+            projections = (flat_history @ weights.T).reshape(len(stress_history), len(normal),
+                                                              directions + 1)
+            shear = projections[:, :, 1:]
+            shear_amplitude[index] = ((shear.max(axis=0) - shear.min(axis=0)) / 2).max(axis=1)
+            max_normal_stress[index] = projections[:, :, 0].max(axis=0)
+        return shear_amplitude, max_normal_stress
+
+    @staticmethod
+    def fibonacci_normals(count):
+        """Returns count unit normals evenly spread on the upper hemisphere
+        (a plane and its opposite normal are the same plane), the arrays are cached read-only
+
+        :param int count: Number of normals
+
+        :rtype: np.ndarray
+        """
+        return _fibonacci_normals(int(count))
+
+
+@lru_cache(maxsize=None)
+def _fibonacci_normals(count):
+    """The Fibonacci lattice on the upper hemisphere"""
+    index = np.arange(count)
+    z = 1 - (index + 0.5) / count
+    radius = np.sqrt(1 - z ** 2)
+    phi = index * np.pi * (3 - np.sqrt(5))  # the golden angle
+    normals = np.column_stack((radius * np.cos(phi), radius * np.sin(phi), z))
+    normals.setflags(write=False)
+    return normals
+
+
+def _plane_basis(normals):
+    """Two orthonormal in-plane directions of every plane"""
+    helper = np.zeros_like(normals)
+    along_x = np.abs(normals[:, 0]) > 0.9
+    helper[along_x, 1] = 1
+    helper[~along_x, 0] = 1
+    first = np.cross(normals, helper)
+    first /= np.linalg.norm(first, axis=1, keepdims=True)
+    return first, np.cross(normals, first)
+
+
+def _best(objective, max_normal_stress):
+    """The index of the maximum objective, ties are broken by the larger normal stress"""
+    best = objective.max()
+    ties = objective >= best - 1e-9 * abs(best)
+    return int(np.argmax(np.where(ties, max_normal_stress, -np.inf)))
+
+
+def _search(stress_history, objective, parameter, fatigue_limit, planes, refine, seeds):
+    """Coarse search over the Fibonacci normals then local refinement of the best planes,
+    every level evaluates a grid of candidates around each seed with half the spacing
+    """
+    stress_history = np.asarray(stress_history, dtype=float).reshape(-1, 3, 3)
+    normals = _fibonacci_normals(int(planes))
+    shear_amplitude, max_normal_stress = CriticalPlane.plane_stresses(stress_history, normals)
+    values = objective(shear_amplitude, max_normal_stress)
+
+    seeds = min(seeds, len(normals))
+    candidates = normals[np.argsort(-values, kind='stable')[:seeds]]
+    offsets = np.linspace(-1, 1, 5)
+    offsets = np.stack(np.meshgrid(offsets, offsets), axis=-1).reshape(-1, 2)
+    radius = np.sqrt(2 * np.pi / len(normals))  # the coarse normals spacing
+    for _ in range(refine):
+        first, second = _plane_basis(candidates)
+        candidates = (candidates[:, None, :] +
+                      radius * (offsets[None, :, 0, None] * first[:, None, :] +
+                                offsets[None, :, 1, None] * second[:, None, :])).reshape(-1, 3)
+        candidates /= np.linalg.norm(candidates, axis=1, keepdims=True)
+        shear_amplitude, max_normal_stress = CriticalPlane.plane_stresses(stress_history,
+                                                                          candidates)
+        values = objective(shear_amplitude, max_normal_stress)
+        best = np.argsort(-values, kind='stable')[:seeds]
+        candidates = candidates[best]
+        radius /= 2
+
+    shear_amplitude, max_normal_stress = CriticalPlane.plane_stresses(stress_history, candidates)
+    index = _best(objective(shear_amplitude, max_normal_stress), max_normal_stress)
+    normal = candidates[index] * (1 if candidates[index][2] >= 0 else -1)
+    damage_parameter = float(parameter(shear_amplitude[index], max_normal_stress[index]))
+    safety_factor = None if fatigue_limit is None else fatigue_limit / damage_parameter
+    return CriticalPlaneResult(damage_parameter, normal, float(shear_amplitude[index]),
+                               float(max_normal_stress[index]), safety_factor)
@@ -0,0 +1,295 @@
+"""module containing the RangeMeanMatrix class, a binned (range, mean) rainflow matrix
+of a load spectrum, its damage is computed per bin instead of per cycle
+"""
+import numpy as np
+
+from me_toolbox.fatigue.fatigue_analysis import FatigueAnalysis
+from me_toolbox.fatigue.rainflow import RainflowCounter, Cycles, CHUNK_SIZE
+
+# default number of range and mean bins
+BINS = 64
+
+
+class RangeMeanMatrix:
+    """Rainflow cycle counts binned by range (rows) and mean (columns),
+    the bins include their lower edge (the last bin includes both edges).
+
+    Cycles out of the bin edges are left out of the counts and counted in
+    :attr:`out_of_range`, matrices with the same edges can be merged (e.g. of several
+    measurement files) and the damage is computed with the bin centres
+
+    .. code-block:: python
+
+        edges = np.linspace(0, 600, 61), np.linspace(-300, 300, 61)
+        matrix = RangeMeanMatrix.merge(RangeMeanMatrix.from_series(np.load(path), *edges)
+                                       for path in paths)
+        matrix.scale(1000).miner_rule(Sut=480, Se=90, Sy=410).total_life
+    """
+
+    def __init__(self, range_edges, mean_edges, counts=None, out_of_range=0.0):
+        """Instantiating a range-mean matrix
+
+        :param np.ndarray range_edges: The range bin edges (increasing) [MPa]
+        :param np.ndarray mean_edges: The mean bin edges (increasing) [MPa]
+        :param np.ndarray or None counts: (range bins, mean bins) cycle counts,
+            None for an empty matrix
+        :param float out_of_range: Number of cycles out of the bin edges
+        """
+        self.range_edges = np.array(range_edges, dtype=float)
+        self.mean_edges = np.array(mean_edges, dtype=float)
+        for name, edges in (('range', self.range_edges), ('mean', self.mean_edges)):
+            if edges.ndim != 1 or edges.size < 2 or np.any(np.diff(edges) <= 0):
+                raise ValueError(f"The {name} edges should be an increasing 1D array "
+                                 f"of at least two edges")
+        shape = (self.range_edges.size - 1, self.mean_edges.size - 1)
+        self.counts = np.zeros(shape) if counts is None else np.array(counts, dtype=float)
+        if self.counts.shape != shape:
+            raise ValueError(f"counts should be of shape {shape} not {self.counts.shape}")
+        self.out_of_range = float(out_of_range)
+
+    def __repr__(self):
+        return f"RangeMeanMatrix(range_bins={self.counts.shape[0]}, " \
+               f"mean_bins={self.counts.shape[1]}, cycles={self.total_cycles})"
+
+    @classmethod
+    def from_cycles(cls, cycles, range_bins=BINS, mean_bins=BINS):
+        """Bin counted cycles
+
+        :param Cycles cycles: The counted cycles (see :func:`rainflow`)
+        :param int or np.ndarray range_bins: Number of range bins (spanning the cycles)
+            or the range bin edges
+        :param int or np.ndarray mean_bins: Number of mean bins (spanning the cycles)
+            or the mean bin edges
+
+        :rtype: RangeMeanMatrix
+        """
+        count, cycle_range, mean = (np.asarray(value, dtype=float) for value in cycles)
+        range_edges = _edges(range_bins, 0, cycle_range.max(initial=0))
+        mean_edges = _edges(mean_bins, mean.min(initial=0), mean.max(initial=0))
+        matrix = cls(range_edges, mean_edges)
+        matrix.add_cycles(Cycles(count, cycle_range, mean))
+        return matrix
+
+    @classmethod
+    def from_series(cls, series, range_bins=BINS, mean_bins=BINS, chunk_size=CHUNK_SIZE):
+        """Rainflow count a stress history into a matrix chunk by chunk, only the binned
+        counts of every chunk are kept (the residual half cycles are added at the end)
+
+        :param np.ndarray or iterable series: The stress history (an array, e.g. memory-mapped,
+            or an iterable of chunks, e.g. a generator reading a stream) [MPa]
+        :param int or np.ndarray range_bins: Number of range bins or the range bin edges
+        :param int or np.ndarray mean_bins: Number of mean bins or the mean bin edges
+        :param int chunk_size: Number of samples counted at once from an array
+
+        :rtype: RangeMeanMatrix
+        :raises ValueError: if numbers of bins are given for an iterable of chunks
+        """
+        if isinstance(series, np.ndarray):
+            series = series.reshape(-1)
+            low, high = (series.min(), series.max()) if series.size else (0, 0)
+            range_edges = _edges(range_bins, 0, high - low)
+            mean_edges = _edges(mean_bins, low, high)
+            chunks = (series[start:start + chunk_size]
+                      for start in range(0, series.size, chunk_size))
+        elif np.ndim(range_bins) == 0 or np.ndim(mean_bins) == 0:
+            raise ValueError("The bin edges must be given to count an iterable of chunks")
+        else:
+            range_edges, mean_edges, chunks = range_bins, mean_bins, series
+
+        matrix = cls(range_edges, mean_edges)
+        counter = RainflowCounter()
+        for chunk in chunks:
+            matrix.add_cycles(counter.update(chunk))
+        matrix.add_cycles(counter.residual())
+        return matrix
+
+    @classmethod
+    def merge(cls, matrices):
+        """Sum matrices with the same bin edges (e.g. of several measurements)
+
+        :param iterable matrices: The matrices, or the paths of saved matrices
+
+        :rtype: RangeMeanMatrix
+        :raises ValueError: if the bin edges are different
+        """
+        merged = None
+        for matrix in matrices:
+            if not isinstance(matrix, RangeMeanMatrix):
+                matrix = cls.load(matrix)
+            if merged is None:
+                merged = cls(matrix.range_edges, matrix.mean_edges, matrix.counts,
+                             matrix.out_of_range)
+                continue
+            if not (np.array_equal(merged.range_edges, matrix.range_edges) and
+                    np.array_equal(merged.mean_edges, matrix.mean_edges)):
+                raise ValueError("Only matrices with the same bin edges can be merged")
+            merged.counts += matrix.counts
+            merged.out_of_range += matrix.out_of_range
+        if merged is None:
+            raise ValueError("No matrices to merge")
+        return merged
+
+    @classmethod
+    def load(cls, path):
+        """Load a matrix saved with :meth:`save`
+
+        :param str path: The .npz file path
+
+        :rtype: RangeMeanMatrix
+        """
+        with np.load(path) as data:
+            return cls(data['range_edges'], data['mean_edges'], data['counts'],
+                       float(data['out_of_range']))
+
+    def save(self, path):
+        """Save the matrix as a .npz file
+
+        :param str path: The file path
+        """
+        np.savez(path, range_edges=self.range_edges, mean_edges=self.mean_edges,
+                 counts=self.counts, out_of_range=self.out_of_range)
+
+    @property
+    def total_cycles(self):
+        """The number of binned cycles
+
+        :rtype: float
+        """
+        return float(self.counts.sum())
+
+    @property
+    def range_centers(self):
+        """The range bins centres
+
+        :rtype: np.ndarray
+        """
+        return (self.range_edges[:-1] + self.range_edges[1:]) / 2
+
+    @property
+    def mean_centers(self):
+        """The mean bins centres
+
+        :rtype: np.ndarray
+        """
+        return (self.mean_edges[:-1] + self.mean_edges[1:]) / 2
+
+    def add_cycles(self, cycles):
+        """Add counted cycles to the matrix (in place)
+
+        :param Cycles cycles: The counted cycles (see :func:`rainflow`)
+        """
+        count, cycle_range, mean = (np.asarray(value, dtype=float) for value in cycles)
+        if count.size == 0:
+            return
+        counts, _, _ = np.histogram2d(cycle_range, mean, bins=(self.range_edges, self.mean_edges),
+                                      weights=count)
+        self.counts += counts
+        self.out_of_range += float(count.sum() - counts.sum())
+
+    def scale(self, repetitions):
+        """The matrix of the spectrum repeated (e.g. a test track lap to the design life)
+
+        :param float repetitions: Number of repetitions
+
+        :rtype: RangeMeanMatrix
+        """
+        return RangeMeanMatrix(self.range_edges, self.mean_edges, self.counts * repetitions,
+                               self.out_of_range * repetitions)
+
+    def extrapolate(self, repetitions, tail_bins=5):
+        """Extrapolate the spectrum to a longer duration, the counts are scaled and the range
+        exceedance tail (the number of cycles with a larger range) is fitted log-linearly over
+        the highest tail_bins non empty range bins and continued beyond the measured ranges.
+        The extrapolated cycles fill the empty range bins above the highest measured one and
+        the range bins are extended (with the width of the last bin), in both while the
+        extrapolated exceedance is at least one cycle, the added cycles have the mean
+        distribution of the highest measured range bin
+
+        :param float repetitions: The extrapolation factor (e.g. design life / measured time)
+        :param int tail_bins: Number of the highest non empty range bins fitted
+
+        :rtype: RangeMeanMatrix
+        :raises ValueError: if less than two range bins are not empty
+        """
+        range_counts = self.counts.sum(axis=1)
+        filled = np.flatnonzero(range_counts)
+        if filled.size < 2:
+            raise ValueError("At least two non empty range bins are needed to extrapolate")
+        # number of cycles with a range above the lower edge of every bin
+        exceedance = np.cumsum(range_counts[::-1])[::-1]
+        tail = filled[-max(tail_bins, 2):]
+        slope, intercept = np.polyfit(self.range_edges[tail], np.log(exceedance[tail]), 1)
+
+        scaled = self.scale(repetitions)
+        if slope >= 0:
+            return scaled
+
+        def extrapolated_exceedance(edge):
+            return repetitions * np.exp(intercept + slope * edge)
+
+        # the edges above the highest measured bin, extended beyond the last edge
+        width = self.range_edges[-1] - self.range_edges[-2]
+        edges = self.range_edges[filled[-1] + 1:].tolist()
+        while extrapolated_exceedance(edges[-1]) >= 1:
+            edges.append(edges[-1] + width)
+
+        edges = np.array(edges)
+        lower, upper = edges[:-1], edges[1:]
+        added = np.where(extrapolated_exceedance(lower) >= 1,
+                         extrapolated_exceedance(lower) - extrapolated_exceedance(upper), 0.0)
+        if not added.any():
+            return scaled
+
+        profile = self.counts[filled[-1]] / range_counts[filled[-1]]
+        new_bins = edges.size - (self.range_edges.size - filled[-1] - 1)
+        counts = np.vstack((scaled.counts, np.zeros((new_bins, self.mean_edges.size - 1))))
+        counts[filled[-1] + 1:] += added[:, None] * profile[None, :]
+        return RangeMeanMatrix(np.concatenate((self.range_edges, edges[edges.size - new_bins:])),
+                               self.mean_edges, counts, scaled.out_of_range)
+
+    def to_cycles(self, conservative=False):
+        """The non empty bins as cycles
+
+        :param bool conservative: Use the upper range edge of every bin instead of its centre
+
+        :rtype: Cycles
+        """
+        range_index, mean_index = np.nonzero(self.counts)
+        ranges = self.range_edges[1:] if conservative else self.range_centers
+        return Cycles(self.counts[range_index, mean_index], ranges[range_index],
+                      self.mean_centers[mean_index])
+
+    def miner_rule(self, Sut, Se, Sy=None, z=-3, mean_stress_correction='goodman',
+                   conservative=False, warn=True):
+        """Miner's rule of the matrix, computed per non empty bin
+        (see :meth:`FatigueAnalysis.miner_rule_batch`), bins above the S-N curve range
+        (e.g. of an extrapolated tail) fail at once
+
+        :param float Sut: Ultimate tensile strength [MPa]
+        :param float Se: endurance limit [MPa]
+        :param float Sy: yield strength [MPa], if None only HCF is checked
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+            where N=5e8
+        :param str or callable mean_stress_correction: The mean stress correction
+            (see :class:`MeanStressCorrection`)
+        :param bool conservative: Use the upper range edge of every bin instead of its centre
+        :param bool warn: print a note if some of the bins are out of the S-N curve range
+
+        :returns: The number of repetitions of the spectrum until failure, and the per bin
+            damage, life and reversible stress (of the non empty bins, see :meth:`to_cycles`)
+        :rtype: me_toolbox.fatigue.fatigue_analysis.MinerResult
+        """
+        count, cycle_range, mean = self.to_cycles(conservative)
+        groups = np.column_stack((count, cycle_range / 2, mean))
+        return FatigueAnalysis.miner_rule_batch(groups, Sut, Se, Sy, z, alt_mean=True,
+                                                warn=warn,
+                                                mean_stress_correction=mean_stress_correction)
+
+
+def _edges(bins, low, high):
+    """The bin edges, given or spanning [low, high]"""
+    if np.ndim(bins) > 0:
+        return bins
+    if high <= low:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, int(bins) + 1)
@@ -0,0 +1,187 @@
+"""module containing the DamageAccumulator class, Miner's rule damage
+of a stress history fed chunk by chunk (streaming rainflow counting)
+"""
+import os
+from math import inf
+
+import numpy as np
+
+from me_toolbox.fatigue.fatigue_analysis import FatigueAnalysis
+from me_toolbox.fatigue.rainflow import RainflowCounter, stress_groups, CHUNK_SIZE
+
+
+class DamageAccumulator:
+    """Accumulates Miner's rule damage of a stress history too long to be held in memory,
+    the history is fed in consecutive chunks (arrays, generators of arrays or memory-mapped
+    files), the full cycles closed by each chunk are rainflow counted and their damage added.
+
+    The unclosed residual is carried between chunks, its half cycles are added to the
+    damage only when the current damage is requested (see :attr:`residual_damage`)
+
+    .. code-block:: python
+
+        accumulator = DamageAccumulator(Sut=480, Se=90, Sy=410, sample_rate=10e3)
+        accumulator.consume_file('strain_gauge.bin', dtype='float32')
+        accumulator.damage, accumulator.remaining_life
+    """
+
+    def __init__(self, Sut, Se, Sy=None, z=-3, sample_rate=None,
+                 mean_stress_correction='goodman'):
+        """Instantiating a damage accumulator
+
+        :param float Sut: Ultimate tensile strength [MPa]
+        :param float Se: endurance limit [MPa]
+        :param float Sy: yield strength [MPa], if None only HCF is checked
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+            where N=5e8
+        :param float or None sample_rate: The history's sample rate [Hz],
+            if given the remaining life is in seconds (otherwise in samples)
+        :param str or callable mean_stress_correction: The mean stress correction
+            (see :class:`MeanStressCorrection`)
+        """
+        self.Sut, self.Se, self.Sy, self.z = Sut, Se, Sy, z
+        self.sample_rate = sample_rate
+        self.mean_stress_correction = mean_stress_correction
+        self.counter = RainflowCounter()
+        self.closed_damage = 0.0
+        self.cycles = 0
+        # full cycles above the S-N curve range (failing at once, infinite damage)
+        self.overload_cycles = 0
+
+    def __repr__(self):
+        return f"DamageAccumulator(Sut={self.Sut}, Se={self.Se}, Sy={self.Sy}, z={self.z}, " \
+               f"sample_rate={self.sample_rate})"
+
+    @property
+    def samples(self):
+        """The number of samples fed so far
+
+        :rtype: int
+        """
+        return self.counter.samples
+
+    def update(self, chunk):
+        """Feed the next chunk of the stress history
+
+        :param np.ndarray chunk: The next samples of the stress history [MPa]
+
+        :returns: The damage of the full cycles closed by the chunk
+        :rtype: float
+        """
+        cycles = self.counter.update(chunk)
+        damage, overload = self._damage(cycles)
+        if overload and not self.overload_cycles:
+            # print a note but don't stop the calculation
+            print(f"NOTE: {overload} cycles above the S-N curve range (sample {self.samples}), "
+                  f"failure is expected (infinite damage)")
+        self.closed_damage += damage
+        self.cycles += cycles.count.size
+        self.overload_cycles += overload
+        return damage
+
+    def consume(self, source, chunk_size=CHUNK_SIZE):
+        """Feed a whole source, an array (sliced into chunks of chunk_size samples,
+        so memory-mapped arrays are read chunk by chunk) or an iterable of chunks
+        (e.g. a generator reading a data acquisition stream)
+
+        :param np.ndarray or iterable source: The stress history [MPa]
+        :param int chunk_size: Number of samples read at once from an array
+
+        :returns: The current damage
+        :rtype: float
+        """
+        for chunk in _iter_chunks(source, chunk_size):
+            self.update(chunk)
+        return self.damage
+
+    def consume_file(self, path, dtype=float, offset=0, chunk_size=CHUNK_SIZE):
+        """Feed a history stored in a file, memory-mapped and read chunk by chunk,
+        .npy files are read with their header, other files as raw binary samples
+
+        :param str path: The file path
+        :param dtype: The samples data type (of raw binary files)
+        :param int offset: Bytes to skip at the beginning of raw binary files (e.g. a header)
+        :param int chunk_size: Number of samples read at once
+
+        :returns: The current damage
+        :rtype: float
+        """
+        if os.fspath(path).endswith('.npy'):
+            series = np.load(path, mmap_mode='r')
+        elif os.path.getsize(path) <= offset:
+            # np.memmap can't map an empty file
+            series = np.empty(0, dtype=dtype)
+        else:
+            series = np.memmap(path, dtype=dtype, mode='r', offset=offset)
+        return self.consume(series.reshape(-1), chunk_size)
+
+    @property
+    def residual_damage(self):
+        """The damage of the residual (unclosed) half cycles of the history so far
+
+        :rtype: float
+        """
+        return self._damage(self.counter.residual())[0]
+
+    @property
+    def damage(self):
+        """The current damage (closed cycles and residual half cycles),
+        failure is expected when the damage reaches 1
+
+        :rtype: float
+        """
+        return self.closed_damage + self.residual_damage
+
+    @property
+    def life(self):
+        """The number of repetitions of the history so far until failure
+
+        :rtype: float
+        """
+        damage = self.damage
+        return 1 / damage if damage > 0 else inf
+
+    @property
+    def remaining_life(self):
+        """The remaining life (until the damage reaches 1) if the loading continues
+        at the same damage rate, in seconds if the sample rate was given otherwise in samples
+
+        :rtype: float
+        """
+        damage = self.damage
+        if damage <= 0:
+            return inf
+        remaining = max(1 - damage, 0) / damage * self.samples
+        return remaining if self.sample_rate is None else remaining / self.sample_rate
+
+    def reset(self):
+        """Forget the history fed so far"""
+        self.counter = RainflowCounter()
+        self.closed_damage = 0.0
+        self.cycles = 0
+        self.overload_cycles = 0
+
+    def _damage(self, cycles):
+        """Miner's rule damage of counted cycles and the number of cycles failing at once
+        (above the S-N curve range, their damage is infinite)
+        """
+        if cycles.count.size == 0:
+            return 0.0, 0
+        result = FatigueAnalysis.miner_rule_batch(
+            stress_groups(cycles), self.Sut, self.Se, self.Sy, self.z, alt_mean=True, warn=False,
+            mean_stress_correction=self.mean_stress_correction)
+        overload = (result.life == 0) & (cycles.count > 0)
+        return float(np.sum(result.damage)), int(np.count_nonzero(overload))
+
+
+def _iter_chunks(source, chunk_size):
+    """Yields the chunks of an array or of an iterable of chunks"""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    if isinstance(source, np.ndarray):
+        source = source.reshape(-1)
+        for start in range(0, source.size, chunk_size):
+            yield source[start:start + chunk_size]
+    else:
+        for chunk in source:
+            yield chunk
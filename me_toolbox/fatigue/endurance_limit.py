@@ -1,6 +1,34 @@
 """module containing the EnduranceLimit class"""
+from collections import namedtuple
 from math import sqrt
 
+import numpy as np
+
+# surface condition factor coefficients (a, b) and load factors
+_SURFACE_DATA = {'ground': (1.58, -0.085),
+                 'machined': (4.51, -0.265),
+                 'cold-drawn': (4.51, -0.265),
+                 'hot-rolled': (57.7, -0.718),
+                 'as forged': (272, -0.995)}
+_LOAD_DATA = {'bending': 1, 'axial': 0.85, 'torsion': 0.59, 'shear': 0.59, 'multiple': 1}
+
+# the categorical inputs, the batch API takes their index in these tuples as integer codes
+# (see EnduranceLimit.encode_surface_finish and EnduranceLimit.encode_stress_type)
+SURFACE_FINISHES = tuple(_SURFACE_DATA)
+STRESS_TYPES = tuple(_LOAD_DATA)
+_SURFACE_COEFFICIENTS = np.array(list(_SURFACE_DATA.values()))
+_LOAD_FACTORS = np.array(list(_LOAD_DATA.values()), dtype=float)
+
+# temperature [°C] and reliability [%] tables
+_TEMPERATURES = np.array([20, 50, 100, 150, 200, 250, 300, 350, 400, 450, 500, 550, 600])
+_TEMPERATURE_FACTORS = np.array([1, 1.01, 1.02, 1.025, 1.02, 1, 0.975, 0.943, 0.9, 0.843,
+                                 0.768, 0.672, 0.549])
+_RELIABILITIES = np.array([50, 90, 95, 99, 99.9, 99.99, 99.999, 99.9999])
+_RELIABILITY_FACTORS = np.array([1, 0.897, 0.868, 0.814, 0.753, 0.702, 0.659, 0.620])
+
+# the result of EnduranceLimit.marin_factors_batch
+MarinFactors = namedtuple('MarinFactors', ['Ka', 'Kb', 'Kc', 'Kd', 'Ke', 'Kf', 'modified'])
+
 
 class EnduranceLimit:
     """calculates Marin modification factors and return modified endurance limit"""
@@ -64,12 +92,7 @@ class EnduranceLimit:
     def Ka(self):
         """Returns Surface condition modification factor"""
 
-        data = {'ground': (1.58, -0.085),
-                'machined': (4.51, -0.265),
-                'cold-drawn': (4.51, -0.265),
-                'hot-rolled': (57.7, -0.718),
-                'as forged': (272, -0.995)}
-        a, b = data[self.surface_finish]
+        a, b = _SURFACE_DATA[self.surface_finish]
         return a * (self.Sut ** b)
 
     @property
@@ -93,8 +116,7 @@ class EnduranceLimit:
     @property
     def Kc(self):
         """Returns load modification factor"""
-        types = {'bending': 1, 'axial': 0.85, 'torsion': 0.59, 'shear': 0.59, 'multiple': 1}
-        return types[self.stress_type]
+        return _LOAD_DATA[self.stress_type]
 
     @property
     def Kd(self):
@@ -104,11 +126,7 @@ class EnduranceLimit:
     @staticmethod
     def calc_kd(temp):
         """Calculate temperature modification factor"""
-        import numpy as np
-        percentage = np.array([20, 50, 100, 150, 200, 250, 300, 350, 400, 450, 500, 550, 600])
-        reliability_factors = np.array([1, 1.01, 1.02, 1.025, 1.02, 1, 0.975, 0.943, 0.9, 0.843,
-                                        0.768, 0.672, 0.549])
-        return np.interp(temp, percentage, reliability_factors)
+        return np.interp(temp, _TEMPERATURES, _TEMPERATURE_FACTORS)
 
     @property
     def Ke(self):
@@ -118,10 +136,7 @@ class EnduranceLimit:
     @staticmethod
     def calc_ke(reliability):
         """Calculates reliability factor"""
-        import numpy as np
-        percentage = np.array([50, 90, 95, 99, 99.9, 99.99, 99.999, 99.9999])
-        reliability_factors = np.array([1, 0.897, 0.868, 0.814, 0.753, 0.702, 0.659, 0.620])
-        return np.interp(reliability, percentage, reliability_factors)
+        return np.interp(reliability, _RELIABILITIES, _RELIABILITY_FACTORS)
 
     @property
     def Kf(self):
@@ -166,3 +181,115 @@ class EnduranceLimit:
                   f"factor_Ks={self.Kd:.3f}, Ke={self.Ke:.3f}, Kf={self.Kf:.3f}")
 
         return self.Ka, self.Kb, self.Kc, self.Kd, self.Ke, self.Kf
+
+    @staticmethod
+    def encode_surface_finish(surface_finish):
+        """Returns the integer codes of surface finishes (their index in SURFACE_FINISHES)
+
+        :param str or np.ndarray surface_finish: 'ground' / 'machined' / 'cold-drawn' /
+            'hot-rolled' / 'as forged'
+
+        :rtype: np.ndarray
+        :raises KeyError: if a surface finish is unknown
+        """
+        return _encode(surface_finish, SURFACE_FINISHES, 'surface finish')
+
+    @staticmethod
+    def encode_stress_type(stress_type):
+        """Returns the integer codes of stress types (their index in STRESS_TYPES)
+
+        :param str or np.ndarray stress_type: 'bending' / 'axial' / 'torsion' / 'shear' /
+            'multiple'
+
+        :rtype: np.ndarray
+        :raises KeyError: if a stress type is unknown
+        """
+        return _encode(stress_type, STRESS_TYPES, 'stress type')
+
+    @staticmethod
+    def marin_factors_batch(unmodified_Se, Sut, surface_finish, rotating, max_normal_stress,
+                            max_bending_stress, stress_type, temp, reliability,
+                            A95=None, diameter=None, height=None, width=None):
+        """Vectorized Marin factors and modified endurance limit for arrays of designs
+        (all the arguments are broadcast together, see :meth:`__init__`)
+
+        Note: the categorical arguments may be given as integer codes
+        (see :meth:`encode_surface_finish` and :meth:`encode_stress_type`) to encode
+        them only once in a design sweep
+
+        :param np.ndarray unmodified_Se: The unmodified endurance strength
+        :param np.ndarray Sut: Ultimate tensile strength
+        :param np.ndarray surface_finish: Surface finish names or codes
+        :param np.ndarray rotating: rotating mode (True/False)
+        :param np.ndarray max_normal_stress: (for axial loading check)
+        :param np.ndarray max_bending_stress: (for axial loading check)
+        :param np.ndarray stress_type: Stress type names or codes
+        :param np.ndarray temp: temperature
+        :param np.ndarray reliability: reliability
+        :param np.ndarray A95: Area containing over 95% of maximum periodic stress
+            in the cross-section
+        :param np.ndarray diameter: diameter (nan for a non round cross-section)
+        :param np.ndarray height: height (of the non round cross-sections)
+        :param np.ndarray width: width (of the non round cross-sections)
+
+        :returns: The Marin factors (Kb is nan where the size is out of the factor's range)
+            and the modified endurance limit
+        :rtype: MarinFactors
+        """
+        surface_code = _encode(surface_finish, SURFACE_FINISHES, 'surface finish')
+        load_code = _encode(stress_type, STRESS_TYPES, 'stress type')
+
+        Sut = np.asarray(Sut, dtype=float)
+        a, b = _SURFACE_COEFFICIENTS[surface_code].T
+        Ka = a * Sut ** b
+
+        diameter = np.nan if diameter is None else np.asarray(diameter, dtype=float)
+        if A95 is None:
+            not_round = np.isnan(diameter)
+            if width is not None and height is not None:
+                rectangular = 0.05 * np.asarray(width, dtype=float) * \
+                    np.asarray(height, dtype=float)
+            elif np.any(not_round):
+                raise ValueError('A95 is None and no parameters (diameter/width/height)'
+                                 'were given in order to calculate it')
+            else:
+                rectangular = np.nan
+            # round cross-sections use the diameter, the others (nan diameter) width * height
+            with np.errstate(invalid='ignore'):
+                A95 = np.where(not_round, rectangular, 0.01046 * diameter ** 2)
+
+        # rotating and round uses the diameter, not rotating or not round uses A95
+        round_rotating = np.asarray(rotating, dtype=bool) & ~np.isnan(diameter)
+        with np.errstate(invalid='ignore'):
+            de = np.where(round_rotating, diameter, np.sqrt(np.asarray(A95) / 0.07658))
+            Kb = np.select([(2.79 <= de) & (de <= 51), (51 < de) & (de <= 254)],
+                           [1.24 * de ** -0.107, 1.51 * de ** -0.157], np.nan)
+        # if axial loading accrue
+        axial = np.asarray(max_normal_stress) > 0.85 * np.asarray(max_bending_stress)
+        Kb = np.where(axial, 1.0, Kb)
+
+        Kc = _LOAD_FACTORS[load_code]
+        Kd = EnduranceLimit.calc_kd(temp)
+        Ke = EnduranceLimit.calc_ke(reliability)
+        Kf = 1
+
+        Ka, Kb, Kc, Kd, Ke = np.broadcast_arrays(Ka, Kb, Kc, Kd, Ke)
+        modified = Ka * Kb * Kc * Kd * Ke * Kf * np.asarray(unmodified_Se, dtype=float)
+        return MarinFactors(Ka, Kb, Kc, Kd, Ke, np.ones(Ka.shape), modified)
+
+
+def _encode(values, categories, name):
+    """Encode categorical values (or validate integer codes) as their index in categories"""
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        if values.size and (values.min() < 0 or values.max() >= len(categories)):
+            raise KeyError(f"unknown {name} code, the codes are 0 to {len(categories) - 1}")
+        return values.astype(np.intp)
+
+    names, inverse = np.unique(values.astype(str), return_inverse=True)
+    try:
+        codes = np.array([categories.index(value) for value in names.tolist()], dtype=np.intp)
+    except ValueError:
+        unknown = sorted(set(names.tolist()) - set(categories))
+        raise KeyError(f"unknown {name} {unknown[0]!r}, the options are {categories}")
+    return codes[inverse].reshape(values.shape)
@@ -2,7 +2,20 @@
 containing the Failure criteria as described in
 Shigley's Mechanical Engineering design
 """
-from sympy import sqrt
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from me_toolbox.tools.math_backend import sqrt
+
+# number of Haigh diagram grids kept by FailureCriteria.haigh_diagram
+HAIGH_CACHE_SIZE = 32
+
+# the result of FailureCriteria.haigh_diagram, (mean, alt) grids and the safety factor of
+# every criterion on the grid
+HaighDiagram = namedtuple('HaighDiagram', ['mean', 'alt', 'modified_goodman', 'soderberg',
+                                           'gerber', 'asme_elliptic', 'langer'])
 
 
 class FailureCriteria:
@@ -22,7 +35,8 @@ class FailureCriteria:
         if mean_eq_stress < 0:
             raise ValueError("Not valid when the mean equivalent stress is negative")
 
-        return 1 / ((alt_eq_stress / endurance_limit) + (mean_eq_stress / ultimate_strength))
+        return _modified_goodman(ultimate_strength, endurance_limit, alt_eq_stress,
+                                 mean_eq_stress)
 
     @staticmethod
     def soderberg(yield_strength, endurance_limit, alt_eq_stress, mean_eq_stress):
@@ -37,7 +51,7 @@ class FailureCriteria:
         if mean_eq_stress < 0:
             raise ValueError("Not valid when the mean equivalent stress is negative")
 
-        return 1 / ((alt_eq_stress / endurance_limit) + (mean_eq_stress / yield_strength))
+        return _soderberg(yield_strength, endurance_limit, alt_eq_stress, mean_eq_stress)
 
     @staticmethod
     def gerber(ultimate_strength, endurance_limit, alt_eq_stress, mean_eq_stress):
@@ -51,9 +65,7 @@ class FailureCriteria:
         if mean_eq_stress < 0:
             raise ValueError("Not valid when the mean equivalent stress is negative")
 
-        alpha = ultimate_strength / mean_eq_stress
-        beta = alt_eq_stress / endurance_limit
-        return 0.5 * alpha ** 2 * beta * (-1 + sqrt(1 + 4 * alpha ** (-2) * beta ** (-2)))
+        return _gerber(ultimate_strength, endurance_limit, alt_eq_stress, mean_eq_stress)
 
     @staticmethod
     def asme_elliptic(yield_strength, endurance_limit, alt_eq_stress,
@@ -68,8 +80,7 @@ class FailureCriteria:
         if mean_eq_stress < 0:
             raise ValueError("Not valid when the mean equivalent stress is negative")
 
-        return sqrt(1 / ((alt_eq_stress / endurance_limit) ** 2 + (
-                mean_eq_stress / yield_strength) ** 2))
+        return _asme_elliptic(yield_strength, endurance_limit, alt_eq_stress, mean_eq_stress)
 
     @staticmethod
     def langer_static_yield(yield_strength, alt_eq_stress, mean_eq_stress):
@@ -109,19 +120,10 @@ class FailureCriteria:
 
         if mean_eq_stress > 0:
             # stress is in the first quadrant of the alternating-mean stress plan
-            args = (endurance_limit, alt_eq_stress, mean_eq_stress)
-            safety_factors = {
-                'modified goodman': FailureCriteria.modified_goodman(ultimate_strength, *args),
-                'soderberg': FailureCriteria.soderberg(yield_strength, *args),
-                'gerber': FailureCriteria.gerber(ultimate_strength, *args),
-                'asme-elliptic': FailureCriteria.asme_elliptic(yield_strength, *args)}
-            try:
-                fatigue_safety_factor = safety_factors[criterion.lower()]
-
-            except KeyError:
-                raise Exception(f"Unknown criterion - {criterion}\n"
-                                f"Available criteria are: 'Modified Goodman', 'Soderberg',"
-                                f"'Gerber', 'ASME-elliptic'")
+            criterion_function, strength = FailureCriteria._get_criterion(
+                criterion, yield_strength, ultimate_strength)
+            fatigue_safety_factor = criterion_function(strength, endurance_limit,
+                                                       alt_eq_stress, mean_eq_stress)
 
         else:
             # stress is in the second quadrant of the alternating-mean stress plan
@@ -138,3 +140,146 @@ class FailureCriteria:
                   f"the Langer static safety factor is: {static_safety_factor}")
 
         return fatigue_safety_factor, static_safety_factor
+
+    @staticmethod
+    def get_safety_factors_batch(yield_strength, ultimate_strength, endurance_limit,
+                                 alt_eq_stress, mean_eq_stress, criterion):
+        """Vectorized version of :meth:`get_safety_factors` for arrays of stress states
+        (and/or material properties), only the requested criterion is calculated
+        and the quadrant of every stress state is handled by masks
+
+        :param str criterion: The criterion to use
+        :param float or np.ndarray yield_strength: The yield strength (Sy or Ssy)
+        :param float or np.ndarray ultimate_strength: The yield strength (Sut or Ssu)
+        :param float or np.ndarray endurance_limit: Modified endurance limit (Se)
+        :param np.ndarray alt_eq_stress: alternating stresses
+        :param np.ndarray mean_eq_stress: mean stresses
+
+        :returns: dynamic and static safety factors arrays
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        Sy, Sut, Se, alt, mean = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in
+              (yield_strength, ultimate_strength, endurance_limit, alt_eq_stress,
+               mean_eq_stress)))
+        criterion_function, strength = FailureCriteria._get_criterion(
+            criterion, Sy, Sut, array=True)
+
+        first_quadrant = mean > 0
+        fatigue_safety_factor = np.empty(alt.shape)
+        static_safety_factor = np.empty(alt.shape)
+        with np.errstate(divide='ignore'):
+            # first quadrant of the alternating-mean stress plan - the chosen criterion
+            fatigue_safety_factor[first_quadrant] = criterion_function(
+                strength[first_quadrant], Se[first_quadrant], alt[first_quadrant],
+                mean[first_quadrant])
+            # second quadrant - the alternative calculation
+            second_quadrant = ~first_quadrant
+            fatigue_safety_factor[second_quadrant] = Se[second_quadrant] / alt[second_quadrant]
+
+            # Langer static safety factor (alt + |mean|)
+            np.divide(Sy, alt + np.abs(mean), out=static_safety_factor)
+
+        return fatigue_safety_factor, static_safety_factor
+
+    @staticmethod
+    def haigh_diagram(yield_strength, ultimate_strength, endurance_limit, mean_stress,
+                      alt_stress):
+        """Safety factors of every criterion and of Langer on a grid of the
+        alternating-mean stress plane (Haigh diagram), for contour plots:
+
+        .. code-block:: python
+
+            diagram = FailureCriteria.haigh_diagram(Sy, Sut, Se, np.linspace(-400, 600, 501),
+                                                    np.linspace(0, 400, 201))
+            plt.contourf(diagram.mean, diagram.alt, diagram.modified_goodman)
+
+        Note: in the second quadrant (negative mean stress) the fatigue safety factor is
+        Se / alt for all the criteria (see :meth:`get_safety_factors`)
+
+        Note: the grids of recently used materials and grid axes are cached,
+        the returned arrays are read-only
+
+        :param float yield_strength: The yield strength (Sy or Ssy)
+        :param float ultimate_strength: The yield strength (Sut or Ssu)
+        :param float endurance_limit: Modified endurance limit (Se)
+        :param np.ndarray mean_stress: The mean stress axis of the grid
+        :param np.ndarray alt_stress: The alternating stress axis of the grid
+
+        :returns: The (len(alt_stress), len(mean_stress)) mean and alternating stress grids
+            and the safety factors on the grid
+        :rtype: HaighDiagram
+        """
+        mean_stress = np.ascontiguousarray(mean_stress, dtype=float).reshape(-1)
+        alt_stress = np.ascontiguousarray(alt_stress, dtype=float).reshape(-1)
+        return _haigh_diagram(float(yield_strength), float(ultimate_strength),
+                              float(endurance_limit), mean_stress.tobytes(), alt_stress.tobytes())
+
+    @staticmethod
+    def _get_criterion(criterion, yield_strength, ultimate_strength, array=False):
+        """Returns the criterion function and the strength it uses
+
+        :param bool array: Return the array version of the criterion function
+        :raises Exception: if the criterion is unknown
+        """
+        criteria = {
+            'modified goodman': (_modified_goodman if array else FailureCriteria.modified_goodman,
+                                 ultimate_strength),
+            'soderberg': (_soderberg if array else FailureCriteria.soderberg, yield_strength),
+            'gerber': (_gerber if array else FailureCriteria.gerber, ultimate_strength),
+            'asme-elliptic': (_asme_elliptic if array else FailureCriteria.asme_elliptic,
+                              yield_strength)}
+        try:
+            return criteria[criterion.lower()]
+        except KeyError:
+            raise Exception(f"Unknown criterion - {criterion}\n"
+                            f"Available criteria are: 'Modified Goodman', 'Soderberg',"
+                            f"'Gerber', 'ASME-elliptic'")
+
+
+@lru_cache(maxsize=HAIGH_CACHE_SIZE)
+def _haigh_diagram(Sy, Sut, Se, mean_bytes, alt_bytes):
+    """:meth:`FailureCriteria.haigh_diagram` keyed by hashable arguments (the grid axes bytes)"""
+    mean, alt = np.meshgrid(np.frombuffer(mean_bytes), np.frombuffer(alt_bytes))
+    first_quadrant = mean > 0
+    # the mean stress is only used in the first quadrant, 1 elsewhere avoids dividing by 0
+    positive_mean = np.where(first_quadrant, mean, 1.0)
+
+    # only σa = 0 divides by 0 (an infinite safety factor), invalid values aren't expected
+    with np.errstate(divide='ignore'):
+        second_quadrant = Se / alt
+        factors = {'langer': Sy / (alt + np.abs(mean))}
+        for name, criterion, strength in (('modified_goodman', _modified_goodman, Sut),
+                                          ('soderberg', _soderberg, Sy),
+                                          ('gerber', _gerber, Sut),
+                                          ('asme_elliptic', _asme_elliptic, Sy)):
+            factors[name] = np.where(first_quadrant,
+                                     criterion(strength, Se, alt, positive_mean),
+                                     second_quadrant)
+
+    for array in (mean, alt, *factors.values()):
+        array.setflags(write=False)
+    return HaighDiagram(mean=mean, alt=alt, **factors)
+
+
+# the criteria of numbers, arrays and symbolic expressions (in symbolic mode),
+# without checking the mean stress (used as is by the array versions of the criteria)
+def _modified_goodman(ultimate_strength, endurance_limit, alt_eq_stress, mean_eq_stress):
+    return 1 / ((alt_eq_stress / endurance_limit) + (mean_eq_stress / ultimate_strength))
+
+
+def _soderberg(yield_strength, endurance_limit, alt_eq_stress, mean_eq_stress):
+    return 1 / ((alt_eq_stress / endurance_limit) + (mean_eq_stress / yield_strength))
+
+
+def _gerber(ultimate_strength, endurance_limit, alt_eq_stress, mean_eq_stress):
+    # n = 0.5 * (Sut/σm)² * (σa/Se) * (-1 + sqrt(1 + 4 * (σm*Se / (Sut*σa))²)) multiplied by
+    # its conjugate, which is finite for σa = 0
+    alt_ratio = alt_eq_stress / endurance_limit
+    mean_ratio = mean_eq_stress / ultimate_strength
+    return 2 / (alt_ratio + sqrt(alt_ratio ** 2 + 4 * mean_ratio ** 2))
+
+
+def _asme_elliptic(yield_strength, endurance_limit, alt_eq_stress, mean_eq_stress):
+    return sqrt(1 / ((alt_eq_stress / endurance_limit) ** 2 +
+                     (mean_eq_stress / yield_strength) ** 2))
@@ -1,13 +1,23 @@
 """module containing the FatigueAnalysis class and
 calc_kf for calculating dynamic stress concentration factor
 """
-from math import log10, inf
-from sympy import sqrt
+from collections import namedtuple
+from math import inf
+
+import numpy as np
 
 from me_toolbox.tools import print_atributes
+from me_toolbox.tools.math_backend import sqrt
 from me_toolbox.fatigue import FailureCriteria
+from me_toolbox.fatigue.mean_stress import MeanStressCorrection
+from me_toolbox.fatigue.sn_curve import calc_Sm, calc_Sm_batch, get_sn_curve
+
+# number of samples of stress histories evaluated at once by iter_eq_stress_history
+CHUNK_SIZE = 2 ** 20
+
+# the result of FatigueAnalysis.miner_rule_batch
+MinerResult = namedtuple('MinerResult', ['total_life', 'damage', 'life', 'reversible_stress'])
 
-from icecream import ic
 
 class FatigueAnalysis:
     """Perform fatigue analysis"""
@@ -134,6 +144,94 @@ class FatigueAnalysis:
         elif self.stress_type == 'torsion' or self.stress_type == 'shear':
             return Kf_torsion * self.mean_torsion_stress
 
+    @staticmethod
+    def calc_eq_stress_history(stress_type, Kf_bending=0, Kf_normal=0, Kf_torsion=0,
+                               bending_stress=0, normal_stress=0, torsion_stress=0):
+        """Returns the equivalent stress history of synchronized stress channels
+        with the Kf corrections of :meth:`calc_alt_eq_stress`, for 'multiple' stresses
+        it's the signed von Mises stress (the sign of the corrected normal stress,
+        or of the torsion stress where there is no normal stress) so the reversals
+        are kept for cycle counting
+
+        Note: the Kf factors are applied to the whole history (the history isn't split
+        into alternating and mean components before the cycle counting)
+
+        :param str stress_type: Type of stress loading (bending', 'axial', 'torsion', 'shear',
+            'multiple')
+        :param float Kf_bending: dynamic stress concentration factor for bending
+        :param float Kf_normal: dynamic stress concentration factor for normal
+        :param float Kf_torsion: dynamic stress concentration factor for torsion
+        :param np.ndarray bending_stress: Bending stress history
+        :param np.ndarray normal_stress: Normal stress history
+        :param np.ndarray torsion_stress: Torsion stress history
+
+        :returns: Equivalent stress history
+        :rtype: np.ndarray
+        """
+        if stress_type == 'multiple':
+            corrected_normal = (Kf_bending * np.asarray(bending_stress, dtype=float) +
+                                Kf_normal * (np.asarray(normal_stress, dtype=float) / 0.85))
+            corrected_torsion = Kf_torsion * np.asarray(torsion_stress, dtype=float)
+            von_mises = np.hypot(corrected_normal, sqrt(3) * corrected_torsion)
+            return np.copysign(von_mises, np.where(corrected_normal != 0, corrected_normal,
+                                                   corrected_torsion))
+
+        elif stress_type == 'bending':
+            return Kf_bending * np.asarray(bending_stress, dtype=float)
+
+        elif stress_type == 'axial':
+            return Kf_normal * np.asarray(normal_stress, dtype=float)
+
+        elif stress_type == 'torsion' or stress_type == 'shear':
+            return Kf_torsion * np.asarray(torsion_stress, dtype=float)
+
+        raise ValueError(f"Unknown stress type - {stress_type}")
+
+    def eq_stress_history(self, bending_stress=0, normal_stress=0, torsion_stress=0):
+        """Returns the equivalent stress history of synchronized stress channels with this
+        analysis stress type and Kf factors (see :meth:`calc_eq_stress_history`)
+
+        :param np.ndarray bending_stress: Bending stress history
+        :param np.ndarray normal_stress: Normal stress history
+        :param np.ndarray torsion_stress: Torsion stress history
+
+        :returns: Equivalent stress history
+        :rtype: np.ndarray
+        """
+        return self.calc_eq_stress_history(self.stress_type, self.Kf_bending, self.Kf_normal,
+                                           self.Kf_torsion, bending_stress, normal_stress,
+                                           torsion_stress)
+
+    def iter_eq_stress_history(self, bending_stress=0, normal_stress=0, torsion_stress=0,
+                               chunk_size=CHUNK_SIZE):
+        """Yields the equivalent stress history in chunks, for records too long to be held in
+        memory (e.g. memory-mapped channels), the chunks can be fed directly to cycle counting:
+
+        .. code-block:: python
+
+            accumulator = DamageAccumulator(Sut=analysis.Sut, Se=analysis.Se, Sy=analysis.Sy)
+            accumulator.consume(analysis.iter_eq_stress_history(bending, normal, torsion))
+
+        :param np.ndarray bending_stress: Bending stress history
+        :param np.ndarray normal_stress: Normal stress history
+        :param np.ndarray torsion_stress: Torsion stress history
+        :param int chunk_size: Number of samples evaluated at once
+
+        :returns: Equivalent stress history chunks
+        :rtype: Iterator[np.ndarray]
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+        channels = [channel if isinstance(channel, np.ndarray) else np.asarray(channel)
+                    for channel in (bending_stress, normal_stress, torsion_stress)]
+        channels = [channel.reshape(-1) if channel.ndim else channel for channel in channels]
+        size = np.broadcast_shapes(*(channel.shape for channel in channels))
+        size = size[0] if size else 1
+
+        for start in range(0, size, chunk_size):
+            yield self.eq_stress_history(*(channel[start:start + chunk_size] if channel.ndim
+                                           else channel for channel in channels))
+
     @property
     def shear_ultimate_strength(self):
         """Returns shear_ultimate_strength which is the
@@ -151,7 +249,7 @@ class FatigueAnalysis:
         :returns: shear_yield_strength - yield stress for shear
         :type: float
         """
-        return self.Sy / sqrt(3).evalf()
+        return self.Sy / sqrt(3)
 
     @property
     def modified_goodman(self):
@@ -303,24 +401,9 @@ class FatigueAnalysis:
         :rtype: float
         """
 
-        def f(x):
-            """ f - fatigue strength fraction
-                function constructed from curve fitting to the f graph in Shigley's
-                the range of the fit is ( 70[kPsi] < ultimate_tensile_strength < 200[kPsi] ) """
-            return (-2.56710686e-16 * x ** 5 + 1.35729780e-12 * x ** 4 - 2.92474777e-09 * x ** 3 +
-                    3.28990748e-06 * x ** 2 - 2.04929617e-03 * x + 1.38405394e+00)
-
-        if Sut < 482.633:  # 482.633[Mpa] = 70[kPsi]
-            # print(f"Note: ultimate_tensile_strength={Sut} < 482.633[Mpa] (70[kPsi]) so f~0.9")
-            return 0.9 * Sut
-        elif Sut > 1378.95:
-            # print(
-            #     f"Note: ultimate_tensile_strength={Sut} > 1378.95[Mpa] (200[kPsi]) which is out of "
-            #     f"the graph range, f={f(Sut)}")
-            return  0.75 * Sut
-        return f(Sut) * Sut
-
-    def num_of_cycles(self, z=-3):
+        return calc_Sm(Sut)
+
+    def num_of_cycles(self, z=-3, mean_stress_correction='goodman'):
         """Returns the number of cycles until failure
 
         Note: zeta = log(N1) - log(N2)
@@ -329,16 +412,20 @@ class FatigueAnalysis:
 
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8,
             -5.69 for metal where N=5e8
+        :param str or callable mean_stress_correction: The mean stress correction
+            (see :class:`MeanStressCorrection`)
 
         :returns: The Number of cycles and the fatigue stress at failure
         :rtype: tuple[float, float]
         """
         return self.calc_num_of_cycles(self.mean_eq_stress, self.alt_eq_stress, self.Se, self.Sut,
-                                       self.Sy, z=-3)
+                                       self.Sy, z=-3,
+                                       mean_stress_correction=mean_stress_correction)
 
     @staticmethod
     def calc_num_of_cycles(mean_eq_stress, alt_eq_stress, endurance_limit,
-                           ultimate_tensile_strength, yield_strength, z=-3):
+                           ultimate_tensile_strength, yield_strength, z=-3,
+                           mean_stress_correction='goodman'):
         """ calculate number of cycles until failure
 
         Note: zeta = log(N1) - log(N2)
@@ -352,52 +439,80 @@ class FatigueAnalysis:
         :param yield_strength: Yield Strength
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8,
             -5.69 for metal where N=5e8
+        :param str or callable mean_stress_correction: The mean stress correction
+            (see :class:`MeanStressCorrection`), the default Goodman correction is
+            σa / (1 - σm/Sut)
 
         :returns: The Number of cycles and the fatigue stress at failure
         :rtype: tuple[float, float] or tuple[float, None]
         """
-        mean_stress = mean_eq_stress
-        alternating_stress = alt_eq_stress
-        Se = endurance_limit
         Sut = ultimate_tensile_strength
-        Sy = yield_strength
-        Sm = FatigueAnalysis.calc_Sm(Sut)
+        curve = get_sn_curve(Sut, endurance_limit, yield_strength, z)
 
-        # if mean_stress is larger or equal to Sut then the reversible_stress is either negative or
-        # undefined because of a division by zero error
-        if mean_stress >= Sut:
+        # calculating the reversible stress (σ_rev)
+        reversible_stress = MeanStressCorrection.reversible_stress(
+            alt_eq_stress, mean_eq_stress, Sut, yield_strength, mean_stress_correction)
+
+        # if the mean stress is larger or equal to the strength of the correction
+        # (e.g. Sut for Goodman) the reversible stress is infinite and it fails at once
+        if reversible_stress == inf:
             return 0, None
 
-        # calculating the reversible stress (σ_rev)
-        if mean_stress >= 0:
-            reversible_stress = alternating_stress / (1 - (mean_stress / Sut))
-        else:
-            reversible_stress = alternating_stress
+        N = curve.life(reversible_stress)
+        if N == 0 or N == inf:
+            return N, None
+        return N, curve.strength(N)
 
+    @staticmethod
+    def calc_Sm_batch(Sut):
+        """Vectorized version of :meth:`calc_Sm`
 
-        # Low Cycle Fatigue
-        if Sm < reversible_stress < Sy:
-            if z != -3:
-                raise ValueError(f"Number of cycles calculation for low cycle fatigue"
-                                 f" is only possible for zeta=-3")
+        :param np.ndarray Sut: Ultimate tensile strengths
 
-            a = Sut
-            b = (1 / z) * log10(Sut / Sm)
+        :returns: Sm_stress stresses
+        :rtype: np.ndarray
+        """
+        return calc_Sm_batch(Sut)
 
-        # High Cycle Fatigue
-        elif Se < reversible_stress < Sm:
-            a = Sm * (Sm / Se) ** (-3 / z)
-            b = (1 / z) * log10(Sm / Se)
+    @staticmethod
+    def calc_num_of_cycles_batch(mean_eq_stress, alt_eq_stress, endurance_limit,
+                                 ultimate_tensile_strength, yield_strength=None, z=-3,
+                                 mean_stress_correction='goodman'):
+        """Vectorized version of :meth:`calc_num_of_cycles` for arrays of stress states
+        (and/or material properties, all the arguments are broadcast together)
+
+        Note: if yield_strength is None only HCF is checked (stresses above Sm fail at once)
+
+        :param np.ndarray mean_eq_stress: Mean equivalent stresses
+        :param np.ndarray alt_eq_stress: Alternating equivalent stresses
+        :param np.ndarray endurance_limit: Endurance limit
+        :param np.ndarray ultimate_tensile_strength: Ultimate tensile strength
+        :param np.ndarray or None yield_strength: Yield Strength
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8,
+            -5.69 for metal where N=5e8
+        :param str or callable mean_stress_correction: The mean stress correction
+            (see :class:`MeanStressCorrection`)
 
-        elif reversible_stress < Se:
-            return inf, None  # inf is from math module - short for infinity
-        else:
-            return  0, None
-        N = (reversible_stress / a) ** (1 / b)
-        return N, a * N ** b
+        :returns: The Number of cycles and the fatigue stress at failure (nan where
+            calc_num_of_cycles returns None)
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        mean_stress, alternating_stress, Sut = np.broadcast_arrays(
+            *(np.asarray(value, dtype=float) for value in
+              (mean_eq_stress, alt_eq_stress, ultimate_tensile_strength)))
+        curve = get_sn_curve(ultimate_tensile_strength, endurance_limit, yield_strength, z)
+
+        # calculating the reversible stress (σ_rev), a mean stress at or above the strength
+        # of the correction fails at once (infinite reversible stress, zero life)
+        reversible_stress = MeanStressCorrection.reversible_stress(
+            alternating_stress, mean_stress, Sut, yield_strength, mean_stress_correction)
+        N = curve.life(reversible_stress)
+        finite = (N > 0) & (N < np.inf)
+        Sf = np.where(finite, curve.strength(np.where(finite, N, curve.endurance_life)), np.nan)
+        return N, Sf
 
     def miner_rule(self, stress_groups, Sut, Se, Sy=None, z=-3, verbose=False,
-                   alt_mean=False, freq=False):
+                   alt_mean=False, freq=False, mean_stress_correction='goodman'):
         """ Calculates total number of cycles for multiple periodic loads,
         the stress_groups format is as follows:
         [number_of_repetitions, maximum_stress, minimum_stress]
@@ -406,7 +521,11 @@ class FatigueAnalysis:
 
         Note: if the material don't have fatigue limit use the fatigue strength at Se=Sf(N=1e8)
 
-        :param list stress_groups: list containing the pick stresses and number of repetition
+        Note: the stress groups aren't modified (see :meth:`miner_rule_batch` for the per group
+        results)
+
+        :param list or np.ndarray stress_groups: list containing the pick stresses and number of
+            repetition
         :param float Sut: Ultimate tensile strength [MPa]
         :param float Sy: yield strength [MPa], if None only HCF is checked
         :param float Se: endurance limit [MPa]
@@ -420,67 +539,101 @@ class FatigueAnalysis:
             alternating and mean stresses: [number_of_repetitions, alternating_stress, mean_stress]
             instead of the max and min stresses:
             [number_of_repetitions, maximum_stress, minimum_stress]
+        :param str or callable mean_stress_correction: The mean stress correction
+            (see :class:`MeanStressCorrection`)
 
         :returns: Total number of cycles
         :rtype: float
         """
-
-        Sm = self.calc_Sm(Sut)
-        for group in stress_groups:
-
-            # if the stress given are minimum and maximum instead of alternating and mean
-            if not alt_mean:
-                mean_stress = (group[1] + group[2]) / 2
-                alternating_stress = abs(group[1] - group[2]) / 2
-            else:
-                alternating_stress = group[1]
-                mean_stress = group[2]
-
-            # calculate the reversible stress according to the mean stress sign
-            if mean_stress >= 0:
-                reversible_stress = alternating_stress / (1 - (mean_stress / Sut))
-            else:
-                reversible_stress = alternating_stress
-
-            group.append(reversible_stress)
-
-            if ((Sy is not None) and (Sm < reversible_stress < Sy)) or reversible_stress < Se:
-                # infinite num of cycle - either the stress is less than
-                # the endurance limit or its low cycle fatigue
-                group.append(inf)
-
-            elif Se < reversible_stress < Sm:
-                # High Cycle Fatigue
-                # TODO: this calculation is the same every
-                #   iteration consider change to internal function and implement cash
-                a = Sm * (Sm / Se) ** (-3 / z)
-                b = (1 / z) * log10(Sm / Se)
-                N = (reversible_stress / a) ** (1 / b)
-                group.append(N)
-
-            else:
-                # print error but don't stop the loop
-                print(
-                    f"Reversible Stress = {reversible_stress} not in range,"
-                    f"LCF-range=(Sm_stress={Sm},Sy={Sy}), "
-                    f"HCF-range(Se={Se},Sm_stress={Sm})")
-
-        result = 0
-        for group in stress_groups:
-            # summing n/N
-            result += (group[0] / group[-1])
-            if verbose:
-                print(group)
-
-        N_total = float(1 / result)
+        result = self.miner_rule_batch(stress_groups, Sut, Se, Sy, z, alt_mean,
+                                       mean_stress_correction=mean_stress_correction)
+        N_total = float(result.total_life)
 
         if verbose:
+            # [number_of_repetitions, maximum_stress, minimum_stress, reversible_stress, N]
+            for group, reversible_stress, life in zip(np.asarray(stress_groups).tolist(),
+                                                      result.reversible_stress.tolist(),
+                                                      result.life.tolist()):
+                print(group + [reversible_stress, life])
             if freq:
                 print(f"total time = {N_total:.2f} [s]")
             else:
                 print(f"N_total = {N_total:.2f}")
         return N_total
 
+    @staticmethod
+    def miner_rule_batch(stress_groups, Sut, Se, Sy=None, z=-3, alt_mean=False, warn=True,
+                         mean_stress_correction='goodman'):
+        """Vectorized Miner's rule for an (N, 3) array of stress groups
+        (see :meth:`miner_rule`), the stress groups aren't modified
+
+        Note: groups in the LCF range (if Sy is given) or below the endurance limit have
+        infinite life, groups out of both ranges fail at once (life 0 and infinite damage,
+        a note is printed)
+
+        :param np.ndarray stress_groups: [number_of_repetitions, maximum_stress, minimum_stress]
+            rows (or [number_of_repetitions, alternating_stress, mean_stress] if alt_mean)
+        :param float Sut: Ultimate tensile strength [MPa]
+        :param float Se: endurance limit [MPa]
+        :param float Sy: yield strength [MPa], if None only HCF is checked
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+            where N=5e8
+        :param bool alt_mean: if True the stress groups are of alternating and mean stresses
+        :param bool warn: print a note if some of the groups are out of range
+        :param str or callable mean_stress_correction: The mean stress correction
+            (see :class:`MeanStressCorrection`)
+
+        :returns: The total life, and per group damage (n/N), life (N) and reversible stress
+        :rtype: MinerResult
+        """
+        stress_groups = np.asarray(stress_groups, dtype=float)
+        if stress_groups.ndim != 2 or stress_groups.shape[1] != 3:
+            raise ValueError(f"stress_groups should be of shape (N, 3) "
+                             f"not {stress_groups.shape}")
+        repetitions = stress_groups[:, 0]
+
+        # if the stress given are minimum and maximum instead of alternating and mean
+        if not alt_mean:
+            mean_stress = (stress_groups[:, 1] + stress_groups[:, 2]) / 2
+            alternating_stress = np.abs(stress_groups[:, 1] - stress_groups[:, 2]) / 2
+        else:
+            alternating_stress = stress_groups[:, 1]
+            mean_stress = stress_groups[:, 2]
+
+        # calculate the reversible stress with the mean stress correction
+        reversible_stress = np.asarray(MeanStressCorrection.reversible_stress(
+            alternating_stress, mean_stress, Sut, Sy, mean_stress_correction), dtype=float)
+
+        # the S-N curve constants (high cycle fatigue) are the same for all the groups
+        curve = get_sn_curve(Sut, Se, Sy, z)
+        Sm = curve.Sm
+
+        # infinite num of cycle - either the stress is less than
+        # the endurance limit or its low cycle fatigue
+        infinite = reversible_stress < Se
+        if Sy is not None:
+            infinite |= (Sm < reversible_stress) & (reversible_stress < Sy)
+        high_cycle = (Se <= reversible_stress) & (reversible_stress <= Sm)
+
+        # the rest (above Sy, above Sm if Sy is None, or a mean stress at or above the
+        # strength of the correction) fail at once
+        life = np.zeros(reversible_stress.shape)
+        life[infinite] = inf
+        life[high_cycle] = curve.hcf_life(reversible_stress[high_cycle])
+
+        overload = life == 0
+        if warn and overload.any():
+            # print a note but don't stop the calculation
+            print(f"{np.count_nonzero(overload)} stress groups with reversible stress not "
+                  f"in range (e.g. {reversible_stress[overload][0]}) fail at once, "
+                  f"LCF-range=(Sm_stress={Sm},Sy={Sy}), HCF-range(Se={Se},Sm_stress={Sm})")
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # groups without repetitions don't damage, even if they fail at once
+            damage = np.where(repetitions == 0, 0.0, repetitions / life)
+            total_life = 1 / np.sum(damage)
+        return MinerResult(total_life, damage, life, reversible_stress)
+
     def get_info(self):
         """print object attributes"""
         print_atributes(self)
@@ -0,0 +1,335 @@
+"""module containing the FatigueAnalysisBatch class, a struct-of-arrays
+version of FatigueAnalysis for many stress states at once
+"""
+import numpy as np
+
+from me_toolbox.fatigue import FailureCriteria
+from me_toolbox.fatigue import FatigueAnalysis
+from me_toolbox.tools import print_atributes
+
+# number of stress states evaluated at once by the chunked methods
+CHUNK_SIZE = 2 ** 18
+
+
+class FatigueAnalysisBatch:
+    """Perform fatigue analysis of many stress states at once (e.g. every node of every
+    load case of an FE model), the material properties, Kf factors and stress components
+    are held as contiguous arrays and the results are arrays of the stress states shape
+    """
+
+    # the per stress state inputs (in the order of __init__)
+    FIELDS = ('Se', 'Sut', 'Sy', 'Kf_bending', 'Kf_normal', 'Kf_torsion',
+              'alt_bending_stress', 'alt_normal_stress', 'alt_torsion_stress',
+              'mean_bending_stress', 'mean_normal_stress', 'mean_torsion_stress')
+
+    def __repr__(self):
+        return f"FatigueAnalysisBatch(shape={self.shape}, stress_type={self.stress_type}, " \
+               f"ductile={self.ductile})"
+
+    def __init__(self, modified_endurance_limit, stress_type, ductile, ultimate_tensile_strength,
+                 yield_strength=None, Kf_bending=0, Kf_normal=0, Kf_torsion=0,
+                 alt_bending_stress=0, alt_normal_stress=0, alt_torsion_stress=0,
+                 mean_bending_stress=0, mean_normal_stress=0, mean_torsion_stress=0):
+        """ Instantiating fatigue batch object, the arguments are the same as
+        :class:`FatigueAnalysis` but any of the numerical ones can be an array
+        (all are broadcast together)
+
+        Note: all stresses are in [MPa]
+        :param np.ndarray modified_endurance_limit: The modified endurance limit (Se)
+        :param str stress_type: Type of stress loading (bending', 'axial', 'torsion', 'shear',
+            'multiple')
+        :param bool ductile: True if material is ductile
+        :param np.ndarray ultimate_tensile_strength: Ultimate tensile strength (Sut) [MPa]
+        :param np.ndarray or None yield_strength: Yield strength in [MPa]
+        :param np.ndarray Kf_bending: dynamic stress concentration factor for bending
+        :param np.ndarray Kf_normal: dynamic stress concentration factor for normal
+        :param np.ndarray Kf_torsion: dynamic stress concentration factor for torsion
+        :param np.ndarray alt_bending_stress: Alternating bending stress
+        :param np.ndarray alt_normal_stress: Alternating normal stress
+        :param np.ndarray alt_torsion_stress: Alternating torsion stress
+        :param np.ndarray mean_bending_stress: Mean bending stresses
+        :param np.ndarray mean_normal_stress: Mean normal stresses
+        :param np.ndarray mean_torsion_stress: Mean torsion stresses
+        """
+        self.stress_type = stress_type
+        self.ductile = ductile
+        self.has_yield_strength = yield_strength is not None
+        values = (modified_endurance_limit, ultimate_tensile_strength,
+                  np.inf if yield_strength is None else yield_strength,
+                  Kf_bending, Kf_normal, Kf_torsion,
+                  alt_bending_stress, alt_normal_stress, alt_torsion_stress,
+                  mean_bending_stress, mean_normal_stress, mean_torsion_stress)
+        arrays = [np.asarray(value, dtype=float) for value in values]
+        self.shape = np.broadcast_shapes(*(array.shape for array in arrays))
+        self.size = int(np.prod(self.shape))
+
+        # scalars are kept as scalars, arrays are stored flat and contiguous
+        for name, array in zip(self.FIELDS, arrays):
+            if array.ndim != 0:
+                array = np.ascontiguousarray(np.broadcast_to(array, self.shape)).reshape(-1)
+            setattr(self, name, array)
+
+        self._alt_eq_stress = None
+        self._mean_eq_stress = None
+
+    def get_info(self):
+        """print object attributes"""
+        print_atributes(self)
+
+    def chunk(self, index):
+        """Returns a batch of a part of the stress states (sharing the arrays memory)
+
+        :param slice index: Slice of the flattened stress states
+
+        :rtype: FatigueAnalysisBatch
+        """
+        batch = object.__new__(FatigueAnalysisBatch)
+        batch.stress_type, batch.ductile = self.stress_type, self.ductile
+        batch.has_yield_strength = self.has_yield_strength
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            setattr(batch, name, array if array.ndim == 0 else array[index])
+        batch.size = len(range(*index.indices(self.size)))
+        batch.shape = (batch.size,)
+        batch._alt_eq_stress = None if self._alt_eq_stress is None else \
+            self._alt_eq_stress.reshape(-1)[index]
+        batch._mean_eq_stress = None if self._mean_eq_stress is None else \
+            self._mean_eq_stress.reshape(-1)[index]
+        return batch
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Iterate over the stress states in chunks
+
+        :param int chunk_size: Number of stress states in a chunk
+
+        :returns: Generator of the chunk slice (of the flattened stress states)
+            and the chunk batch
+        :rtype: Iterator[tuple[slice, FatigueAnalysisBatch]]
+        """
+        for start in range(0, self.size, chunk_size):
+            index = slice(start, min(start + chunk_size, self.size))
+            yield index, self.chunk(index)
+
+    @property
+    def alt_eq_stress(self):
+        """Alternating equivalent stresses (calculated once)
+
+        :rtype: np.ndarray
+        """
+        if self._alt_eq_stress is None:
+            self._alt_eq_stress = self._full(self.calc_alt_eq_stress())
+        return self._alt_eq_stress
+
+    @property
+    def mean_eq_stress(self):
+        """Mean equivalent stresses (calculated once)
+
+        :rtype: np.ndarray
+        """
+        if self._mean_eq_stress is None:
+            self._mean_eq_stress = self._full(self.calc_mean_eq_stress())
+        return self._mean_eq_stress
+
+    def calc_alt_eq_stress(self):
+        """Returns the alternating equivalent stresses according to the load type
+        (see :meth:`FatigueAnalysis.calc_alt_eq_stress`)
+
+        :rtype: np.ndarray
+        """
+        if self.stress_type == 'multiple':
+            corrected_bending = self.Kf_bending * self.alt_bending_stress
+            corrected_normal = self.Kf_normal * (self.alt_normal_stress / 0.85)
+            corrected_torsion = self.Kf_torsion * self.alt_torsion_stress
+            return np.sqrt((corrected_bending + corrected_normal) ** 2 +
+                           3 * corrected_torsion ** 2)
+
+        elif self.stress_type == 'bending':
+            return self.Kf_bending * self.alt_bending_stress
+
+        elif self.stress_type == 'axial':
+            return self.Kf_normal * self.alt_normal_stress
+
+        elif self.stress_type == 'torsion' or self.stress_type == 'shear':
+            return self.Kf_torsion * self.alt_torsion_stress
+
+        raise ValueError(f"Unknown stress type - {self.stress_type}")
+
+    def calc_mean_eq_stress(self):
+        """Returns the mean equivalent stresses according to the load type
+        (see :meth:`FatigueAnalysis.calc_mean_eq_stress`)
+
+        :rtype: np.ndarray
+        """
+        if self.ductile:
+            # if the material is ductile no correction is needed
+            Kf_bending, Kf_normal, Kf_torsion = 1, 1, 1
+        else:
+            Kf_bending, Kf_normal, Kf_torsion = self.Kf_bending, self.Kf_normal, self.Kf_torsion
+
+        if self.stress_type == 'multiple':
+            corrected_bending = Kf_bending * self.mean_bending_stress
+            corrected_normal = Kf_normal * self.mean_normal_stress
+            corrected_torsion = Kf_torsion * self.mean_torsion_stress
+            return np.sqrt((corrected_bending + corrected_normal) ** 2 +
+                           3 * corrected_torsion ** 2)
+
+        elif self.stress_type == 'bending':
+            return Kf_bending * self.mean_bending_stress
+
+        elif self.stress_type == 'axial':
+            return Kf_normal * self.mean_normal_stress
+
+        elif self.stress_type == 'torsion' or self.stress_type == 'shear':
+            return Kf_torsion * self.mean_torsion_stress
+
+        raise ValueError(f"Unknown stress type - {self.stress_type}")
+
+    @property
+    def shear_ultimate_strength(self):
+        """Sst - ultimate shear tensile strength (see
+        :attr:`FatigueAnalysis.shear_ultimate_strength`)"""
+        return 0.67 * self.Sut
+
+    @property
+    def shear_yield_stress(self):
+        """Yield stress for shear (see :attr:`FatigueAnalysis.shear_yield_stress`)"""
+        return self.Sy / np.sqrt(3)
+
+    @property
+    def _is_shear(self):
+        return self.stress_type == 'torsion' or self.stress_type == 'shear'
+
+    def criterion_safety_factor(self, criterion):
+        """Safety factors of a single criterion, like the criteria properties of
+        :class:`FatigueAnalysis` (nan where the mean stress is negative)
+
+        :param str criterion: 'modified goodman', 'soderberg', 'gerber' or 'asme-elliptic'
+
+        :rtype: np.ndarray
+        """
+        criterion = criterion.lower()
+        if criterion in ('modified goodman', 'gerber'):
+            strength = self.shear_ultimate_strength if self._is_shear else self.Sut
+        elif criterion == 'soderberg':
+            strength = self.shear_yield_stress if self._is_shear else self.Sy
+        elif criterion == 'asme-elliptic':
+            # FatigueAnalysis.ASME_elliptic uses Sut as the yield strength for normal stresses
+            strength = self.shear_yield_stress if self._is_shear else self.Sut
+        else:
+            strength = None
+        criterion_function, _ = FailureCriteria._get_criterion(criterion, strength, strength,
+                                                               array=True)
+
+        alt, mean = self._flat_alt_eq_stress(), self._flat_mean_eq_stress()
+        positive = mean >= 0
+        result = np.full(self.size, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[positive] = criterion_function(_select(strength, positive),
+                                                  _select(self.Se, positive),
+                                                  alt[positive], mean[positive])
+        return result.reshape(self.shape)
+
+    @property
+    def modified_goodman(self):
+        """Modified Goodman safety factors (see :meth:`criterion_safety_factor`)"""
+        return self.criterion_safety_factor('modified goodman')
+
+    @property
+    def soderberg(self):
+        """Soderberg safety factors (see :meth:`criterion_safety_factor`)"""
+        return self.criterion_safety_factor('soderberg')
+
+    @property
+    def gerber(self):
+        """Gerber safety factors (see :meth:`criterion_safety_factor`)"""
+        return self.criterion_safety_factor('gerber')
+
+    @property
+    def ASME_elliptic(self):
+        """ASME elliptic safety factors (see :meth:`criterion_safety_factor`)"""
+        return self.criterion_safety_factor('asme-elliptic')
+
+    @property
+    def langer_static_yield(self):
+        """Langer static safety factors (see :attr:`FatigueAnalysis.langer_static_yield`)
+
+        :rtype: np.ndarray
+        """
+        yield_strength = 0.67 * self.Sut if self._is_shear else self.Sy
+        return self._full(yield_strength / (self._flat_alt_eq_stress() +
+                                            np.abs(self._flat_mean_eq_stress())))
+
+    def get_safety_factors(self, criterion, chunk_size=None):
+        """Returns dynamic and static safety factors arrays according to the quadrant
+        of every stress state (see :meth:`FatigueAnalysis.get_safety_factors`)
+
+        :param str criterion: The criterion to use (modified goodman, soderberg, gerber,
+         asme-elliptic)
+        :param int or None chunk_size: Evaluate in chunks of this many stress states
+            (the equivalent stresses aren't kept), None evaluates all at once
+
+        :returns: dynamic and static safety factors
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        def safety_factors(batch):
+            return FailureCriteria.get_safety_factors_batch(
+                batch.Sy, batch.Sut, batch.Se, batch._flat_alt_eq_stress(),
+                batch._flat_mean_eq_stress(), criterion)
+        return self._evaluate(safety_factors, chunk_size)
+
+    def num_of_cycles(self, z=-3, chunk_size=None, mean_stress_correction='goodman'):
+        """Returns the number of cycles until failure of every stress state
+        (see :meth:`FatigueAnalysis.calc_num_of_cycles_batch`)
+
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8,
+            -5.69 for metal where N=5e8
+        :param int or None chunk_size: Evaluate in chunks of this many stress states
+            (the equivalent stresses aren't kept), None evaluates all at once
+        :param str or callable mean_stress_correction: The mean stress correction
+            (see :class:`MeanStressCorrection`)
+
+        :returns: The Number of cycles and the fatigue stress at failure (nan if none)
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        def cycles(batch):
+            return FatigueAnalysis.calc_num_of_cycles_batch(
+                batch._flat_mean_eq_stress(), batch._flat_alt_eq_stress(), batch.Se, batch.Sut,
+                batch.Sy if batch.has_yield_strength else None, z, mean_stress_correction)
+        return self._evaluate(cycles, chunk_size)
+
+    def _evaluate(self, function, chunk_size):
+        """Evaluate a function returning a tuple of per stress state arrays,
+        at once or in chunks"""
+        if chunk_size is None:
+            return tuple(self._full(result) for result in function(self))
+
+        results = None
+        for index, batch in self.iter_chunks(chunk_size):
+            chunk_results = function(batch)
+            if results is None:
+                results = tuple(np.empty(self.size) for _ in chunk_results)
+            for result, chunk_result in zip(results, chunk_results):
+                result[index] = chunk_result
+        return tuple(result.reshape(self.shape) for result in results)
+
+    def _flat_alt_eq_stress(self):
+        """The flat alternating equivalent stresses, not cached when not calculated yet"""
+        if self._alt_eq_stress is not None:
+            return self._alt_eq_stress.reshape(-1)
+        return np.broadcast_to(self.calc_alt_eq_stress(), (self.size,))
+
+    def _flat_mean_eq_stress(self):
+        """The flat mean equivalent stresses, not cached when not calculated yet"""
+        if self._mean_eq_stress is not None:
+            return self._mean_eq_stress.reshape(-1)
+        return np.broadcast_to(self.calc_mean_eq_stress(), (self.size,))
+
+    def _full(self, values):
+        """Broadcast flat (or scalar) values to the stress states shape"""
+        return np.broadcast_to(values, (self.size,)).reshape(self.shape).copy() \
+            if np.ndim(values) == 0 else np.reshape(values, self.shape)
+
+
+def _select(values, mask):
+    """Select the masked values of a flat array, scalars are returned as is"""
+    return values if np.ndim(values) == 0 else values[mask]
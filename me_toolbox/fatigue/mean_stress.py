@@ -0,0 +1,199 @@
+"""module containing the MeanStressCorrection class, vectorized mean stress corrections
+turning (alternating, mean) stress pairs into an equivalent fully reversed stress
+"""
+import numpy as np
+
+
+class MeanStressCorrection:
+    """Bundling the mean stress corrections together, every correction is a vectorized
+    kernel of (alt_stress, mean_stress, Sut, Sy) returning the reversible stress (σ_rev)
+    that has the same life on the S-N curve.
+
+    The Goodman type corrections (goodman, gerber, soderberg) leave the alternating stress
+    unchanged under a negative mean stress, a mean stress at or above the correction's
+    strength fails at once (infinite reversible stress).
+
+    Any function with the kernels signature can be given instead of a correction name
+    (e.g. ``functools.partial(MeanStressCorrection.walker, gamma=0.6)``)
+
+    Note: the default σf' of morrow and γ of walker are estimated from a tensile Sut in [MPa],
+    for shear or imperial strengths they must be given explicitly (see :meth:`get_correction`)
+    """
+
+    @staticmethod
+    def goodman(alt_stress, mean_stress, Sut, Sy=None):
+        """σ_rev = σa / (1 - σm/Sut)
+
+        :param float or np.ndarray alt_stress: Alternating stress
+        :param float or np.ndarray mean_stress: Mean stress
+        :param float or np.ndarray Sut: Ultimate tensile strength
+        :param float or np.ndarray Sy: Yield strength (unused)
+
+        :rtype: float or np.ndarray
+        """
+        return _goodman_type(alt_stress, mean_stress / Sut)
+
+    @staticmethod
+    def gerber(alt_stress, mean_stress, Sut, Sy=None):
+        """σ_rev = σa / (1 - (σm/Sut)^2)
+
+        :param float or np.ndarray alt_stress: Alternating stress
+        :param float or np.ndarray mean_stress: Mean stress
+        :param float or np.ndarray Sut: Ultimate tensile strength
+        :param float or np.ndarray Sy: Yield strength (unused)
+
+        :rtype: float or np.ndarray
+        """
+        ratio = mean_stress / Sut
+        return _goodman_type(alt_stress, ratio * np.abs(ratio))
+
+    @staticmethod
+    def soderberg(alt_stress, mean_stress, Sut, Sy=None):
+        """σ_rev = σa / (1 - σm/Sy)
+
+        :param float or np.ndarray alt_stress: Alternating stress
+        :param float or np.ndarray mean_stress: Mean stress
+        :param float or np.ndarray Sut: Ultimate tensile strength (unused)
+        :param float or np.ndarray Sy: Yield strength
+
+        :rtype: float or np.ndarray
+        :raises ValueError: if the yield strength is None
+        """
+        if Sy is None:
+            raise ValueError("The Soderberg correction needs the yield strength")
+        return _goodman_type(alt_stress, mean_stress / Sy)
+
+    @staticmethod
+    def morrow(alt_stress, mean_stress, Sut, Sy=None, fatigue_strength_coefficient=None):
+        """σ_rev = σa / (1 - σm/σf'), applied to negative mean stresses too,
+        a mean stress at or above Sut fails at once (infinite reversible stress)
+
+        :param float or np.ndarray alt_stress: Alternating stress
+        :param float or np.ndarray mean_stress: Mean stress
+        :param float or np.ndarray Sut: Ultimate tensile strength [MPa]
+        :param float or np.ndarray Sy: Yield strength (unused)
+        :param float or np.ndarray fatigue_strength_coefficient: σf' (in the units of the
+            stresses), if None it is estimated as Sut + 345[MPa] (steels)
+
+        :rtype: float or np.ndarray
+        """
+        if fatigue_strength_coefficient is None:
+            fatigue_strength_coefficient = np.add(Sut, 345)
+        alt_stress, mean_stress = np.asarray(alt_stress), np.asarray(mean_stress)
+        denominator = 1 - mean_stress / fatigue_strength_coefficient
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _to_scalar(np.where((denominator > 0) & (mean_stress < Sut),
+                                       alt_stress / denominator, np.inf))
+
+    @staticmethod
+    def walker(alt_stress, mean_stress, Sut, Sy=None, gamma=None):
+        """σ_rev = σmax^(1-γ) * σa^γ (σmax = σa + σm), no damage if σmax <= 0
+
+        :param float or np.ndarray alt_stress: Alternating stress
+        :param float or np.ndarray mean_stress: Mean stress
+        :param float or np.ndarray Sut: Ultimate tensile strength [MPa]
+        :param float or np.ndarray Sy: Yield strength (unused)
+        :param float or np.ndarray gamma: The Walker exponent, if None it is estimated as
+            0.8818 - 0.0002 * Sut[MPa] (Dowling's fit for steels), 0.5 is the SWT correction
+
+        :rtype: float or np.ndarray
+        """
+        if gamma is None:
+            gamma = 0.8818 - 0.0002 * np.asarray(Sut)
+        alt_stress = np.asarray(alt_stress)
+        max_stress = alt_stress + np.asarray(mean_stress)
+        with np.errstate(invalid='ignore'):
+            reversible_stress = np.maximum(max_stress, 0) ** (1 - gamma) * alt_stress ** gamma
+        return _to_scalar(reversible_stress)
+
+    @staticmethod
+    def swt(alt_stress, mean_stress, Sut, Sy=None):
+        """Smith-Watson-Topper, σ_rev = sqrt(σmax * σa) (σmax = σa + σm),
+        no damage if σmax <= 0
+
+        :param float or np.ndarray alt_stress: Alternating stress
+        :param float or np.ndarray mean_stress: Mean stress
+        :param float or np.ndarray Sut: Ultimate tensile strength (unused)
+        :param float or np.ndarray Sy: Yield strength (unused)
+
+        :rtype: float or np.ndarray
+        """
+        alt_stress = np.asarray(alt_stress)
+        max_stress = alt_stress + np.asarray(mean_stress)
+        return _to_scalar(np.sqrt(np.maximum(max_stress, 0) * alt_stress))
+
+    @staticmethod
+    def get_correction(correction, tensile_mpa=True):
+        """Returns the kernel of a correction
+
+        :param str or callable correction: 'goodman', 'gerber', 'soderberg', 'morrow',
+            'walker', 'swt' or a function of (alt_stress, mean_stress, Sut, Sy)
+        :param bool tensile_mpa: False if the strengths aren't tensile strengths in [MPa]
+            (e.g. shear or imperial strengths), the corrections with defaults estimated
+            from a tensile Sut in [MPa] (morrow, walker) can't be given by name then
+
+        :rtype: callable
+        :raises ValueError: if the correction is unknown or its defaults don't apply
+        """
+        if callable(correction):
+            return correction
+        try:
+            kernel = _CORRECTIONS[correction.lower()]
+        except KeyError:
+            raise ValueError(f"Unknown mean stress correction - {correction}, "
+                             f"the corrections are {tuple(_CORRECTIONS)}")
+        if not tensile_mpa and correction.lower() in _TENSILE_MPA_DEFAULTS:
+            raise ValueError(f"The {correction.lower()} correction defaults are estimated from "
+                             f"a tensile Sut in [MPa], give them explicitly (e.g. "
+                             f"functools.partial(MeanStressCorrection.{correction.lower()}, "
+                             f"...)) for shear or imperial strengths")
+        return kernel
+
+    @staticmethod
+    def reversible_stress(alt_stress, mean_stress, Sut, Sy=None, correction='goodman'):
+        """The equivalent fully reversed stress of (alternating, mean) stress pairs
+
+        :param float or np.ndarray alt_stress: Alternating stress
+        :param float or np.ndarray mean_stress: Mean stress
+        :param float or np.ndarray Sut: Ultimate tensile strength
+        :param float or np.ndarray Sy: Yield strength
+        :param str or callable correction: The correction (see :meth:`get_correction`)
+
+        :rtype: float or np.ndarray
+        """
+        return MeanStressCorrection.get_correction(correction)(alt_stress, mean_stress, Sut, Sy)
+
+
+def _goodman_type(alt_stress, mean_ratio):
+    """σa / (1 - mean_ratio) for a positive mean stress, σa for a negative one and
+    infinite at or beyond the strength
+    """
+    if type(mean_ratio) is float and type(alt_stress) in (float, int):
+        # single stress state (the common scalar call, without the numpy overhead)
+        if mean_ratio < 0:
+            return alt_stress
+        return alt_stress / (1 - mean_ratio) if mean_ratio < 1 else np.inf
+
+    alt_stress, mean_ratio = np.asarray(alt_stress), np.asarray(mean_ratio)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        reversible_stress = np.where(mean_ratio < 1, alt_stress / (1 - np.maximum(mean_ratio, 0)),
+                                     np.inf)
+    return _to_scalar(reversible_stress)
+
+
+def _to_scalar(value):
+    """Return 0-d arrays and numpy scalars as floats (like the scalar Goodman type path)"""
+    if isinstance(value, (np.ndarray, np.generic)) and np.ndim(value) == 0:
+        return value.item()
+    return value
+
+
+_CORRECTIONS = {'goodman': MeanStressCorrection.goodman,
+                'gerber': MeanStressCorrection.gerber,
+                'soderberg': MeanStressCorrection.soderberg,
+                'morrow': MeanStressCorrection.morrow,
+                'walker': MeanStressCorrection.walker,
+                'swt': MeanStressCorrection.swt}
+
+# the corrections with default coefficients estimated from a tensile Sut in [MPa]
+_TENSILE_MPA_DEFAULTS = ('morrow', 'walker')
@@ -0,0 +1,285 @@
+"""module containing the MonteCarloAnalysis class, the probability of fatigue failure
+of a design whose material properties, Marin factors, Kf factors and loads scatter
+"""
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from math import log, sqrt
+
+import numpy as np
+
+from me_toolbox.fatigue.endurance_limit import EnduranceLimit
+from me_toolbox.fatigue.fatigue_analysis_batch import FatigueAnalysisBatch
+
+# number of samples drawn and evaluated at once
+BLOCK_SIZE = 2 ** 18
+
+# the result of MonteCarloAnalysis.run
+MonteCarloResult = namedtuple('MonteCarloResult',
+                              ['samples', 'failure_probability', 'standard_error',
+                               'yield_failure_probability', 'percentiles', 'convergence',
+                               'invalid', 'safety_factors'])
+
+# the estimate of the failure probability after every block
+Convergence = namedtuple('Convergence', ['samples', 'failure_probability', 'standard_error'])
+
+
+class Distribution(ABC):
+    """A random variable, drawn with a numpy Generator"""
+
+    @abstractmethod
+    def sample(self, rng, size):
+        """Draw samples
+
+        :param np.random.Generator rng: The random generator
+        :param int size: Number of samples
+
+        :rtype: np.ndarray
+        """
+
+
+class Normal(Distribution):
+    """Normal distribution"""
+
+    def __init__(self, mean, std):
+        """
+        :param float mean: The mean
+        :param float std: The standard deviation
+        """
+        self.mean, self.std = mean, std
+
+    def __repr__(self):
+        return f"Normal(mean={self.mean}, std={self.std})"
+
+    def sample(self, rng, size):
+        return rng.normal(self.mean, self.std, size)
+
+
+class LogNormal(Distribution):
+    """Lognormal distribution given by the mean and standard deviation of the variable
+    (not of its logarithm), e.g. Shigley's scatter of Sut and the Marin factors
+    """
+
+    def __init__(self, mean, std):
+        """
+        :param float mean: The mean (of the variable)
+        :param float std: The standard deviation (of the variable)
+        """
+        self.mean, self.std = mean, std
+        self.sigma = sqrt(log(1 + (std / mean) ** 2))
+        self.mu = log(mean) - self.sigma ** 2 / 2
+
+    def __repr__(self):
+        return f"LogNormal(mean={self.mean}, std={self.std})"
+
+    def sample(self, rng, size):
+        return rng.lognormal(self.mu, self.sigma, size)
+
+
+class Uniform(Distribution):
+    """Uniform distribution"""
+
+    def __init__(self, low, high):
+        """
+        :param float low: The lower bound
+        :param float high: The upper bound
+        """
+        self.low, self.high = low, high
+
+    def __repr__(self):
+        return f"Uniform(low={self.low}, high={self.high})"
+
+    def sample(self, rng, size):
+        return rng.uniform(self.low, self.high, size)
+
+
+class Weibull(Distribution):
+    """Three parameter Weibull distribution"""
+
+    def __init__(self, shape, scale, location=0):
+        """
+        :param float shape: The shape parameter (b)
+        :param float scale: The scale parameter (theta - x0)
+        :param float location: The location parameter (x0)
+        """
+        self.shape, self.scale, self.location = shape, scale, location
+
+    def __repr__(self):
+        return f"Weibull(shape={self.shape}, scale={self.scale}, location={self.location})"
+
+    def sample(self, rng, size):
+        return self.location + self.scale * rng.weibull(self.shape, size)
+
+
+class MonteCarloAnalysis:
+    """Monte Carlo estimation of the probability of fatigue failure (safety factor < 1),
+    every input of :class:`FatigueAnalysis` can be a fixed value or a :class:`Distribution`,
+    the samples are drawn and evaluated in vectorized blocks (see :class:`FatigueAnalysisBatch`)
+
+    .. code-block:: python
+
+        analysis = MonteCarloAnalysis(
+            modified_endurance_limit=LogNormal(180, 18), stress_type='bending', ductile=True,
+            ultimate_tensile_strength=LogNormal(600, 40), yield_strength=LogNormal(420, 30),
+            Kf_bending=Normal(1.6, 0.1), alt_bending_stress=Normal(90, 15),
+            mean_bending_stress=Normal(60, 10))
+        result = analysis.run(10 ** 7, seed=1, workers=4)
+        result.failure_probability, result.percentiles
+    """
+
+    # the inputs which can scatter (in the order they are drawn)
+    FIELDS = ('ultimate_tensile_strength', 'yield_strength', 'modified_endurance_limit',
+              'Kf_bending', 'Kf_normal', 'Kf_torsion',
+              'alt_bending_stress', 'alt_normal_stress', 'alt_torsion_stress',
+              'mean_bending_stress', 'mean_normal_stress', 'mean_torsion_stress')
+
+    def __init__(self, modified_endurance_limit, stress_type, ductile, ultimate_tensile_strength,
+                 yield_strength=None, Kf_bending=0, Kf_normal=0, Kf_torsion=0,
+                 alt_bending_stress=0, alt_normal_stress=0, alt_torsion_stress=0,
+                 mean_bending_stress=0, mean_normal_stress=0, mean_torsion_stress=0,
+                 criterion='modified goodman', marin_scatter=None):
+        """ Instantiating a Monte Carlo analysis, the arguments are the same as
+        :class:`FatigueAnalysis` but any of the numerical ones can be a :class:`Distribution`
+
+        Note: all stresses are in [MPa]
+        :param float or Distribution or EnduranceLimit modified_endurance_limit: The modified
+            endurance limit (Se), if an EnduranceLimit is given its Marin factors are
+            evaluated with every sampled Sut
+        :param str stress_type: Type of stress loading (bending', 'axial', 'torsion', 'shear',
+            'multiple')
+        :param bool ductile: True if material is ductile
+        :param float or Distribution ultimate_tensile_strength: Ultimate tensile strength
+        :param float or Distribution or None yield_strength: Yield strength
+        :param float or Distribution Kf_bending: dynamic stress concentration factor for bending
+        :param float or Distribution Kf_normal: dynamic stress concentration factor for normal
+        :param float or Distribution Kf_torsion: dynamic stress concentration factor for torsion
+        :param float or Distribution alt_bending_stress: Alternating bending stress
+        :param float or Distribution alt_normal_stress: Alternating normal stress
+        :param float or Distribution alt_torsion_stress: Alternating torsion stress
+        :param float or Distribution mean_bending_stress: Mean bending stresses
+        :param float or Distribution mean_normal_stress: Mean normal stresses
+        :param float or Distribution mean_torsion_stress: Mean torsion stresses
+        :param str criterion: The criterion to use (modified goodman, soderberg, gerber,
+            asme-elliptic)
+        :param dict or None marin_scatter: Multiplicative scatter of the endurance limit
+            (e.g. {'Ka': LogNormal(1, 0.058), 'unmodified': LogNormal(1, 0.138)})
+        """
+        self.modified_endurance_limit = modified_endurance_limit
+        self.stress_type = stress_type
+        self.ductile = ductile
+        self.ultimate_tensile_strength = ultimate_tensile_strength
+        self.yield_strength = yield_strength
+        self.Kf_bending, self.Kf_normal, self.Kf_torsion = Kf_bending, Kf_normal, Kf_torsion
+        self.alt_bending_stress = alt_bending_stress
+        self.alt_normal_stress = alt_normal_stress
+        self.alt_torsion_stress = alt_torsion_stress
+        self.mean_bending_stress = mean_bending_stress
+        self.mean_normal_stress = mean_normal_stress
+        self.mean_torsion_stress = mean_torsion_stress
+        self.criterion = criterion
+        self.marin_scatter = {} if marin_scatter is None else dict(marin_scatter)
+
+    def __repr__(self):
+        return f"MonteCarloAnalysis(stress_type={self.stress_type}, ductile={self.ductile}, " \
+               f"criterion={self.criterion})"
+
+    def evaluate(self, rng, size):
+        """Draw one block of samples and evaluate their safety factors
+
+        :param np.random.Generator rng: The random generator
+        :param int size: Number of samples
+
+        :returns: The fatigue and static safety factors of every sample
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        values = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            values[name] = value.sample(rng, size) if isinstance(value, Distribution) else value
+
+        Se = values['modified_endurance_limit']
+        if isinstance(Se, EnduranceLimit):
+            Se = EnduranceLimit.marin_factors_batch(
+                Se.unmodified, values['ultimate_tensile_strength'], Se.surface_finish,
+                Se.rotating, Se.max_normal_stress, Se.max_bending_stress, Se.stress_type,
+                Se.temp, Se.reliability, A95=Se.A95, diameter=Se.diameter).modified
+        for name in sorted(self.marin_scatter):
+            scatter = self.marin_scatter[name]
+            Se = Se * (scatter.sample(rng, size) if isinstance(scatter, Distribution)
+                       else scatter)
+        values['modified_endurance_limit'] = np.broadcast_to(Se, (size,))
+
+        batch = FatigueAnalysisBatch(stress_type=self.stress_type, ductile=self.ductile,
+                                     **values)
+        return batch.get_safety_factors(self.criterion)
+
+    def run(self, samples=10 ** 6, seed=None, block_size=BLOCK_SIZE, workers=None,
+            percentiles=(1, 5, 50, 95, 99), keep_samples=False):
+        """Run the simulation, every block gets its own generator spawned from the seed,
+        so the result only depends on the seed and the block size (not on the workers)
+
+        :param int samples: Number of samples
+        :param int or None seed: The seed (None for a random seed)
+        :param int block_size: Number of samples drawn and evaluated at once
+        :param int or None workers: Number of processes evaluating blocks
+            (None evaluates in this process)
+        :param tuple percentiles: Percentiles of the fatigue safety factor to report
+        :param bool keep_samples: Return the fatigue safety factor of every sample
+
+        Note: samples with no fatigue safety factor (nan) are counted in invalid and left out
+        of both the fatigue and the yield failure probabilities
+
+        :returns: The probability of failure (n < 1) with its standard error, percentiles of
+            the safety factor and the estimate after every block (convergence)
+        :rtype: MonteCarloResult
+        """
+        if samples < 1 or block_size < 1:
+            raise ValueError("samples and block_size must be positive integers")
+        sizes = [block_size] * (samples // block_size)
+        if samples % block_size:
+            sizes.append(samples % block_size)
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+        if workers is None:
+            results = list(map(_run_block, [self] * len(sizes), seeds, sizes))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_run_block, [self] * len(sizes), seeds, sizes))
+
+        fatigue_safety = np.concatenate([fatigue for fatigue, _ in results])
+        static_safety = np.concatenate([static for _, static in results])
+
+        # samples with no safety factor (nan) are left out
+        valid = ~np.isnan(fatigue_safety)
+        block_failures = [np.count_nonzero(fatigue < 1) for fatigue, _ in results]
+        block_valid = [np.count_nonzero(~np.isnan(fatigue)) for fatigue, _ in results]
+        convergence = _convergence(np.cumsum(block_failures), np.cumsum(block_valid))
+
+        # the yield failure probability is of the same (valid) samples
+        with np.errstate(invalid='ignore'):
+            yield_failures = np.count_nonzero(static_safety[valid] < 1)
+        valid_count = np.count_nonzero(valid)
+        return MonteCarloResult(
+            samples=samples,
+            failure_probability=float(convergence.failure_probability[-1]),
+            standard_error=float(convergence.standard_error[-1]),
+            yield_failure_probability=yield_failures / valid_count if valid_count else np.nan,
+            percentiles=dict(zip(percentiles, np.percentile(fatigue_safety[valid], percentiles)
+                                 .tolist())) if valid_count else {},
+            convergence=convergence,
+            invalid=samples - valid_count,
+            safety_factors=fatigue_safety if keep_samples else None)
+
+
+def _run_block(analysis, seed, size):
+    """Evaluate one block with its own generator (a module function so it can be pickled)"""
+    return analysis.evaluate(np.random.default_rng(seed), size)
+
+
+def _convergence(failures, samples):
+    """The failure probability estimate and its standard error (sqrt(p(1-p)/n))"""
+    samples = np.asarray(samples, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        probability = failures / samples
+        standard_error = np.sqrt(probability * (1 - probability) / samples)
+    return Convergence(samples.astype(int), probability, standard_error)
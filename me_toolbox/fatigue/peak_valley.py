@@ -0,0 +1,259 @@
+"""module containing the peak-valley (turning points) extraction of load histories,
+with a hysteresis gate removing the cycles smaller than the gate (noise), chunk by chunk
+for memory-mapped histories
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# number of samples read from the history at once
+CHUNK_SIZE = 2 ** 22
+
+# peaks and valleys with their sample index in the history
+PeakValley = namedtuple('PeakValley', ['values', 'index'])
+
+
+def turning_points(series, return_index=False):
+    """Returns the turning points (peaks and valleys) of a history, the first and last
+    points are always included and plateaus are reduced to their first point
+
+    :param np.ndarray series: The stress (or load) history
+    :param bool return_index: Also return the indices of the turning points in the series
+
+    :returns: The turning points (and their indices)
+    :rtype: np.ndarray or tuple[np.ndarray, np.ndarray]
+    """
+    series = np.asarray(series, dtype=float).reshape(-1)
+    if series.size == 0:
+        index = np.arange(0)
+        return (series.copy(), index) if return_index else series.copy()
+
+    # drop repeated values (plateaus) keeping the first point of each
+    index = np.flatnonzero(np.concatenate(([True], np.diff(series) != 0)))
+    values = series[index]
+
+    # keep the points where the slope changes sign
+    slopes = np.diff(values)
+    reversal = np.concatenate(([True], slopes[:-1] * slopes[1:] < 0, [True]))
+    if values.size < 2:
+        reversal = reversal[:values.size]
+    return (values[reversal], index[reversal]) if return_index else values[reversal]
+
+
+def hysteresis_gate(points, hysteresis, closed_end=True):
+    """Removes the reversals smaller than the hysteresis gate from turning points,
+    every cycle with a range smaller than the gate is removed (nested cycles included),
+    which leaves the same reversals as a racetrack filter of that width.
+
+    The points are pushed on a stack in a single pass, a pair of points on top of the stack
+    is removed where its range is smaller than the gate and not larger than the ranges on
+    both of its sides (the four-point rainflow condition). At the ends the first (or last)
+    point is removed where its range is smaller than the gate and than the next range,
+    so the extreme reversal next to it is kept. The bulk of the small pairs (e.g. noise)
+    are removed by vectorized passes before the stack while a pass removes at least a
+    quarter of the points, so the time is linear in the number of points
+
+    :param np.ndarray points: Turning points (see :func:`turning_points`)
+    :param float hysteresis: The gate (minimal range kept)
+    :param bool closed_end: Apply the end rule at the last point too
+        (False while more of the history is to come)
+
+    :returns: The indices of the kept turning points
+    :rtype: np.ndarray
+    """
+    points = np.asarray(points, dtype=float).reshape(-1)
+    kept = _remove_small_pairs(points, hysteresis)
+    values, index = [], []
+    _push(values, index, points[kept].tolist(), kept.tolist(), hysteresis)
+    first, last = _close(values, hysteresis) if closed_end else (0, len(values))
+    return np.array(index[first:last], dtype=np.intp)
+
+
+def peak_valley(series, hysteresis=0, chunk_size=CHUNK_SIZE):
+    """Peak-valley extraction of a history with a hysteresis gate, the history is read
+    in chunks of chunk_size samples (a memory-mapped history is never fully loaded).
+    The peaks and valleys don't depend on the chunks, where equal reversals tie the index
+    of either of them may be returned
+
+    :param np.ndarray or iterable series: The history, an array (e.g. np.memmap or
+        np.load(..., mmap_mode='r')) or an iterable of chunks
+    :param float hysteresis: The gate, cycles with a smaller range are removed
+    :param int chunk_size: Number of samples read at once from an array
+
+    :returns: The peaks and valleys (in the history's floating point type) and their
+        sample index
+    :rtype: PeakValley
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    dtype, chunks = float, series
+    if isinstance(series, np.ndarray):
+        series = series.reshape(-1)
+        if series.dtype.kind == 'f':
+            dtype = series.dtype
+        chunks = (series[start:start + chunk_size]
+                  for start in range(0, series.size, chunk_size))
+
+    extractor = PeakValleyExtractor(hysteresis)
+    extracted = [extractor.update(chunk) for chunk in chunks]
+    extracted.append(extractor.finish())
+    return PeakValley(np.concatenate([values for values, _ in extracted]).astype(dtype),
+                      np.concatenate([index for _, index in extracted]))
+
+
+class PeakValleyExtractor:
+    """Streaming peak-valley extraction with a hysteresis gate, the history is fed in
+    consecutive chunks and every chunk returns the peaks and valleys which later samples
+    can't change (the same as extracting the whole history at once, see :func:`peak_valley`).
+    The gate's stack is carried from chunk to chunk, it only holds the points which
+    may still be removed
+    """
+
+    def __init__(self, hysteresis=0):
+        """
+        :param float hysteresis: The gate, cycles with a smaller range are removed
+        """
+        if hysteresis < 0:
+            raise ValueError("The hysteresis gate can't be negative")
+        self.hysteresis = hysteresis
+        # the gate's stack, the first point was already returned if _context is True
+        # (it is kept as the left neighbour of the next points), the points before
+        # _settled can't be removed anymore
+        self._values = []
+        self._index = []
+        self._settled = 0
+        self._context = False
+        self.samples = 0
+
+    def __repr__(self):
+        return f"PeakValleyExtractor(hysteresis={self.hysteresis}, samples={self.samples})"
+
+    def update(self, chunk):
+        """Extract the peaks and valleys settled by the next chunk of the history
+
+        :param np.ndarray chunk: The next samples of the history
+
+        :returns: The settled peaks and valleys and their sample index
+        :rtype: PeakValley
+        """
+        chunk = np.asarray(chunk, dtype=float).reshape(-1)
+        index = np.arange(self.samples, self.samples + chunk.size)
+        self.samples += chunk.size
+
+        # the last point may continue along its slope in the chunk, it is extracted again
+        # together with the point before it (which sets its slope)
+        head, head_index = self._values[-2:], self._index[-2:]
+        del self._values[-1:], self._index[-1:]
+        points, position = turning_points(np.concatenate((head, chunk)), return_index=True)
+        index = np.concatenate((np.array(head_index, dtype=np.int64), index))[position]
+        kept = _remove_small_pairs(points, self.hysteresis)
+        points, index = points[kept], index[kept]
+        new = 1 if len(head) == 2 else 0
+        self._settled = _push(self._values, self._index, points[new:].tolist(),
+                              index[new:].tolist(), self.hysteresis, self._settled)
+
+        start = 1 if self._context else 0
+        settled = self._settled
+        result = PeakValley(np.array(self._values[start:settled], dtype=float),
+                            np.array(self._index[start:settled], dtype=np.int64))
+        if settled >= 1:
+            self._context = True
+            del self._values[:settled - 1], self._index[:settled - 1]
+            self._settled = 1
+        return result
+
+    def finish(self):
+        """The peaks and valleys not returned yet, closing the history
+        (the extractor isn't changed so more chunks can be fed afterwards)
+
+        :returns: The last peaks and valleys and their sample index
+        :rtype: PeakValley
+        """
+        first, last = _close(self._values, self.hysteresis)
+        first = max(first, 1 if self._context else 0)
+        return PeakValley(np.array(self._values[first:last], dtype=float),
+                          np.array(self._index[first:last], dtype=np.int64))
+
+
+def _remove_small_pairs(points, hysteresis):
+    """Vectorized passes removing the inner pairs of turning points smaller than the gate
+    (see :func:`hysteresis_gate`), only while a pass removes at least a quarter of the
+    points (the rest is left to the stack), the pairs at the ends are kept
+
+    :returns: The indices of the kept turning points
+    :rtype: np.ndarray
+    """
+    keep = np.arange(points.size)
+    while hysteresis > 0 and keep.size >= 4:
+        ranges = np.abs(np.diff(points[keep]))
+        # the pairs strictly smaller than both of their sides (they never overlap, and with
+        # ties left to the stack the result doesn't depend on the chunks)
+        inner = (ranges[1:-1] < hysteresis) & (ranges[1:-1] < ranges[:-2]) & \
+            (ranges[1:-1] < ranges[2:])
+        first = np.flatnonzero(inner) + 1
+        remove = np.zeros(keep.size, dtype=bool)
+        remove[first] = True
+        remove[first + 1] = True
+        keep = keep[~remove]
+        if 8 * first.size < keep.size + 2 * first.size:
+            break
+    return keep
+
+
+def _push(values, index, points, positions, hysteresis, settled=0):
+    """Push turning points on the gate's stack (lists of the kept values and their index),
+    removing the pairs smaller than the gate on top of the stack and the small first point
+
+    :returns: The number of points which can't be removed anymore, the points up to the
+        last range not smaller than the gate (settled is the count before the push)
+    :rtype: int
+    """
+    if hysteresis == 0:
+        # every reversal is kept
+        values.extend(points)
+        index.extend(positions)
+        return max(len(values) - 1, 0)
+
+    for value, position in zip(points, positions):
+        size = len(values)
+        while size >= 2:
+            top = values[-1]
+            pair = abs(top - values[-2])
+            if pair >= hysteresis or abs(value - top) < pair:
+                break
+            if size >= 3:
+                if pair > abs(values[-2] - values[-3]):
+                    break
+                # an inner pair not larger than the ranges on both of its sides
+                del values[-2:], index[-2:]
+                size -= 2
+            else:
+                # the first point, the reversal after it is kept
+                del values[0], index[0]
+                size = 1
+        if size and abs(value - values[-1]) >= hysteresis:
+            settled = size
+        values.append(value)
+        index.append(position)
+    return settled
+
+
+def _close(values, hysteresis):
+    """The end rules of a closed history, the first (or last) point is removed where its
+    range is smaller than the gate and than the next range (the stack holds no
+    removable inner pairs)
+
+    :returns: The first and last (exclusive) positions of the kept points
+    :rtype: tuple[int, int]
+    """
+    first, last = 0, len(values)
+    while last - first >= 3:
+        start = abs(values[first + 1] - values[first])
+        end = abs(values[last - 1] - values[last - 2])
+        if start < hysteresis and abs(values[first + 2] - values[first + 1]) >= start:
+            first += 1
+        elif end < hysteresis and abs(values[last - 2] - values[last - 3]) >= end:
+            last -= 1
+        else:
+            break
+    return first, last
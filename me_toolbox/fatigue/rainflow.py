@@ -0,0 +1,164 @@
+"""module containing rainflow cycle counting of stress histories (ASTM E1049
+four-point method) and the conversion of the counted cycles to Miner's rule stress groups
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from me_toolbox.fatigue.fatigue_analysis import FatigueAnalysis
+from me_toolbox.fatigue.peak_valley import PeakValleyExtractor, turning_points
+
+# number of samples read from the history at once
+CHUNK_SIZE = 2 ** 22
+
+# counted cycles, count is 1 for full cycles and 0.5 for the residual half cycles
+Cycles = namedtuple('Cycles', ['count', 'range', 'mean'])
+
+
+def rainflow(series, chunk_size=CHUNK_SIZE, hysteresis=0):
+    """Rainflow cycle counting of a history with the four-point method,
+    the residual (the points left on the stack) is counted as half cycles.
+
+    The history is read in chunks of chunk_size samples, so a memory-mapped history
+    (np.memmap / np.load(..., mmap_mode='r')) is never fully loaded to memory
+
+    :param np.ndarray series: The stress history
+    :param int chunk_size: Number of samples read at once
+    :param float hysteresis: The gate, cycles with a smaller range are removed before
+        counting (see :func:`me_toolbox.fatigue.peak_valley.peak_valley`)
+
+    :returns: The count (1 or 0.5), range and mean of every counted cycle,
+        the full cycles first (in the order they closed) followed by the residual half cycles
+    :rtype: Cycles
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    series = np.asarray(series).reshape(-1)
+
+    counter = RainflowCounter(hysteresis)
+    counted = [counter.update(series[start:start + chunk_size])
+               for start in range(0, series.size, chunk_size)]
+    counted.append(counter.residual())
+    return Cycles(*(np.concatenate(values) for values in zip(*counted)))
+
+
+class RainflowCounter:
+    """Streaming rainflow counting, the history is fed in consecutive chunks
+    and the unclosed residual is carried from chunk to chunk, so the full cycles
+    are the same as counting the whole history at once (see :func:`rainflow`)
+    """
+
+    def __init__(self, hysteresis=0):
+        """
+        :param float hysteresis: The gate, cycles with a smaller range are removed before
+            counting
+        """
+        # the peaks and valleys are extracted chunk by chunk, the last ones are held back
+        # until the next chunk shows whether they are reversals
+        self._extractor = PeakValleyExtractor(hysteresis)
+        self._stack = []
+
+    @property
+    def samples(self):
+        """Number of samples counted so far
+
+        :rtype: int
+        """
+        return self._extractor.samples
+
+    def update(self, chunk):
+        """Count the full cycles closed by the next chunk of the history
+
+        :param np.ndarray chunk: The next samples of the stress history
+
+        :returns: The closed full cycles (count of 1)
+        :rtype: Cycles
+        """
+        points = self._extractor.update(chunk).values.tolist()
+        ranges, means, self._stack = _four_point(points, self._stack)
+        return Cycles(np.ones(len(ranges)), np.array(ranges, dtype=float),
+                      np.array(means, dtype=float))
+
+    def residual(self):
+        """The cycles of the current residual (the history so far),
+        the counter isn't changed so more chunks can be fed afterwards
+
+        :returns: The full cycles closed by the last points (count of 1) followed by the
+            residual half cycles (count of 0.5)
+        :rtype: Cycles
+        """
+        # the held back points end the history, the cycles they close are counted
+        # on a copy of the stack
+        closed_ranges, closed_means, residual = _four_point(
+            self._extractor.finish().values.tolist(), list(self._stack))
+        residual = np.array(residual, dtype=float)
+        ranges = np.abs(np.diff(residual))
+        return Cycles(np.concatenate((np.ones(len(closed_ranges)), np.full(ranges.size, 0.5))),
+                      np.concatenate((np.array(closed_ranges, dtype=float), ranges)),
+                      np.concatenate((np.array(closed_means, dtype=float),
+                                      0.5 * (residual[:-1] + residual[1:]))))
+
+
+def stress_groups(cycles):
+    """Convert counted cycles to Miner's rule stress groups
+    [number_of_repetitions, alternating_stress, mean_stress] (alternating = range / 2),
+    to be used with alt_mean=True
+
+    :param Cycles cycles: Counted cycles (see :func:`rainflow`)
+
+    :returns: (N, 3) stress groups array
+    :rtype: np.ndarray
+    """
+    return np.column_stack((cycles.count, 0.5 * np.asarray(cycles.range), cycles.mean))
+
+
+def rainflow_miner(series, Sut, Se, Sy=None, z=-3, mean_stress_correction='goodman'):
+    """Miner's rule damage of a stress history, rainflow counted
+    (see :func:`rainflow` and :meth:`FatigueAnalysis.miner_rule_batch`)
+
+    :param np.ndarray series: The stress history [MPa]
+    :param float Sut: Ultimate tensile strength [MPa]
+    :param float Se: endurance limit [MPa]
+    :param float Sy: yield strength [MPa], if None only HCF is checked
+    :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+        where N=5e8
+    :param str or callable mean_stress_correction: The mean stress correction
+        (see :class:`MeanStressCorrection`)
+
+    :returns: The number of repetitions of the history until failure, and the per cycle
+        damage, life and reversible stress
+    :rtype: me_toolbox.fatigue.fatigue_analysis.MinerResult
+    """
+    return FatigueAnalysis.miner_rule_batch(stress_groups(rainflow(series)), Sut, Se, Sy, z,
+                                            alt_mean=True,
+                                            mean_stress_correction=mean_stress_correction)
+
+
+def _four_point(points, stack=None):
+    """Four-point rainflow counting of turning points, every 4 consecutive points on
+    the stack where the inner range is not larger than the outer ranges close a cycle
+    (the 2 inner points are removed from the stack)
+
+    :param list points: Turning points
+    :param list or None stack: The stack left by a previous call (continued counting)
+
+    :returns: The ranges and means of the closed cycles and the stack (residual)
+    :rtype: tuple[list, list, list]
+    """
+    stack = [] if stack is None else stack
+    ranges, means = [], []
+    push, add_range, add_mean = stack.append, ranges.append, means.append
+    size = len(stack)
+    for point in points:
+        push(point)
+        size += 1
+        while size >= 4:
+            inner_start, inner_end = stack[-3], stack[-2]
+            inner = abs(inner_start - inner_end)
+            if inner > abs(stack[-4] - inner_start) or inner > abs(inner_end - point):
+                break
+            add_range(inner)
+            add_mean(0.5 * (inner_start + inner_end))
+            del stack[-3:-1]
+            size -= 2
+    return ranges, means, stack
@@ -0,0 +1,226 @@
+"""module containing the SNCurve class, the stress-life (S-N) curve of a material
+(Shigley's estimation) with its coefficients computed once per material
+"""
+from functools import lru_cache
+from math import log10, inf
+from numbers import Real
+
+import numpy as np
+
+# number of material curves kept by get_sn_curve
+SN_CURVE_CACHE_SIZE = 128
+
+# the fatigue strength fraction polynomial (highest power first), fitted to the f graph in
+# Shigley's, the range of the fit is ( 70[kPsi] < ultimate_tensile_strength < 200[kPsi] )
+_FATIGUE_STRENGTH_FRACTION = (-2.56710686e-16, 1.35729780e-12, -2.92474777e-09,
+                              3.28990748e-06, -2.04929617e-03, 1.38405394e+00)
+
+
+def calc_Sm(Sut):
+    """Calculate Sm_stress which is the stress at 1e3 cycles, the boundary
+    dividing Low cycle fatigue and high cycle fatigue
+
+    :param float Sut: Ultimate tensile strength
+
+    :returns: Sm_stress stress
+    :rtype: float
+    """
+    if Sut < 482.633:  # 482.633[Mpa] = 70[kPsi]
+        return 0.9 * Sut
+    elif Sut > 1378.95:  # 1378.95[Mpa] = 200[kPsi] which is out of the graph range
+        return 0.75 * Sut
+    c5, c4, c3, c2, c1, c0 = _FATIGUE_STRENGTH_FRACTION
+    f = c5 * Sut ** 5 + c4 * Sut ** 4 + c3 * Sut ** 3 + c2 * Sut ** 2 + c1 * Sut + c0
+    return f * Sut
+
+
+def calc_Sm_batch(Sut):
+    """Vectorized version of :func:`calc_Sm`
+
+    :param np.ndarray Sut: Ultimate tensile strengths
+
+    :returns: Sm_stress stresses
+    :rtype: np.ndarray
+    """
+    Sut = np.asarray(Sut, dtype=float)
+    f = np.polyval(_FATIGUE_STRENGTH_FRACTION, Sut)
+    return np.select([Sut < 482.633, Sut > 1378.95], [0.9 * Sut, 0.75 * Sut], f * Sut)
+
+
+class SNCurve:
+    """The S-N curve of a material, a low cycle fatigue (LCF) line from (1, Sut) to (1e3, Sm)
+    and a high cycle fatigue (HCF) line from (1e3, Sm) to (10**(3 - z), Se),
+    in log-log scale (S = a * N ** b), below Se the life is infinite.
+
+    The material properties may be arrays (broadcast together) to evaluate many materials
+    at once, use :func:`get_sn_curve` to reuse the curves of recently used materials
+
+    Note: zeta = log(N1) - log(N2)
+          N1 - number of cycles at Sm,
+          N2 - Number of cycles at Se (for steel N1=1e3 and N2 = 1e6 -> z=-3)
+    """
+
+    def __init__(self, Sut, Se, Sy=None, z=-3):
+        """Instantiating an S-N curve
+
+        :param float or np.ndarray Sut: Ultimate tensile strength [MPa]
+        :param float or np.ndarray Se: Endurance limit [MPa]
+        :param float or np.ndarray or None Sy: Yield strength [MPa],
+            if None the LCF range isn't checked (stresses above Sm fail at once)
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8,
+            -5.69 for metal where N=5e8
+        """
+        self.Sut, self.Se, self.Sy, self.z = Sut, Se, Sy, z
+        self.is_array = any(np.ndim(value) > 0 for value in (Sut, Se, Sy))
+
+        if self.is_array:
+            self.Sut, self.Se = (_read_only(np.array(value, dtype=float)) for value in (Sut, Se))
+            if Sy is not None:
+                self.Sy = _read_only(np.array(Sy, dtype=float))
+            self.Sm = _read_only(calc_Sm_batch(self.Sut))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.hcf_a = _read_only(self.Sm * (self.Sm / self.Se) ** (-3 / z))
+                self.hcf_b = _read_only((1 / z) * np.log10(self.Sm / self.Se))
+                self.lcf_b = _read_only((1 / z) * np.log10(self.Sut / self.Sm))
+            self.lcf_a = self.Sut
+        else:
+            self.Sm = calc_Sm(Sut)
+            try:
+                self.hcf_a = self.Sm * (self.Sm / Se) ** (-3 / z)
+                self.hcf_b = (1 / z) * log10(self.Sm / Se)
+            except (ZeroDivisionError, ValueError, TypeError):
+                # there is no HCF range (Se <= 0)
+                self.hcf_a, self.hcf_b = np.nan, np.nan
+            try:
+                self.lcf_a, self.lcf_b = Sut, (1 / z) * log10(Sut / self.Sm)
+            except (ZeroDivisionError, ValueError, TypeError):
+                self.lcf_a, self.lcf_b = np.nan, np.nan
+
+    def __repr__(self):
+        return f"SNCurve(Sut={self.Sut}, Se={self.Se}, Sy={self.Sy}, z={self.z})"
+
+    @property
+    def endurance_life(self):
+        """The number of cycles at the endurance limit (the knee of the curve)
+
+        :rtype: float
+        """
+        return 10 ** (3 - self.z)
+
+    def hcf_life(self, stress):
+        """The number of cycles of the HCF line (Basquin's equation) with no range checks
+
+        :param float or np.ndarray stress: Reversible stress [MPa]
+
+        :rtype: float or np.ndarray
+        """
+        return (stress / self.hcf_a) ** (1 / self.hcf_b)
+
+    def life(self, stress):
+        """Number of cycles until failure under a fully reversed stress,
+        infinite below the endurance limit and 0 above Sm (or above Sy if Sy was given)
+
+        :param float or np.ndarray stress: Reversible stress [MPa]
+
+        :returns: Number of cycles
+        :rtype: float or np.ndarray
+
+        :raises ValueError: if the stress is in the LCF range and z isn't -3
+        """
+        if not self.is_array and _is_scalar(stress):
+            return self._scalar_life(stress)
+
+        # without Sy the LCF range is empty (stresses above Sm fail at once)
+        stress, Se, Sm, Sy = np.broadcast_arrays(np.asarray(stress, dtype=float), self.Se,
+                                                 self.Sm, -np.inf if self.Sy is None else self.Sy)
+        low_cycle = (Sm < stress) & (stress < Sy)
+        high_cycle = (Se < stress) & (stress < Sm)
+        infinite = stress < Se
+        self._check_low_cycle(low_cycle.any())
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            a = np.where(low_cycle, self.lcf_a, self.hcf_a)
+            b = np.where(low_cycle, self.lcf_b, self.hcf_b)
+            N = (stress / a) ** (1 / b)
+        return np.where(low_cycle | high_cycle, N, np.where(infinite, np.inf, 0.0))
+
+    def strength(self, life):
+        """The fatigue strength at a number of cycles (the inverse of :meth:`life`),
+        Se at and beyond the endurance life and Sut at a single cycle (or less)
+
+        :param float or np.ndarray life: Number of cycles
+
+        :returns: Fatigue strength [MPa]
+        :rtype: float or np.ndarray
+
+        :raises ValueError: if the life is in the LCF range (N < 1e3) and z isn't -3
+        """
+        if not self.is_array and _is_scalar(life):
+            if life >= self.endurance_life:
+                return self.Se
+            if life >= 1e3:
+                return self.hcf_a * life ** self.hcf_b
+            self._check_low_cycle(True)
+            return self.lcf_a * max(life, 1) ** self.lcf_b
+
+        life = np.asarray(life, dtype=float)
+        low_cycle = life < 1e3
+        self._check_low_cycle(low_cycle.any())
+        with np.errstate(divide='ignore', invalid='ignore'):
+            strength = np.where(low_cycle, self.lcf_a * np.maximum(life, 1) ** self.lcf_b,
+                                self.hcf_a * life ** self.hcf_b)
+        return np.where(life >= self.endurance_life, self.Se, strength)
+
+    def _scalar_life(self, stress):
+        """:meth:`life` of a single stress with a single material"""
+        if self.Sy is not None and self.Sm < stress < self.Sy:
+            self._check_low_cycle(True)
+            return (stress / self.lcf_a) ** (1 / self.lcf_b)
+        elif self.Se < stress < self.Sm:
+            return (stress / self.hcf_a) ** (1 / self.hcf_b)
+        elif stress < self.Se:
+            return inf
+        return 0
+
+    def _check_low_cycle(self, low_cycle):
+        """The LCF line is only defined for z=-3"""
+        if low_cycle and self.z != -3:
+            raise ValueError(f"Number of cycles calculation for low cycle fatigue"
+                             f" is only possible for zeta=-3")
+
+
+@lru_cache(maxsize=SN_CURVE_CACHE_SIZE)
+def _cached_sn_curve(Sut, Se, Sy, z):
+    return SNCurve(Sut, Se, Sy, z)
+
+
+def get_sn_curve(Sut, Se, Sy=None, z=-3):
+    """Returns the S-N curve of a material, the curves of recently used materials are
+    reused (arrays of materials aren't cached), the curves shouldn't be modified
+
+    :param float Sut: Ultimate tensile strength [MPa]
+    :param float Se: Endurance limit [MPa]
+    :param float or None Sy: Yield strength [MPa]
+    :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8,
+        -5.69 for metal where N=5e8
+
+    :rtype: SNCurve
+    """
+    try:
+        return _cached_sn_curve(Sut, Se, Sy, z)
+    except TypeError:
+        # unhashable (array) properties
+        return SNCurve(Sut, Se, Sy, z)
+
+
+def _is_scalar(value):
+    """True for a single value (not an array)"""
+    # checking the exact type first, the abstract Real check is relatively slow
+    return type(value) in (float, int) or isinstance(value, Real) or \
+        (np.ndim(value) == 0 and not isinstance(value, np.ndarray))
+
+
+def _read_only(array):
+    """Mark an array as read-only, curves are shared by the cache"""
+    array.setflags(write=False)
+    return array
@@ -0,0 +1,236 @@
+"""module containing the SpectralFatigue class, fatigue damage of a stationary
+Gaussian stress process from its power spectral density (PSD)
+"""
+from collections import namedtuple
+from math import gamma, sqrt, exp
+
+import numpy as np
+
+from me_toolbox.fatigue.sn_curve import get_sn_curve
+
+# number of Welch segments transformed at once
+SEGMENTS_PER_BATCH = 256
+
+# the spectral moments used by the damage estimations
+SpectralMoments = namedtuple('SpectralMoments', ['m0', 'm1', 'm2', 'm4'])
+
+
+class SpectralFatigue:
+    """Damage rate of a stationary Gaussian stress process from its one-sided PSD with the
+    Narrow-band, Dirlik and Tovo-Benasciutti methods.
+
+    The S-N curve is the HCF line of the material's :class:`SNCurve` written as
+    N = C * S^-k (k = -1/b, C = a^k, S - stress amplitude), extended over all amplitudes
+    (no endurance limit, as usual in spectral methods)
+    """
+
+    def __repr__(self):
+        return f"SpectralFatigue(Sut={self.Sut}, Se={self.Se}, Sy={self.Sy}, z={self.z}, " \
+               f"mean_stress={self.mean_stress})"
+
+    def __init__(self, frequency, psd, Sut, Se, Sy=None, z=-3, mean_stress=0):
+        """Instantiating a spectral fatigue object
+
+        :param np.ndarray frequency: The PSD frequencies [Hz]
+        :param np.ndarray psd: One-sided stress PSD [MPa^2/Hz]
+        :param float Sut: Ultimate tensile strength [MPa]
+        :param float Se: endurance limit [MPa]
+        :param float Sy: yield strength [MPa]
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+            where N=5e8
+        :param float mean_stress: Static mean stress [MPa], a positive mean stress is
+            corrected like :meth:`FatigueAnalysis.calc_num_of_cycles` (σa / (1 - σm/Sut))
+        """
+        self.frequency = np.asarray(frequency, dtype=float)
+        self.psd = np.asarray(psd, dtype=float)
+        self.Sut, self.Se, self.Sy, self.z = Sut, Se, Sy, z
+        self.mean_stress = mean_stress
+        self.moments = self.spectral_moments(self.frequency, self.psd)
+
+        curve = get_sn_curve(Sut, Se, Sy, z)
+        self.k = -1 / curve.hcf_b
+        self.C = curve.hcf_a ** self.k
+
+    @classmethod
+    def from_time_series(cls, series, sample_rate, Sut, Se, Sy=None, z=-3,
+                         segment_length=4096, overlap=0.5):
+        """Instantiating a spectral fatigue object from a stress time series (Welch PSD),
+        the mean of the series is used as the mean stress
+
+        :param np.ndarray series: Stress time series [MPa]
+        :param float sample_rate: Sample rate [Hz]
+        :param float Sut: Ultimate tensile strength [MPa]
+        :param float Se: endurance limit [MPa]
+        :param float Sy: yield strength [MPa]
+        :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for a metal
+            where N=5e8
+        :param int segment_length: Welch segment length (samples)
+        :param float overlap: Welch segments overlap fraction
+
+        :rtype: SpectralFatigue
+        """
+        frequency, psd = cls.welch_psd(series, sample_rate, segment_length, overlap)
+        return cls(frequency, psd, Sut, Se, Sy, z, mean_stress=float(np.mean(series)))
+
+    @staticmethod
+    def spectral_moments(frequency, psd):
+        """Returns the spectral moments m_n = ∫ f^n G(f) df (n = 0, 1, 2, 4)
+
+        :param np.ndarray frequency: The PSD frequencies [Hz]
+        :param np.ndarray psd: One-sided PSD
+
+        :rtype: SpectralMoments
+        """
+        frequency = np.asarray(frequency, dtype=float)
+        psd = np.asarray(psd, dtype=float)
+        # trapezoidal integration (written out, np.trapz was renamed in numpy 2)
+        widths = np.diff(frequency) / 2
+        return SpectralMoments(*(float(np.sum(widths * (values[1:] + values[:-1])))
+                                 for values in (frequency ** n * psd for n in (0, 1, 2, 4))))
+
+    @staticmethod
+    def welch_psd(series, sample_rate, segment_length=4096, overlap=0.5):
+        """One-sided PSD of a time series with Welch's method (Hann window, the mean of every
+        segment removed), the segments are read in batches so memory-mapped multi-hour
+        records aren't loaded to memory at once
+
+        :param np.ndarray series: Time series
+        :param float sample_rate: Sample rate [Hz]
+        :param int segment_length: Segment length (samples)
+        :param float overlap: Segments overlap fraction
+
+        :returns: The frequencies [Hz] and the PSD [units^2/Hz]
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        series = np.asarray(series).reshape(-1)
+        segment_length = min(int(segment_length), series.size)
+        step = max(1, int(round(segment_length * (1 - overlap))))
+        if segment_length < 2:
+            raise ValueError("The series is too short for a PSD")
+
+        window = np.hanning(segment_length + 1)[:-1]  # periodic Hann window
+        starts = range(0, series.size - segment_length + 1, step)
+        psd = np.zeros(segment_length // 2 + 1)
+        for batch in range(0, len(starts), SEGMENTS_PER_BATCH):
+            batch_starts = starts[batch:batch + SEGMENTS_PER_BATCH]
+            chunk = np.asarray(series[batch_starts[0]:batch_starts[-1] + segment_length],
+                               dtype=float)
+            segments = np.lib.stride_tricks.sliding_window_view(chunk, segment_length)[::step]
+            segments = segments - segments.mean(axis=1, keepdims=True)
+            psd += (np.abs(np.fft.rfft(segments * window, axis=1)) ** 2).sum(axis=0)
+
+        psd /= len(starts) * sample_rate * (window ** 2).sum()
+        # one-sided, the DC (and the Nyquist frequency of even lengths) aren't doubled
+        psd[1:-1 if segment_length % 2 == 0 else None] *= 2
+        return np.fft.rfftfreq(segment_length, 1 / sample_rate), psd
+
+    @property
+    def rms(self):
+        """The root mean square of the stress (about the mean)"""
+        return sqrt(self.moments.m0)
+
+    @property
+    def zero_crossing_rate(self):
+        """ν0+ - The rate of up-crossings of the mean [1/s]"""
+        return sqrt(self.moments.m2 / self.moments.m0)
+
+    @property
+    def peak_rate(self):
+        """νp - The rate of peaks [1/s]"""
+        return sqrt(self.moments.m4 / self.moments.m2)
+
+    @property
+    def alpha1(self):
+        """α1 - bandwidth parameter m1 / sqrt(m0 * m2)"""
+        return self.moments.m1 / sqrt(self.moments.m0 * self.moments.m2)
+
+    @property
+    def alpha2(self):
+        """α2 - the irregularity factor m2 / sqrt(m0 * m4) (1 for a narrow-band process)"""
+        return self.moments.m2 / sqrt(self.moments.m0 * self.moments.m4)
+
+    def narrow_band(self):
+        """Narrow-band (Rayleigh amplitudes at the zero up-crossing rate) damage rate,
+        conservative for wide-band processes
+
+        :returns: Damage per second
+        :rtype: float
+        """
+        return self._rayleigh_damage(self.zero_crossing_rate, self.rms)
+
+    def tovo_benasciutti(self):
+        """Tovo-Benasciutti damage rate, a weighted combination of the narrow-band and the
+        range counting damage (with the 2005 weight b)
+
+        :returns: Damage per second
+        :rtype: float
+        """
+        alpha1, alpha2 = self.alpha1, self.alpha2
+        if alpha2 >= 1:
+            return self.narrow_band()
+        b = ((alpha1 - alpha2) *
+             (1.112 * (1 + alpha1 * alpha2 - (alpha1 + alpha2)) * exp(2.11 * alpha2) +
+              (alpha1 - alpha2)) / (alpha2 - 1) ** 2)
+        b = min(max(b, 0), 1)
+        # range counting: Rayleigh amplitudes of rms α2 * sqrt(m0) at the peak rate
+        range_counting = self._rayleigh_damage(self.peak_rate, alpha2 * self.rms)
+        return b * self.narrow_band() + (1 - b) * range_counting
+
+    def dirlik(self):
+        """Dirlik damage rate (the empirical rainflow amplitude distribution of wide-band
+        processes)
+
+        :returns: Damage per second
+        :rtype: float
+        """
+        m0, m1, m2, m4 = self.moments
+        alpha2 = self.alpha2
+        xm = m1 / m0 * sqrt(m2 / m4)
+        D1 = 2 * (xm - alpha2 ** 2) / (1 + alpha2 ** 2)
+        R = (alpha2 - xm - D1 ** 2) / (1 - alpha2 - D1 + D1 ** 2)
+        D2 = (1 - alpha2 - D1 + D1 ** 2) / (1 - R)
+        D3 = 1 - D1 - D2
+        Q = 1.25 * (alpha2 - D3 - D2 * R) / D1
+
+        k = self.k
+        amplitude_moment = m0 ** (k / 2) * (D1 * Q ** k * gamma(1 + k) +
+                                            sqrt(2) ** k * gamma(1 + k / 2) *
+                                            (D2 * abs(R) ** k + D3))
+        return self.peak_rate * amplitude_moment * self._mean_stress_factor() / self.C
+
+    def damage_rate(self, method='dirlik'):
+        """Damage per second with the chosen method
+
+        :param str method: 'dirlik', 'narrow-band' or 'tovo-benasciutti'
+
+        :rtype: float
+        :raises ValueError: if the method is unknown
+        """
+        methods = {'dirlik': self.dirlik, 'narrow-band': self.narrow_band,
+                   'tovo-benasciutti': self.tovo_benasciutti}
+        try:
+            return methods[method.lower()]()
+        except KeyError:
+            raise ValueError(f"Unknown method - {method}, "
+                             f"the methods are 'dirlik', 'narrow-band' and 'tovo-benasciutti'")
+
+    def life(self, method='dirlik'):
+        """The time until failure (damage of 1) [s]
+
+        :param str method: 'dirlik', 'narrow-band' or 'tovo-benasciutti'
+
+        :rtype: float
+        """
+        rate = self.damage_rate(method)
+        return 1 / rate if rate > 0 else float('inf')
+
+    def _rayleigh_damage(self, rate, rms):
+        """Damage rate of Rayleigh distributed amplitudes, E[S^k] = (sqrt(2)*rms)^k Γ(1+k/2)"""
+        amplitude_moment = (sqrt(2) * rms) ** self.k * gamma(1 + self.k / 2)
+        return rate * amplitude_moment * self._mean_stress_factor() / self.C
+
+    def _mean_stress_factor(self):
+        """The damage factor of the mean stress correction of the amplitudes"""
+        if self.mean_stress <= 0:
+            return 1
+        return (1 / (1 - self.mean_stress / self.Sut)) ** self.k
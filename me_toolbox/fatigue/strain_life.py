@@ -0,0 +1,302 @@
+"""module containing the StrainLife class, the strain-life (Coffin-Manson-Basquin) approach
+with mean stress corrections and notch corrections, the equations are solved by a vectorized
+Newton-Raphson iteration over arrays of loads
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# Newton-Raphson defaults
+TOLERANCE = 1e-10
+MAX_ITERATIONS = 100
+
+# the result of a solve with full_output=True
+Solution = namedtuple('Solution', ['value', 'converged', 'iterations'])
+
+# the local stress and strain at a notch root
+NotchResult = namedtuple('NotchResult', ['stress', 'strain'])
+
+
+class StrainLife:
+    """The strain-life curve of a material (Coffin-Manson-Basquin):
+    εa = σf'/E * (2N)^b + εf' * (2N)^c
+    and its cyclic stress-strain curve (Ramberg-Osgood): εa = σa/E + (σa/K')^(1/n')
+
+    .. code-block:: python
+
+        steel = StrainLife(E=200e3, fatigue_strength_coefficient=1000,
+                           fatigue_strength_exponent=-0.08, fatigue_ductility_coefficient=0.6,
+                           fatigue_ductility_exponent=-0.6, cyclic_strength_coefficient=1100,
+                           cyclic_strain_hardening_exponent=0.15)
+        steel.life([0.002, 0.004, 0.01], mean_stress=50, correction='morrow')
+        steel.notch_life(nominal_amplitude=150, nominal_mean=50, Kt=2.5)
+    """
+
+    def __init__(self, E, fatigue_strength_coefficient, fatigue_strength_exponent,
+                 fatigue_ductility_coefficient, fatigue_ductility_exponent,
+                 cyclic_strength_coefficient=None, cyclic_strain_hardening_exponent=None):
+        """Instantiating a strain-life curve
+
+        :param float E: Young's modulus [MPa]
+        :param float fatigue_strength_coefficient: σf' [MPa]
+        :param float fatigue_strength_exponent: b (negative)
+        :param float fatigue_ductility_coefficient: εf'
+        :param float fatigue_ductility_exponent: c (negative)
+        :param float or None cyclic_strength_coefficient: K' [MPa] (for the notch correction)
+        :param float or None cyclic_strain_hardening_exponent: n' (for the notch correction)
+        """
+        self.E = E
+        self.Sf = fatigue_strength_coefficient
+        self.b = fatigue_strength_exponent
+        self.ef = fatigue_ductility_coefficient
+        self.c = fatigue_ductility_exponent
+        self.K = cyclic_strength_coefficient
+        self.n = cyclic_strain_hardening_exponent
+
+    def __repr__(self):
+        return f"StrainLife(E={self.E}, Sf={self.Sf}, b={self.b}, ef={self.ef}, c={self.c}, " \
+               f"K={self.K}, n={self.n})"
+
+    @property
+    def transition_life(self):
+        """The number of cycles where the elastic and plastic strains are equal
+
+        :rtype: float
+        """
+        return ((self.ef * self.E / self.Sf) ** (1 / (self.b - self.c))) / 2
+
+    def strain_amplitude(self, life, mean_stress=0, correction=None):
+        """The strain amplitude of a life (the inverse of :meth:`life`), with the SWT
+        correction the result is the SWT parameter σmax * εa
+
+        :param float or np.ndarray life: Number of cycles
+        :param float or np.ndarray mean_stress: Mean stress [MPa] (for 'morrow')
+        :param str or None correction: None, 'morrow' or 'swt'
+
+        :rtype: float or np.ndarray
+        """
+        A, B, b, c = self._coefficients(np.asarray(mean_stress, dtype=float), correction)
+        reversals = 2 * np.asarray(life, dtype=float)
+        return _to_scalar(A * reversals ** b + B * reversals ** c)
+
+    def life(self, strain_amplitude, mean_stress=0, max_stress=None, correction=None,
+             tol=TOLERANCE, max_iterations=MAX_ITERATIONS, full_output=False):
+        """Number of cycles until crack initiation under a strain amplitude
+
+        Corrections:
+            None: εa = σf'/E * (2N)^b + εf' * (2N)^c
+            'morrow': εa = (σf' - σm)/E * (2N)^b + εf' * (2N)^c
+            'swt': σmax * εa = σf'^2/E * (2N)^2b + σf' * εf' * (2N)^(b+c)
+
+        The equation is solved for log(2N) by Newton-Raphson on the whole array, points stop
+        being iterated once converged
+
+        :param float or np.ndarray strain_amplitude: Strain amplitude
+        :param float or np.ndarray mean_stress: Mean stress [MPa]
+        :param float or np.ndarray or None max_stress: Maximum stress [MPa] for 'swt'
+            (if None it is the cyclic curve stress amplitude plus the mean stress)
+        :param str or None correction: None, 'morrow' or 'swt'
+        :param float tol: Convergence tolerance of log(2N)
+        :param int max_iterations: Maximum number of iterations
+        :param bool full_output: Return the convergence mask and number of iterations too
+
+        :returns: Number of cycles (inf for a non-positive load, 0 if the mean stress
+            exceeds σf', nan where the iteration didn't converge)
+        :rtype: float or np.ndarray or Solution
+        """
+        strain_amplitude = np.asarray(strain_amplitude, dtype=float)
+        mean_stress = np.asarray(mean_stress, dtype=float)
+        if correction is not None and correction.lower() == 'swt':
+            if max_stress is None:
+                max_stress = self.stress_amplitude(strain_amplitude) + mean_stress
+            target = np.asarray(max_stress, dtype=float) * strain_amplitude
+        else:
+            target = strain_amplitude
+
+        A, B, b, c = self._coefficients(mean_stress, correction)
+        target, A = np.broadcast_arrays(target, A)
+        solution = _solve_life(target.astype(float), A.astype(float), B, b, c, tol,
+                               max_iterations)
+        if full_output:
+            return solution
+        return solution.value
+
+    def stress_amplitude(self, strain_amplitude, tol=TOLERANCE, max_iterations=MAX_ITERATIONS):
+        """The stress amplitude of the cyclic stress-strain curve (Ramberg-Osgood)
+
+        :param float or np.ndarray strain_amplitude: Strain amplitude
+        :param float tol: Relative convergence tolerance of the stress
+        :param int max_iterations: Maximum number of iterations
+
+        :rtype: float or np.ndarray
+        """
+        self._check_cyclic_curve()
+        strain = np.abs(np.asarray(strain_amplitude, dtype=float))
+        flat_strain = strain.reshape(-1)
+        E, K, n = self.E, self.K, self.n
+
+        def residual(stress, index):
+            plastic = (stress / K) ** (1 / n)
+            return stress / E + plastic - flat_strain[index], 1 / E + plastic / (n * stress)
+
+        # the root is below both the elastic and the plastic only solutions
+        with np.errstate(divide='ignore'):
+            start = np.minimum(E * strain, K * strain ** n)
+        solution = _newton(residual, start, strain > 0, tol * np.maximum(start, 1),
+                           max_iterations)
+        stress = np.where(strain == 0, 0.0, solution.value)
+        return _to_scalar(np.copysign(stress, strain_amplitude))
+
+    def strain(self, stress_amplitude):
+        """The strain amplitude of the cyclic stress-strain curve (Ramberg-Osgood)
+
+        :param float or np.ndarray stress_amplitude: Stress amplitude [MPa]
+
+        :rtype: float or np.ndarray
+        """
+        self._check_cyclic_curve()
+        stress = np.asarray(stress_amplitude, dtype=float)
+        return _to_scalar(stress / self.E +
+                          np.sign(stress) * (np.abs(stress) / self.K) ** (1 / self.n))
+
+    def notch(self, nominal_stress, Kt, method='neuber', tol=TOLERANCE,
+              max_iterations=MAX_ITERATIONS):
+        """The local stress and strain at a notch root from the elastic nominal stress
+        (applied to amplitudes it gives the local amplitudes by Masing's rule)
+
+        Methods:
+            'neuber': σ * ε = (Kt * S)^2 / E
+            'glinka': σ^2 / (2E) + σ/(n'+1) * (σ/K')^(1/n') = (Kt * S)^2 / (2E)
+
+        :param float or np.ndarray nominal_stress: Nominal stress [MPa]
+        :param float or np.ndarray Kt: Stress concentration factor
+        :param str method: 'neuber' or 'glinka'
+        :param float tol: Relative convergence tolerance of the stress
+        :param int max_iterations: Maximum number of iterations
+
+        :rtype: NotchResult
+        :raises ValueError: if the method is unknown
+        """
+        self._check_cyclic_curve()
+        E, K, n = self.E, self.K, self.n
+        nominal_stress = np.asarray(nominal_stress, dtype=float)
+        elastic, plastic = {'neuber': (1, 1), 'glinka': (1 / 2, 1 / (n + 1))}.get(
+            method.lower(), (None, None))
+        if elastic is None:
+            raise ValueError(f"Unknown method - {method}, the methods are 'neuber' and 'glinka'")
+
+        target = elastic * np.abs(np.asarray(Kt, dtype=float) * nominal_stress) ** 2 / E
+        target = np.broadcast_to(target, np.broadcast(target, nominal_stress).shape)
+        flat_target = target.reshape(-1)
+
+        def residual(stress, index):
+            strain_energy = plastic * stress * (stress / K) ** (1 / n)
+            return (elastic * stress ** 2 / E + strain_energy - flat_target[index],
+                    2 * elastic * stress / E + (1 + 1 / n) * strain_energy / stress)
+
+        # the root is below both the elastic and the plastic only solutions
+        start = np.minimum(np.sqrt(target * E / elastic),
+                           (target * K ** (1 / n) / plastic) ** (n / (n + 1)))
+        solution = _newton(residual, start, target > 0, tol * np.maximum(start, 1),
+                           max_iterations)
+        stress = np.copysign(np.where(target == 0, 0.0, solution.value), nominal_stress)
+        return NotchResult(_to_scalar(stress), self.strain(stress))
+
+    def notch_life(self, nominal_amplitude, nominal_mean=0, Kt=1, method='neuber',
+                   correction='swt'):
+        """Number of cycles until crack initiation at a notch root, the local amplitudes are
+        found with the notch rule on the nominal amplitude and the local maximum stress with
+        the notch rule on the nominal maximum stress
+
+        :param float or np.ndarray nominal_amplitude: Nominal stress amplitude [MPa]
+        :param float or np.ndarray nominal_mean: Nominal mean stress [MPa]
+        :param float or np.ndarray Kt: Stress concentration factor
+        :param str method: 'neuber' or 'glinka'
+        :param str or None correction: None, 'morrow' or 'swt'
+
+        :rtype: float or np.ndarray
+        """
+        local = self.notch(nominal_amplitude, Kt, method)
+        max_stress = self.notch(np.add(nominal_amplitude, nominal_mean), Kt, method).stress
+        return self.life(local.strain, mean_stress=np.subtract(max_stress, local.stress),
+                         max_stress=max_stress, correction=correction)
+
+    def _coefficients(self, mean_stress, correction):
+        """The coefficients of A * (2N)^b + B * (2N)^c of the corrected life equation"""
+        if correction is None or correction.lower() == 'none':
+            return np.full(mean_stress.shape, self.Sf / self.E), self.ef, self.b, self.c
+        elif correction.lower() == 'morrow':
+            return (self.Sf - mean_stress) / self.E, self.ef, self.b, self.c
+        elif correction.lower() == 'swt':
+            return (np.full(mean_stress.shape, self.Sf ** 2 / self.E), self.Sf * self.ef,
+                    2 * self.b, self.b + self.c)
+        raise ValueError(f"Unknown correction - {correction}, "
+                         f"the corrections are None, 'morrow' and 'swt'")
+
+    def _check_cyclic_curve(self):
+        """The cyclic stress-strain curve needs K' and n'"""
+        if self.K is None or self.n is None:
+            raise ValueError("The cyclic strength coefficient and the cyclic strain hardening "
+                             "exponent are needed for the cyclic stress-strain curve")
+
+
+def _solve_life(target, A, B, b, c, tol, max_iterations):
+    """Solve A * (2N)^b + B * (2N)^c = target for N, in x = log(2N) the left side is
+    convex and decreasing so Newton's iteration from the left of the root doesn't overshoot
+    """
+    solvable = (target > 0) & (A > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_target = np.log(target)
+        # each term alone is smaller than the target, the root is right of both solutions
+        start = np.maximum((log_target - np.log(A)) / b, (log_target - np.log(B)) / c)
+    start = np.where(solvable, start, 0.0)
+    flat_A, flat_log_target = A.reshape(-1), log_target.reshape(-1)
+
+    def residual(x, index):
+        elastic, plastic = flat_A[index] * np.exp(b * x), B * np.exp(c * x)
+        total = elastic + plastic
+        return np.log(total) - flat_log_target[index], (b * elastic + c * plastic) / total
+
+    solution = _newton(residual, start, solvable, tol, max_iterations)
+    life = np.exp(solution.value) / 2
+    # no damage for a non-positive load, failure at once if the mean stress exceeds σf'
+    life = np.where(target <= 0, np.inf, np.where(A <= 0, 0.0, life))
+    return Solution(_to_scalar(life), _to_scalar(solution.converged | ~solvable),
+                    solution.iterations)
+
+
+def _newton(residual, start, active, tol, max_iterations):
+    """Vectorized Newton-Raphson, only the points that haven't converged are iterated
+
+    :param residual: function of (x, index) returning the residual and its derivative at the
+        points x (the points index of the full array)
+    :param np.ndarray start: The initial guesses
+    :param np.ndarray active: The points to solve (the rest are returned as nan)
+    :param float or np.ndarray tol: The step size tolerance
+    :param int max_iterations: Maximum number of iterations
+
+    :rtype: Solution
+    """
+    x = np.array(start, dtype=float)
+    active = np.broadcast_to(active, x.shape)
+    tol = np.broadcast_to(tol, x.shape)
+    flat_x, flat_tol = x.reshape(-1), tol.reshape(-1)
+    converged = np.zeros(x.size, dtype=bool)
+    index = np.flatnonzero(active)
+    iterations = 0
+    while index.size and iterations < max_iterations:
+        iterations += 1
+        value, derivative = residual(flat_x[index], index)
+        step = value / derivative
+        flat_x[index] -= step
+        done = np.abs(step) <= flat_tol[index]
+        converged[index[done]] = True
+        index = index[~done & np.isfinite(flat_x[index])]
+
+    flat_x[~converged] = np.nan
+    return Solution(x, converged.reshape(x.shape), iterations)
+
+
+def _to_scalar(value):
+    """Return 0-d arrays as floats"""
+    return value[()] if isinstance(value, np.ndarray) and value.ndim == 0 else value
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from me_toolbox.fatigue import CriticalPlane
+from me_toolbox.tools import stress_tensor
+
+
+class TestCriticalPlane(unittest.TestCase):
+    def setUp(self):
+        time = np.linspace(0, 2 * np.pi, 101)
+        self.bending = stress_tensor(200 * np.sin(time))
+        self.torsion = stress_tensor(0, txy=100 * np.sin(time))
+        # 90° out of phase bending and torsion (non-proportional)
+        self.out_of_phase = stress_tensor(200 * np.sin(time), txy=100 * np.cos(time))
+        self.k = 0.3
+
+    def test_findley(self):
+        k = self.k
+        result = CriticalPlane.findley(self.bending, k)
+        self.assertAlmostEqual(result.damage_parameter, 100 * (k + np.sqrt(1 + k ** 2)),
+                               places=3)
+        result = CriticalPlane.findley(self.torsion, k, fatigue_limit=120)
+        self.assertAlmostEqual(result.damage_parameter, 100 * np.sqrt(1 + k ** 2), places=2)
+        self.assertAlmostEqual(result.safety_factor, 120 / result.damage_parameter)
+
+    def test_matake(self):
+        result = CriticalPlane.matake(self.bending, self.k)
+        self.assertAlmostEqual(result.shear_amplitude, 100, places=3)
+        self.assertAlmostEqual(result.max_normal_stress, 100, places=2)
+        # the maximum shear planes of bending are at 45°
+        self.assertAlmostEqual(abs(result.normal[0]), np.sqrt(0.5), places=2)
+
+    def test_fatemi_socie(self):
+        stress = CriticalPlane.fatemi_socie(self.out_of_phase, 0.5, 400)
+        strain = CriticalPlane.fatemi_socie(self.out_of_phase, 0.5, 400, shear_modulus=80e3)
+        self.assertAlmostEqual(strain.damage_parameter * 80e3, stress.damage_parameter)
+        # the out of phase loading is more damaging than each of its components
+        self.assertGreater(stress.damage_parameter,
+                           CriticalPlane.fatemi_socie(self.torsion, 0.5, 400).damage_parameter)
+
+    def test_plane_stresses(self):
+        # a circular shear path on the x plane
+        time = np.linspace(0, 2 * np.pi, 361)
+        circle = stress_tensor(0, txy=50 * np.sin(time), txz=50 * np.cos(time))
+        shear_amplitude, max_normal_stress = CriticalPlane.plane_stresses(
+            circle, [[1, 0, 0], [0, 0, 1]])
+        np.testing.assert_allclose(shear_amplitude, [50, 50])
+        np.testing.assert_allclose(max_normal_stress, [0, 0], atol=1e-12)
+
+    def test_normals(self):
+        normals = CriticalPlane.fibonacci_normals(100)
+        np.testing.assert_allclose(np.linalg.norm(normals, axis=1), 1)
+        self.assertTrue((normals[:, 2] > 0).all())
+        self.assertIs(normals, CriticalPlane.fibonacci_normals(100))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from me_toolbox.fatigue import RangeMeanMatrix
+from me_toolbox.fatigue.rainflow import rainflow, rainflow_miner, Cycles
+
+
+class TestRangeMeanMatrix(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        size = 50000
+        self.series = 100 * np.sin(0.3 * np.arange(size)) * rng.random(size) + \
+            50 * rng.normal(size=size)
+        self.range_edges = np.linspace(0, 600, 61)
+        self.mean_edges = np.linspace(-250, 250, 51)
+
+    def test_from_cycles(self):
+        cycles = Cycles(np.array([1, 0.5, 2, 1]), np.array([10, 15, 100, 700]),
+                        np.array([0, 5, -20, 0]))
+        matrix = RangeMeanMatrix.from_cycles(cycles, self.range_edges, self.mean_edges)
+        self.assertEqual(matrix.total_cycles, 3.5)
+        self.assertEqual(matrix.out_of_range, 1)
+        self.assertEqual(matrix.counts[1, 25], 1.5)
+        self.assertEqual(matrix.counts[10, 23], 2)
+
+        matrix = RangeMeanMatrix.from_cycles(cycles, range_bins=7, mean_bins=5)
+        self.assertEqual(matrix.counts.shape, (7, 5))
+        self.assertEqual((matrix.total_cycles, matrix.out_of_range), (4.5, 0))
+
+    def test_from_series(self):
+        expected = RangeMeanMatrix.from_cycles(rainflow(self.series), self.range_edges,
+                                               self.mean_edges)
+        for chunk_size in (1000, 10 ** 6):
+            matrix = RangeMeanMatrix.from_series(self.series, self.range_edges, self.mean_edges,
+                                                 chunk_size=chunk_size)
+            np.testing.assert_allclose(matrix.counts, expected.counts)
+        chunks = np.array_split(self.series, 7)
+        matrix = RangeMeanMatrix.from_series(chunks, self.range_edges, self.mean_edges)
+        np.testing.assert_allclose(matrix.counts, expected.counts)
+        with self.assertRaises(ValueError):
+            RangeMeanMatrix.from_series(iter(chunks))
+
+        # the default edges span the history
+        matrix = RangeMeanMatrix.from_series(self.series)
+        self.assertEqual(matrix.out_of_range, 0)
+        self.assertEqual(matrix.total_cycles, expected.total_cycles + expected.out_of_range)
+
+    def test_miner_rule(self):
+        matrix = RangeMeanMatrix.from_series(self.series, np.linspace(0, 600, 241),
+                                             self.mean_edges)
+        expected = rainflow_miner(self.series, Sut=480, Se=90, Sy=410)
+        result = matrix.miner_rule(Sut=480, Se=90, Sy=410)
+        self.assertAlmostEqual(result.total_life / expected.total_life, 1, delta=0.01)
+        self.assertLess(matrix.miner_rule(Sut=480, Se=90, Sy=410, conservative=True).total_life,
+                        expected.total_life)
+        # 100 repetitions of the spectrum last 100 times less repetitions
+        self.assertAlmostEqual(matrix.scale(100).miner_rule(Sut=480, Se=90, Sy=410).total_life,
+                               result.total_life / 100)
+        self.assertLess(matrix.miner_rule(Sut=480, Se=90, Sy=410,
+                                          mean_stress_correction='gerber').damage.sum(),
+                        result.damage.sum())
+
+    def test_merge_and_save(self):
+        halves = [RangeMeanMatrix.from_series(half, self.range_edges, self.mean_edges)
+                  for half in np.array_split(self.series, 2)]
+        merged = RangeMeanMatrix.merge(halves)
+        self.assertAlmostEqual(merged.total_cycles, sum(half.total_cycles for half in halves))
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f'matrix{i}.npz') for i in range(2)]
+            for half, path in zip(halves, paths):
+                half.save(path)
+            loaded = RangeMeanMatrix.load(paths[0])
+            np.testing.assert_array_equal(loaded.counts, halves[0].counts)
+            np.testing.assert_array_equal(loaded.range_edges, self.range_edges)
+            np.testing.assert_array_equal(RangeMeanMatrix.merge(paths).counts, merged.counts)
+
+        with self.assertRaises(ValueError):
+            RangeMeanMatrix.merge([halves[0], RangeMeanMatrix(self.range_edges[:-1],
+                                                               self.mean_edges)])
+        with self.assertRaises(ValueError):
+            RangeMeanMatrix.merge([])
+
+    def test_extrapolate(self):
+        matrix = RangeMeanMatrix.from_series(self.series, self.range_edges, self.mean_edges)
+        extrapolated = matrix.extrapolate(1000)
+        measured_bins = np.flatnonzero(matrix.counts.sum(axis=1))[-1] + 1
+        # the measured bins are scaled, larger ranges are added to the tail
+        np.testing.assert_allclose(extrapolated.counts[:measured_bins],
+                                   matrix.counts[:measured_bins] * 1000)
+        self.assertGreater(extrapolated.range_edges[-1], self.range_edges[-1])
+        self.assertGreater(extrapolated.counts[measured_bins:].sum(), 0)
+        self.assertLess(extrapolated.miner_rule(Sut=480, Se=90, Sy=410).total_life,
+                        matrix.scale(1000).miner_rule(Sut=480, Se=90, Sy=410).total_life)
+        with self.assertRaises(ValueError):
+            RangeMeanMatrix(self.range_edges, self.mean_edges).extrapolate(10)
+
+    def test_extrapolate_wide_edges(self):
+        # edges beyond the data get the same tail in their empty bins
+        wide_edges = np.linspace(0, 1200, 121)
+        wide = RangeMeanMatrix.from_series(self.series, wide_edges, self.mean_edges)
+        narrow = RangeMeanMatrix.from_series(self.series, self.range_edges, self.mean_edges)
+        extrapolated = wide.extrapolate(1000)
+        np.testing.assert_array_equal(extrapolated.range_edges, wide_edges)
+        added = extrapolated.total_cycles - wide.total_cycles * 1000
+        self.assertGreater(added, 0)
+        self.assertAlmostEqual(added, narrow.extrapolate(1000).total_cycles -
+                               narrow.total_cycles * 1000)
+
+    def test_edges(self):
+        with self.assertRaises(ValueError):
+            RangeMeanMatrix([0, 10, 5], self.mean_edges)
+        with self.assertRaises(ValueError):
+            RangeMeanMatrix(self.range_edges, self.mean_edges, counts=np.zeros((2, 2)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from math import inf
+
+import numpy as np
+
+from me_toolbox.fatigue import DamageAccumulator
+from me_toolbox.fatigue.rainflow import rainflow_miner
+
+
+class TestDamageAccumulator(unittest.TestCase):
+    def setUp(self):
+        self.series = np.random.default_rng(0).normal(size=5000) * 120
+        self.properties = dict(Sut=480, Se=90, Sy=410, z=-5.69)
+        self.expected = 1 / rainflow_miner(self.series, **self.properties).total_life
+
+    def test_chunks(self):
+        accumulator = DamageAccumulator(**self.properties)
+        for start in range(0, self.series.size, 777):
+            accumulator.update(self.series[start:start + 777])
+        self.assertAlmostEqual(accumulator.damage, self.expected)
+        self.assertAlmostEqual(accumulator.life, 1 / self.expected)
+        self.assertEqual(accumulator.samples, self.series.size)
+
+    def test_generator(self):
+        accumulator = DamageAccumulator(**self.properties)
+        damage = accumulator.consume(chunk for chunk in np.array_split(self.series, 13))
+        self.assertAlmostEqual(damage, self.expected)
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            raw_path = os.path.join(directory, 'history.bin')
+            self.series.astype('float32').tofile(raw_path)
+            npy_path = os.path.join(directory, 'history.npy')
+            np.save(npy_path, self.series)
+
+            accumulator = DamageAccumulator(**self.properties)
+            self.assertAlmostEqual(accumulator.consume_file(npy_path, chunk_size=1000),
+                                   self.expected)
+            accumulator.reset()
+            self.assertAlmostEqual(accumulator.consume_file(raw_path, dtype='float32'),
+                                   self.expected, places=5)
+
+    def test_remaining_life(self):
+        accumulator = DamageAccumulator(**self.properties, sample_rate=1000)
+        self.assertEqual(accumulator.remaining_life, inf)
+        accumulator.consume(self.series)
+        damage = accumulator.damage
+        self.assertAlmostEqual(accumulator.remaining_life, (1 - damage) / damage * 5)
+        # below the endurance limit
+        accumulator = DamageAccumulator(**self.properties)
+        accumulator.consume(self.series / 10)
+        self.assertEqual((accumulator.damage, accumulator.life), (0, inf))
+
+    def test_overload(self):
+        # cycles above Sy fail at once, adding them never lowers the damage
+        accumulator = DamageAccumulator(**self.properties)
+        with redirect_stdout(StringIO()) as output:
+            accumulator.consume(np.tile([0, 450, -450], 1000), chunk_size=500)
+        self.assertIn('failure is expected', output.getvalue())
+        self.assertEqual(output.getvalue().count('NOTE'), 1)
+        self.assertGreater(accumulator.overload_cycles, 0)
+        self.assertEqual((accumulator.damage, accumulator.life), (inf, 0))
+        self.assertEqual(accumulator.remaining_life, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from itertools import product
+
+import numpy as np
+
+from me_toolbox.fatigue import EnduranceLimit
+from me_toolbox.fatigue.endurance_limit import SURFACE_FINISHES, STRESS_TYPES
+
+
+class TestMarinFactorsBatch(unittest.TestCase):
+    def test_matches_scalar(self):
+        designs = list(product(SURFACE_FINISHES, STRESS_TYPES, (True, False), (10, 30, 120),
+                               (20, 400), (50, 99.9)))
+        finish, stress_type, rotating, diameter, temp, reliability = map(np.array, zip(*designs))
+        batch = EnduranceLimit.marin_factors_batch(
+            350, 700, EnduranceLimit.encode_surface_finish(finish), rotating, 0, 100,
+            EnduranceLimit.encode_stress_type(stress_type), temp, reliability,
+            diameter=diameter)
+        for i, design in enumerate(designs):
+            limit = EnduranceLimit(350, 700, design[0], design[2], 0, 100, design[1], design[4],
+                                   design[5], diameter=design[3])
+            np.testing.assert_allclose([factor[i] for factor in batch],
+                                       limit.get_factors(verbose=False) + (limit.modified,))
+
+    def test_size_factor(self):
+        # axial loading, out of range size and a rectangular cross-section
+        batch = EnduranceLimit.marin_factors_batch(
+            350, 700, 'ground', False, [100, 0, 0], 100, 'axial', 20, 50,
+            height=[10, 1, 10], width=[10, 1, 20])
+        np.testing.assert_allclose(batch.Kb[[0, 2]],
+                                   [1, EnduranceLimit(350, 700, 'ground', False, 0, 100, 'axial',
+                                                      20, 50, height=10, width=20).Kb])
+        self.assertTrue(np.isnan(batch.Kb[1]) and np.isnan(batch.modified[1]))
+        with self.assertRaises(ValueError):
+            EnduranceLimit.marin_factors_batch(350, 700, 'ground', False, 0, 100, 'axial', 20, 50)
+
+    def test_mixed_cross_sections(self):
+        # a round (rotating) and a rectangular design in the same sweep
+        batch = EnduranceLimit.marin_factors_batch(
+            350, 700, 'ground', True, 0, 100, 'bending', 20, 50,
+            diameter=[20, np.nan], height=[10, 10], width=[10, 20])
+        expected = [EnduranceLimit(350, 700, 'ground', True, 0, 100, 'bending', 20, 50,
+                                   diameter=20),
+                    EnduranceLimit(350, 700, 'ground', True, 0, 100, 'bending', 20, 50,
+                                   height=10, width=20)]
+        np.testing.assert_allclose(batch.Kb, [limit.Kb for limit in expected])
+        np.testing.assert_allclose(batch.modified, [limit.modified for limit in expected])
+        with self.assertRaises(ValueError):
+            EnduranceLimit.marin_factors_batch(350, 700, 'ground', True, 0, 100, 'bending', 20,
+                                               50, diameter=[20, np.nan])
+
+    def test_encoding(self):
+        codes = EnduranceLimit.encode_surface_finish([['ground', 'as forged'], ['machined'] * 2])
+        np.testing.assert_array_equal(codes, [[0, 4], [1, 1]])
+        np.testing.assert_array_equal(EnduranceLimit.encode_stress_type(codes), codes)
+        with self.assertRaises(KeyError):
+            EnduranceLimit.encode_surface_finish(['ground', 'polished'])
+        with self.assertRaises(KeyError):
+            EnduranceLimit.encode_stress_type([5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import warnings
+
+import numpy as np
+
+from me_toolbox.fatigue import FailureCriteria
+
+
+class TestFailureCriteriaBatch(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.alt = rng.uniform(10, 300, 200)
+        self.mean = rng.uniform(-200, 300, 200)
+        self.Sy, self.Sut, self.Se = 410, 480, 90
+
+    def test_matches_scalar(self):
+        for criterion in ('Modified Goodman', 'Soderberg', 'Gerber', 'ASME-elliptic'):
+            nf, ns = FailureCriteria.get_safety_factors_batch(self.Sy, self.Sut, self.Se,
+                                                              self.alt, self.mean, criterion)
+            for i, (alt, mean) in enumerate(zip(self.alt, self.mean)):
+                expected_nf, expected_ns = FailureCriteria.get_safety_factors(
+                    self.Sy, self.Sut, self.Se, alt, mean, criterion)
+                self.assertAlmostEqual(nf[i], expected_nf, msg=criterion)
+                self.assertAlmostEqual(ns[i], expected_ns, msg=criterion)
+
+    def test_zero_alternating_stress(self):
+        mean = np.array([100., 200.])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            nf, _ = FailureCriteria.get_safety_factors_batch(self.Sy, self.Sut, self.Se,
+                                                             np.zeros(2), mean, 'gerber')
+        # a static mean stress (Gerber parabola at σa = 0)
+        np.testing.assert_allclose(nf, self.Sut / mean)
+        self.assertAlmostEqual(FailureCriteria.gerber(self.Sut, self.Se, 0, 100), self.Sut / 100)
+        for criterion in ('modified goodman', 'soderberg', 'asme-elliptic'):
+            nf, _ = FailureCriteria.get_safety_factors_batch(self.Sy, self.Sut, self.Se,
+                                                             np.zeros(2), mean, criterion)
+            self.assertTrue(np.all(np.isfinite(nf)), msg=criterion)
+
+    def test_broadcasting(self):
+        Se = np.array([[80.], [90.]])
+        nf, ns = FailureCriteria.get_safety_factors_batch(self.Sy, self.Sut, Se, self.alt,
+                                                          self.mean, 'gerber')
+        self.assertEqual(nf.shape, (2, 200))
+        self.assertEqual(ns.shape, (2, 200))
+
+    def test_unknown_criterion(self):
+        with self.assertRaises(Exception):
+            FailureCriteria.get_safety_factors_batch(self.Sy, self.Sut, self.Se, self.alt,
+                                                     self.mean, 'unknown')
+
+
+class TestHaighDiagram(unittest.TestCase):
+    def setUp(self):
+        self.mean = np.linspace(-200, 400, 13)
+        self.alt = np.linspace(10, 300, 30)
+        self.diagram = FailureCriteria.haigh_diagram(410, 480, 90, self.mean, self.alt)
+
+    def test_matches_batch(self):
+        self.assertEqual(self.diagram.mean.shape, (30, 13))
+        for criterion, field in (('Modified Goodman', 'modified_goodman'),
+                                 ('Soderberg', 'soderberg'), ('Gerber', 'gerber'),
+                                 ('ASME-elliptic', 'asme_elliptic')):
+            nf, ns = FailureCriteria.get_safety_factors_batch(
+                410, 480, 90, self.diagram.alt, self.diagram.mean, criterion)
+            np.testing.assert_allclose(getattr(self.diagram, field), nf)
+            np.testing.assert_allclose(self.diagram.langer, ns)
+
+    def test_no_nan(self):
+        # the docstring's grid, including the σa = 0 row
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            diagram = FailureCriteria.haigh_diagram(410, 480, 85, np.linspace(-400, 600, 501),
+                                                    np.linspace(0, 400, 201))
+        positive_mean = diagram.mean > 0
+        for field in ('modified_goodman', 'soderberg', 'gerber', 'asme_elliptic', 'langer'):
+            self.assertFalse(np.isnan(getattr(diagram, field)[positive_mean]).any(), msg=field)
+        np.testing.assert_allclose(diagram.gerber[0, positive_mean[0]],
+                                   480 / diagram.mean[0, positive_mean[0]])
+
+    def test_cache(self):
+        self.assertIs(FailureCriteria.haigh_diagram(410, 480, 90, self.mean, self.alt),
+                      self.diagram)
+        self.assertIsNot(FailureCriteria.haigh_diagram(410, 480, 80, self.mean, self.alt),
+                         self.diagram)
+        with self.assertRaises(ValueError):
+            self.diagram.gerber[0, 0] = 1
+
+
+if __name__ == '__main__':
+    unittest.main()
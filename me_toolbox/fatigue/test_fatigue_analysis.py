@@ -0,0 +1,123 @@
+import unittest
+from contextlib import redirect_stdout
+from copy import deepcopy
+from io import StringIO
+from math import inf
+
+import numpy as np
+
+from me_toolbox.fatigue import FatigueAnalysis, DamageAccumulator
+from me_toolbox.fatigue.rainflow import rainflow_miner
+
+
+class TestMinerRule(unittest.TestCase):
+    def setUp(self):
+        self.analysis = FatigueAnalysis(modified_endurance_limit=90, stress_type='bending',
+                                        ductile=True, ultimate_tensile_strength=480,
+                                        yield_strength=410, Kf_bending=1,
+                                        alt_bending_stress=100)
+        self.groups = [[2, 150, -50], [3, 200, -50], [2, 350, -100], [1, 400, -300],
+                       [1, 200, -50]]
+
+    def test_miner_rule(self):
+        groups = deepcopy(self.groups)
+        N_total = self.analysis.miner_rule(groups, Sut=480, Se=90, Sy=410, z=-5.69)
+        self.assertAlmostEqual(N_total, 1853.698693894374)
+        # the input isn't modified, so a second call gives the same result
+        self.assertEqual(groups, self.groups)
+        self.assertEqual(self.analysis.miner_rule(groups, Sut=480, Se=90, Sy=410, z=-5.69),
+                         N_total)
+
+    def test_miner_rule_batch(self):
+        result = FatigueAnalysis.miner_rule_batch(self.groups, Sut=480, Se=90, Sy=410, z=-5.69)
+        self.assertEqual(result.life.shape, (5,))
+        np.testing.assert_allclose(result.damage, np.array(self.groups)[:, 0] / result.life)
+        self.assertAlmostEqual(result.total_life, 1 / result.damage.sum())
+        self.assertAlmostEqual(result.reversible_stress[0], 100 / (1 - 50 / 480))
+
+    def test_alt_mean(self):
+        alt_mean = [[n, (high - low) / 2, (high + low) / 2] for n, high, low in self.groups]
+        self.assertAlmostEqual(
+            self.analysis.miner_rule(alt_mean, Sut=480, Se=90, Sy=410, z=-5.69, alt_mean=True),
+            self.analysis.miner_rule(self.groups, Sut=480, Se=90, Sy=410, z=-5.69))
+
+    def test_infinite_and_out_of_range(self):
+        # below Se (infinite life) and above Sy (out of range, fails at once)
+        groups = [[10, 50, -50], [10, 500, -500], [1, 150, -150]]
+        with redirect_stdout(StringIO()) as output:
+            result = FatigueAnalysis.miner_rule_batch(groups, Sut=480, Se=90, Sy=410, z=-5.69)
+        self.assertIn('1 stress groups', output.getvalue())
+        self.assertEqual(result.life[0], inf)
+        self.assertEqual(result.life[1], 0)
+        self.assertEqual(result.damage[1], inf)
+        self.assertEqual(result.total_life, 0)
+
+    def test_overload(self):
+        # a single overload group above Sm (Sy not given) is failure, not ignored
+        groups = [[1000, 200, 0], [1000, 450, 0]]
+        with redirect_stdout(StringIO()) as output:
+            result = FatigueAnalysis.miner_rule_batch(groups, Sut=480, Se=90, alt_mean=True)
+        self.assertIn('fail at once', output.getvalue())
+        np.testing.assert_array_equal(result.life[1], 0)
+        self.assertEqual(result.total_life, 0)
+        # a mean stress above Sut (infinite reversible stress)
+        result = FatigueAnalysis.miner_rule_batch([[1, 100, 490]], Sut=480, Se=90,
+                                                  alt_mean=True, warn=False)
+        self.assertEqual(result.total_life, 0)
+        # without repetitions an overload group doesn't damage
+        result = FatigueAnalysis.miner_rule_batch([[0, 450, 0], [10, 200, 0]], Sut=480, Se=90,
+                                                  alt_mean=True, warn=False)
+        self.assertEqual(result.damage[0], 0)
+        self.assertGreater(result.total_life, 0)
+
+    def test_all_infinite(self):
+        result = FatigueAnalysis.miner_rule_batch([[10, 50, -50]], Sut=480, Se=90)
+        self.assertEqual(result.total_life, inf)
+
+
+class TestEqStressHistory(unittest.TestCase):
+    def setUp(self):
+        self.analysis = FatigueAnalysis(modified_endurance_limit=90, stress_type='multiple',
+                                        ductile=True, ultimate_tensile_strength=480,
+                                        yield_strength=410, Kf_bending=1.5, Kf_normal=1.2,
+                                        Kf_torsion=1.3, alt_bending_stress=100,
+                                        alt_normal_stress=20, alt_torsion_stress=50)
+        time = np.linspace(0, 1, 1001)
+        self.bending = 100 * np.sin(2 * np.pi * 7 * time)
+        self.normal = 20 * np.sin(2 * np.pi * 7 * time)
+        self.torsion = 50 * np.sin(2 * np.pi * 7 * time)
+
+    def test_signed_von_mises(self):
+        history = self.analysis.eq_stress_history(self.bending, self.normal, self.torsion)
+        self.assertAlmostEqual(history.max(), self.analysis.alt_eq_stress, places=2)
+        self.assertAlmostEqual(history.min(), -self.analysis.alt_eq_stress, places=2)
+        np.testing.assert_array_equal(np.sign(history), np.sign(self.bending))
+        # pure torsion keeps the sign of the torsion stress
+        np.testing.assert_allclose(self.analysis.eq_stress_history(torsion_stress=[-10, 10]),
+                                   np.array([-10, 10]) * 1.3 * np.sqrt(3))
+
+    def test_stress_types(self):
+        for stress_type, Kf, channel in (('bending', 1.5, 'bending_stress'),
+                                         ('axial', 1.2, 'normal_stress'),
+                                         ('torsion', 1.3, 'torsion_stress')):
+            history = FatigueAnalysis.calc_eq_stress_history(
+                stress_type, 1.5, 1.2, 1.3, **{channel: self.bending})
+            np.testing.assert_allclose(history, Kf * self.bending)
+
+    def test_chunks(self):
+        history = self.analysis.eq_stress_history(self.bending, self.normal, self.torsion)
+        chunks = list(self.analysis.iter_eq_stress_history(self.bending, 0, self.torsion,
+                                                           chunk_size=300))
+        self.assertEqual([chunk.size for chunk in chunks], [300, 300, 300, 101])
+        np.testing.assert_allclose(np.concatenate(chunks),
+                                   self.analysis.eq_stress_history(self.bending, 0,
+                                                                   self.torsion))
+        accumulator = DamageAccumulator(Sut=480, Se=90, Sy=410)
+        accumulator.consume(self.analysis.iter_eq_stress_history(
+            self.bending, self.normal, self.torsion, chunk_size=128))
+        self.assertAlmostEqual(accumulator.damage,
+                               1 / rainflow_miner(history, Sut=480, Se=90, Sy=410).total_life)
+
+
+if __name__ == '__main__':
+    unittest.main()
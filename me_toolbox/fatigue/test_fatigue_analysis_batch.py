@@ -0,0 +1,108 @@
+import unittest
+from math import inf
+
+import numpy as np
+
+from me_toolbox.fatigue import FatigueAnalysis, FatigueAnalysisBatch
+
+
+class TestFatigueAnalysisBatch(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        size = 300
+        self.properties = dict(modified_endurance_limit=200, ultimate_tensile_strength=700,
+                               yield_strength=525, ductile=True, stress_type='multiple',
+                               Kf_normal=1.945, Kf_torsion=1.5475, Kf_bending=1.2)
+        self.stresses = dict(alt_bending_stress=rng.uniform(0, 80, size),
+                             alt_normal_stress=rng.uniform(0, 80, size),
+                             alt_torsion_stress=rng.uniform(0, 80, size),
+                             mean_bending_stress=rng.uniform(-100, 100, size),
+                             mean_normal_stress=rng.uniform(-100, 100, size),
+                             mean_torsion_stress=rng.uniform(-100, 100, size))
+        self.batch = FatigueAnalysisBatch(**self.properties, **self.stresses)
+
+    def scalar(self, i, **properties):
+        stresses = {name: float(values[i]) for name, values in self.stresses.items()}
+        return FatigueAnalysis(**{**self.properties, **properties}, **stresses)
+
+    def test_equivalent_stresses(self):
+        for i in range(0, 300, 7):
+            analysis = self.scalar(i)
+            self.assertAlmostEqual(self.batch.alt_eq_stress[i], analysis.alt_eq_stress)
+            self.assertAlmostEqual(self.batch.mean_eq_stress[i], analysis.mean_eq_stress)
+
+    def test_safety_factors(self):
+        for criterion in ('modified goodman', 'soderberg', 'gerber', 'asme-elliptic'):
+            nf, ns = self.batch.get_safety_factors(criterion)
+            chunked_nf, chunked_ns = self.batch.get_safety_factors(criterion, chunk_size=64)
+            np.testing.assert_array_equal(nf, chunked_nf)
+            np.testing.assert_array_equal(ns, chunked_ns)
+            for i in range(0, 300, 11):
+                expected_nf, expected_ns = self.scalar(i).get_safety_factors(criterion)
+                self.assertAlmostEqual(nf[i], expected_nf)
+                self.assertAlmostEqual(ns[i], expected_ns)
+
+    def test_criteria_properties(self):
+        batch = FatigueAnalysisBatch(**{**self.properties, 'stress_type': 'torsion'},
+                                     **self.stresses)
+        for name in ('modified_goodman', 'soderberg', 'gerber', 'ASME_elliptic',
+                     'langer_static_yield'):
+            values = getattr(batch, name)
+            for i in range(0, 300, 13):
+                expected = getattr(self.scalar(i, stress_type='torsion'), name)
+                if expected is None:
+                    self.assertTrue(np.isnan(values[i]))
+                else:
+                    self.assertAlmostEqual(values[i], expected, msg=name)
+
+    def test_num_of_cycles(self):
+        rng = np.random.default_rng(1)
+        mean = rng.uniform(-100, 800, 500)
+        alt = rng.uniform(0, 700, 500)
+        # Sy=690 is above Sm so there are low cycle fatigue stress states,
+        # without Sy only HCF is checked
+        for Sy in (None, 525, 690):
+            N, Sf = FatigueAnalysis.calc_num_of_cycles_batch(mean, alt, 200, 700, Sy)
+            for i in range(500):
+                expected_N, expected_Sf = FatigueAnalysis.calc_num_of_cycles(mean[i], alt[i],
+                                                                             200, 700, Sy)
+                if expected_N in (0, inf):
+                    self.assertEqual(N[i], expected_N)
+                else:
+                    self.assertAlmostEqual(N[i] / expected_N, 1)
+                    self.assertAlmostEqual(Sf[i], expected_Sf)
+                if expected_Sf is None:
+                    self.assertTrue(np.isnan(Sf[i]))
+
+    def test_batch_num_of_cycles_no_yield_strength(self):
+        # the stresses above Sm fail at once without a yield strength
+        alt = np.linspace(0, 690, 70)
+        N, _ = FatigueAnalysisBatch(200, 'bending', True, 700, Kf_bending=1,
+                                    alt_bending_stress=alt, mean_bending_stress=20).num_of_cycles()
+        for i in range(70):
+            expected_N, _ = FatigueAnalysis(200, 'bending', True, 700, Kf_bending=1,
+                                            alt_bending_stress=float(alt[i]),
+                                            mean_bending_stress=20).num_of_cycles()
+            if expected_N in (0, inf):
+                self.assertEqual(N[i], expected_N)
+            else:
+                self.assertAlmostEqual(N[i] / expected_N, 1)
+
+    def test_batch_num_of_cycles_chunked(self):
+        N, Sf = self.batch.num_of_cycles()
+        chunked_N, chunked_Sf = self.batch.num_of_cycles(chunk_size=50)
+        np.testing.assert_array_equal(N, chunked_N)
+        np.testing.assert_array_equal(Sf, chunked_Sf)
+
+    def test_shape(self):
+        batch = FatigueAnalysisBatch(200, 'bending', True, 700, 525, Kf_bending=[[1.2], [1.5]],
+                                     alt_bending_stress=np.linspace(100, 300, 4),
+                                     mean_bending_stress=50)
+        self.assertEqual(batch.alt_eq_stress.shape, (2, 4))
+        nf, ns = batch.get_safety_factors('gerber', chunk_size=3)
+        self.assertEqual(nf.shape, (2, 4))
+        self.assertAlmostEqual(batch.alt_eq_stress[1, 3], 1.5 * 300)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import unittest
+from contextlib import redirect_stdout
+from functools import partial
+from io import StringIO
+from math import inf, sqrt
+
+import numpy as np
+
+from me_toolbox.fatigue import MeanStressCorrection, FatigueAnalysis, RangeMeanMatrix, \
+    DamageAccumulator
+from me_toolbox.fatigue.rainflow import rainflow_miner
+
+
+class TestMeanStressCorrection(unittest.TestCase):
+    def setUp(self):
+        self.Sut, self.Sy = 600, 450
+        self.alt = np.array([100, 100, 100, 100, 200])
+        self.mean = np.array([-100, 0, 150, 600, 300])
+
+    def test_goodman_type(self):
+        np.testing.assert_allclose(
+            MeanStressCorrection.goodman(self.alt, self.mean, self.Sut),
+            [100, 100, 100 / 0.75, inf, 400])
+        np.testing.assert_allclose(
+            MeanStressCorrection.gerber(self.alt, self.mean, self.Sut),
+            [100, 100, 100 / (1 - 0.25 ** 2), inf, 200 / 0.75])
+        np.testing.assert_allclose(
+            MeanStressCorrection.soderberg(self.alt, self.mean, self.Sut, self.Sy),
+            [100, 100, 100 / (1 - 150 / 450), inf, 600])
+        with self.assertRaises(ValueError):
+            MeanStressCorrection.soderberg(self.alt, self.mean, self.Sut)
+
+    def test_scalar(self):
+        for name in ('goodman', 'gerber', 'soderberg', 'morrow', 'walker', 'swt'):
+            batch = MeanStressCorrection.reversible_stress(self.alt, self.mean, self.Sut,
+                                                           self.Sy, name)
+            for i in range(len(self.alt)):
+                scalar = MeanStressCorrection.reversible_stress(
+                    float(self.alt[i]), float(self.mean[i]), self.Sut, self.Sy, name)
+                self.assertEqual(scalar, batch[i])
+                self.assertIs(type(scalar), float)
+
+    def test_max_stress_corrections(self):
+        np.testing.assert_allclose(MeanStressCorrection.swt(self.alt, self.mean, self.Sut),
+                                   np.sqrt((self.alt + self.mean) * self.alt))
+        # the Walker correction with γ=0.5 is the SWT correction
+        np.testing.assert_allclose(
+            MeanStressCorrection.walker(self.alt, self.mean, self.Sut, gamma=0.5),
+            MeanStressCorrection.swt(self.alt, self.mean, self.Sut))
+        # no damage if the maximum stress is compressive
+        self.assertEqual(MeanStressCorrection.swt(100, -150, self.Sut), 0)
+        self.assertEqual(MeanStressCorrection.walker(100, -150, self.Sut), 0)
+        self.assertAlmostEqual(MeanStressCorrection.walker(100, 100, self.Sut),
+                               200 ** (1 - 0.7618) * 100 ** 0.7618)
+
+    def test_morrow(self):
+        np.testing.assert_allclose(MeanStressCorrection.morrow(self.alt, self.mean, self.Sut),
+                                   np.where(self.mean < self.Sut,
+                                            self.alt / (1 - self.mean / 945), inf))
+        self.assertEqual(MeanStressCorrection.morrow(100, 1000, self.Sut), inf)
+        # a mean stress at or above Sut fails at once
+        self.assertEqual(MeanStressCorrection.morrow(100, 600, self.Sut), inf)
+        self.assertEqual(FatigueAnalysis.calc_num_of_cycles(500., 100., 90, 480, 410,
+                                                            mean_stress_correction='morrow'),
+                         (0, None))
+        self.assertAlmostEqual(MeanStressCorrection.morrow(100, 500, self.Sut,
+                                                           fatigue_strength_coefficient=1000), 200)
+
+    def test_get_correction(self):
+        walker = partial(MeanStressCorrection.walker, gamma=0.6)
+        self.assertIs(MeanStressCorrection.get_correction(walker), walker)
+        self.assertIs(MeanStressCorrection.get_correction('Gerber'), MeanStressCorrection.gerber)
+        with self.assertRaises(ValueError):
+            MeanStressCorrection.get_correction('haigh')
+        # the morrow and walker defaults only apply to tensile strengths in [MPa]
+        self.assertIs(MeanStressCorrection.get_correction('goodman', tensile_mpa=False),
+                      MeanStressCorrection.goodman)
+        self.assertIs(MeanStressCorrection.get_correction(walker, tensile_mpa=False), walker)
+        for name in ('morrow', 'walker'):
+            with self.assertRaises(ValueError):
+                MeanStressCorrection.get_correction(name, tensile_mpa=False)
+
+    def test_num_of_cycles(self):
+        # the default is the original Goodman type correction
+        N, Sf = FatigueAnalysis.calc_num_of_cycles(150, 200, 200, 700, None)
+        self.assertAlmostEqual(N, FatigueAnalysis.calc_num_of_cycles(0, 200 / (1 - 150 / 700),
+                                                                     200, 700, None)[0])
+        self.assertEqual(FatigueAnalysis.calc_num_of_cycles(700, 200, 200, 700, None), (0, None))
+
+        gerber, _ = FatigueAnalysis.calc_num_of_cycles(150, 200, 200, 700, None,
+                                                       mean_stress_correction='gerber')
+        self.assertGreater(gerber, N)
+
+        mean, alt = np.array([-50, 150, 300, 700]), np.array([300, 250, 260, 100])
+        for correction in ('goodman', 'gerber', 'morrow', 'swt', 'walker'):
+            N, Sf = FatigueAnalysis.calc_num_of_cycles_batch(mean, alt, 200, 700, None,
+                                                             mean_stress_correction=correction)
+            for i in range(len(mean)):
+                expected_N, expected_Sf = FatigueAnalysis.calc_num_of_cycles(
+                    mean[i], alt[i], 200, 700, None, mean_stress_correction=correction)
+                self.assertAlmostEqual(N[i], expected_N)
+
+    def test_miner_rule(self):
+        groups = [[2, 150, -50], [3, 200, -50], [2, 350, -100], [1, 200, -50]]
+        goodman = FatigueAnalysis.miner_rule_batch(groups, Sut=480, Se=90, Sy=410, z=-5.69)
+        swt = FatigueAnalysis.miner_rule_batch(groups, Sut=480, Se=90, Sy=410, z=-5.69,
+                                               mean_stress_correction='swt')
+        alt, mean = np.array([100, 125, 225, 125]), np.array([50, 75, 125, 75])
+        np.testing.assert_allclose(swt.reversible_stress, [sqrt(a * (a + m))
+                                                           for a, m in zip(alt, mean)])
+        self.assertGreater(swt.total_life, goodman.total_life)
+
+    def test_mean_above_strength(self):
+        # a mean stress at or above Sut fails at once with the Goodman type corrections
+        # and with the Morrow correction
+        for correction in ('goodman', 'gerber', 'soderberg', 'morrow'):
+            result = FatigueAnalysis.miner_rule_batch([[1, 50, 600], [1, 50, 700], [1, 100, 0]],
+                                                      self.Sut, 200, self.Sy, alt_mean=True,
+                                                      warn=False,
+                                                      mean_stress_correction=correction)
+            np.testing.assert_array_equal(result.life[:2], [0, 0])
+            self.assertEqual(result.total_life, 0)
+
+        # and so do the counted histories
+        series = np.tile([580., 620.], 50)
+        with redirect_stdout(StringIO()):
+            self.assertEqual(rainflow_miner(series, self.Sut, 200).total_life, 0)
+            matrix = RangeMeanMatrix.from_series(series)
+            self.assertEqual(matrix.miner_rule(self.Sut, 200).total_life, 0)
+            accumulator = DamageAccumulator(self.Sut, 200)
+            accumulator.consume(series)
+        self.assertEqual(accumulator.life, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+
+import numpy as np
+
+from me_toolbox.fatigue import FatigueAnalysis, MonteCarloAnalysis, EnduranceLimit
+from me_toolbox.fatigue.monte_carlo import Distribution, LogNormal, Normal, Uniform, Weibull
+
+
+class TestMonteCarloAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.analysis = MonteCarloAnalysis(
+            modified_endurance_limit=LogNormal(180, 18), stress_type='bending', ductile=True,
+            ultimate_tensile_strength=LogNormal(600, 40), yield_strength=LogNormal(420, 30),
+            Kf_bending=Normal(1.6, 0.1), alt_bending_stress=Normal(90, 15),
+            mean_bending_stress=Normal(60, 10))
+
+    def test_reproducible(self):
+        result = self.analysis.run(50000, seed=3, block_size=8192)
+        self.assertEqual(result.failure_probability,
+                         self.analysis.run(50000, seed=3, block_size=8192).failure_probability)
+        parallel = self.analysis.run(50000, seed=3, block_size=8192, workers=2)
+        self.assertEqual(result.failure_probability, parallel.failure_probability)
+        self.assertEqual(result.percentiles, parallel.percentiles)
+
+    def test_result(self):
+        result = self.analysis.run(50000, seed=3, block_size=8192, keep_samples=True)
+        self.assertEqual(result.convergence.samples.tolist(), [8192 * i for i in range(1, 7)]
+                         + [50000])
+        self.assertAlmostEqual(result.failure_probability,
+                               np.mean(result.safety_factors < 1))
+        self.assertAlmostEqual(result.standard_error, np.sqrt(
+            result.failure_probability * (1 - result.failure_probability) / 50000))
+        self.assertAlmostEqual(result.percentiles[50], np.median(result.safety_factors))
+        self.assertEqual(result.invalid, 0)
+
+    def test_deterministic(self):
+        # with no scatter every sample is the deterministic analysis
+        for alt_stress, probability in ((60, 0), (200, 1)):
+            analysis = MonteCarloAnalysis(180, 'bending', True, 600, 420, Kf_bending=1.6,
+                                          alt_bending_stress=alt_stress, mean_bending_stress=60)
+            result = analysis.run(1000, seed=0)
+            expected = FatigueAnalysis(180, 'bending', True, 600, 420, Kf_bending=1.6,
+                                       alt_bending_stress=alt_stress,
+                                       mean_bending_stress=60).modified_goodman
+            self.assertEqual(result.failure_probability, probability)
+            self.assertAlmostEqual(result.percentiles[1], expected)
+
+    def test_endurance_limit(self):
+        limit = EnduranceLimit(300, 600, 'machined', True, 0, 100, 'bending', 20, 99,
+                               diameter=30)
+        analysis = MonteCarloAnalysis(limit, 'bending', True, 600, 420, Kf_bending=1.5,
+                                      alt_bending_stress=100)
+        fatigue, _ = analysis.evaluate(np.random.default_rng(0), 10)
+        expected = FatigueAnalysis(limit.modified, 'bending', True, 600, 420, Kf_bending=1.5,
+                                   alt_bending_stress=100).modified_goodman
+        np.testing.assert_allclose(fatigue, expected)
+
+    def test_distributions(self):
+        rng = np.random.default_rng(0)
+        samples = LogNormal(600, 40).sample(rng, 10 ** 6)
+        self.assertAlmostEqual(samples.mean() / 600, 1, places=3)
+        self.assertAlmostEqual(samples.std() / 40, 1, places=2)
+        samples = Uniform(1, 2).sample(rng, 1000)
+        self.assertTrue(((samples >= 1) & (samples < 2)).all())
+        self.assertTrue((Weibull(2, 10, 5).sample(rng, 1000) >= 5).all())
+        with self.assertRaises(TypeError):
+            Distribution()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from me_toolbox.fatigue.peak_valley import peak_valley, turning_points, hysteresis_gate, \
+    PeakValleyExtractor
+from me_toolbox.fatigue.rainflow import rainflow
+
+
+class TestPeakValley(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        time = np.linspace(0, 200, 20000)
+        # a large cycle every 1000 samples with noise
+        self.series = 100 * np.sin(time) + 5 * rng.normal(size=time.size)
+
+    def test_no_gate(self):
+        points, index = turning_points(self.series, return_index=True)
+        result = peak_valley(self.series)
+        np.testing.assert_array_equal(result.values, points)
+        np.testing.assert_array_equal(result.index, index)
+
+    def test_gate(self):
+        series = np.array([0, 10, 9.5, 9.8, 9, 20, -5, -4, -10, 3, 2.5])
+        result = peak_valley(series, hysteresis=2)
+        # the small last point is removed, the reversal before it is kept
+        np.testing.assert_array_equal(result.values, [0, 20, -10, 3])
+        np.testing.assert_array_equal(result.index, [0, 5, 8, 9])
+        # and so is the small first point
+        np.testing.assert_array_equal(peak_valley([0, 1, -10, 5], hysteresis=2).values,
+                                      [1, -10, 5])
+        np.testing.assert_array_equal(peak_valley([1, 0, 10, -10], hysteresis=3).values,
+                                      [0, 10, -10])
+        # the full cycle between -5 and 7 is kept
+        np.testing.assert_array_equal(peak_valley([-8, 4, -5, 7, 6], hysteresis=3).values,
+                                      [-8, 4, -5, 7])
+
+        result = peak_valley(self.series, hysteresis=50)
+        np.testing.assert_array_equal(self.series[result.index], result.values)
+        self.assertTrue(np.all(np.abs(np.diff(result.values)) >= 50))
+        self.assertLess(result.values.size, 70)
+
+    def test_rainflow(self):
+        # the gate removes the cycles smaller than it, the rest are counted the same
+        cycles = rainflow(self.series)
+        gated = rainflow(self.series, hysteresis=30)
+        full = cycles.count == 1
+        np.testing.assert_allclose(np.sort(gated.range[gated.count == 1]),
+                                   np.sort(cycles.range[full & (cycles.range >= 30)]))
+
+    def test_chunks(self):
+        for hysteresis in (0, 3, 50):
+            expected = peak_valley(self.series, hysteresis)
+            for chunk_size in (2, 13, 1000):
+                result = peak_valley(self.series, hysteresis, chunk_size=chunk_size)
+                np.testing.assert_array_equal(result.values, expected.values)
+            result = peak_valley(np.array_split(self.series, 9), hysteresis)
+            np.testing.assert_array_equal(result.index, expected.index)
+
+        extractor = PeakValleyExtractor(2)
+        settled = [extractor.update(chunk).values for chunk in ([0, 10, 9], [9.5, 20, -5])]
+        np.testing.assert_array_equal(settled[0], [0])
+        np.testing.assert_array_equal(settled[1], [20])
+        np.testing.assert_array_equal(extractor.finish().values, [-5])
+        self.assertEqual(extractor.samples, 6)
+        with self.assertRaises(ValueError):
+            PeakValleyExtractor(-1)
+
+    def test_memmap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'series.npy')
+            np.save(path, self.series.astype(np.float32))
+            series = np.load(path, mmap_mode='r')
+            result = peak_valley(series, hysteresis=10, chunk_size=4096)
+            self.assertEqual(result.values.dtype, np.float32)
+            np.testing.assert_array_equal(result.values, series[result.index])
+            del series
+
+    def test_hysteresis_gate(self):
+        points = np.array([0, 5, 4, 4.5, 3, 10])
+        np.testing.assert_array_equal(hysteresis_gate(points, 1), [0, 1, 4, 5])
+        np.testing.assert_array_equal(hysteresis_gate(points, 3), [0, 5])
+        # the last small reversal stays while the history isn't closed
+        np.testing.assert_array_equal(hysteresis_gate([0, 10, 9.5], 1, closed_end=False),
+                                      [0, 1, 2])
+        np.testing.assert_array_equal(hysteresis_gate([0, 10, 9.5], 1), [0, 1])
+
+    def test_decay_scaling(self):
+        # a monotone decay has no inner pairs to remove, every reversal stays on the stack
+        # until the end rule, the time should grow linearly with the history
+        def decay(n):
+            return (-1.0) ** np.arange(n) * (1 - np.arange(n) / n)
+
+        times = []
+        for n in (20000, 160000):
+            series = decay(n)
+            best = np.inf
+            for _ in range(3):
+                start = time.perf_counter()
+                result = peak_valley(series, hysteresis=5)
+                best = min(best, time.perf_counter() - start)
+            times.append(best)
+            np.testing.assert_array_equal(result.index, [0, 1])
+            np.testing.assert_array_equal(peak_valley(series, 5, chunk_size=1000).index, [0, 1])
+        # 8 times the history, a quadratic gate takes 64 times longer
+        self.assertLess(times[1], 24 * times[0] + 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
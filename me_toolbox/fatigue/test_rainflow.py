@@ -0,0 +1,100 @@
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from me_toolbox.fatigue import FatigueAnalysis
+from me_toolbox.fatigue.rainflow import rainflow, turning_points, stress_groups, rainflow_miner
+from me_toolbox.fatigue.rainflow import RainflowCounter
+
+
+class TestRainflow(unittest.TestCase):
+    def setUp(self):
+        # ASTM E1049 rainflow counting example
+        self.series = [-2, 1, -3, 5, -1, 3, -4, 4, -2]
+
+    def test_turning_points(self):
+        series = [0, 1, 1, 2, 1, 1, 0, 0, 3, 3]
+        np.testing.assert_array_equal(turning_points(series), [0, 2, 0, 3])
+        points, index = turning_points(series, return_index=True)
+        np.testing.assert_array_equal(index, [0, 3, 6, 8])
+        np.testing.assert_array_equal(turning_points([5, 5, 5]), [5])
+        self.assertEqual(turning_points([]).size, 0)
+
+    def test_astm_example(self):
+        cycles = rainflow(self.series)
+        counts = Counter()
+        for count, cycle_range in zip(cycles.count, cycles.range):
+            counts[cycle_range] += count
+        self.assertEqual(counts, {3: 0.5, 4: 1.5, 6: 0.5, 8: 1.0, 9: 0.5})
+        # the full cycle between 3 and -1
+        self.assertEqual((cycles.count[0], cycles.range[0], cycles.mean[0]), (1, 4, 1))
+
+    def test_chunks(self):
+        series = np.round(np.random.default_rng(0).normal(size=2000) * 5)
+        expected = rainflow(series)
+        for chunk_size in (1, 2, 3, 100):
+            for result, reference in zip(rainflow(series, chunk_size=chunk_size), expected):
+                np.testing.assert_array_equal(result, reference)
+
+    def test_last_point_closes_cycle(self):
+        cycles = rainflow([0, 10, 5, 12])
+        np.testing.assert_array_equal(cycles.count, [1, 0.5])
+        np.testing.assert_array_equal(cycles.range, [5, 12])
+        np.testing.assert_array_equal(cycles.mean, [7.5, 6])
+
+    def test_reference(self):
+        rng = np.random.default_rng(1)
+        for _ in range(100):
+            series = np.round(rng.normal(size=rng.integers(2, 60)) * 5)
+            expected = _reference_rainflow(series)
+            for chunk_size in (1, 3, 100):
+                result = rainflow(series, chunk_size=chunk_size)
+                np.testing.assert_array_equal(np.column_stack(result), expected)
+
+    def test_miner(self):
+        series = np.array(self.series) * 50
+        groups = stress_groups(rainflow(series))
+        np.testing.assert_array_equal(groups[0], [1, 100, 50])
+        result = rainflow_miner(series, Sut=480, Se=90, Sy=410, z=-5.69)
+        expected = FatigueAnalysis.miner_rule_batch(groups, Sut=480, Se=90, Sy=410, z=-5.69,
+                                                    alt_mean=True)
+        self.assertAlmostEqual(result.total_life, expected.total_life)
+        np.testing.assert_allclose(result.damage, groups[:, 0] / result.life)
+
+    def test_counter(self):
+        counter = RainflowCounter()
+        closed = [counter.update(chunk) for chunk in ([-2, 1, -3], [5, -1], [3, -4, 4, -2])]
+        self.assertEqual([cycles.count.size for cycles in closed], [0, 0, 1])
+        self.assertEqual(counter.samples, 9)
+        residual = counter.residual()
+        np.testing.assert_array_equal(residual.range, [3, 4, 8, 9, 8, 6])
+        # the residual is only a view of the state, the counting can continue
+        np.testing.assert_array_equal(counter.residual().range, residual.range)
+        self.assertEqual(counter.update([]).count.size, 0)
+
+
+def _reference_rainflow(series):
+    """ASTM E1049 four-point rainflow counting, one point at a time"""
+    points = []
+    for value in series:
+        if points and value == points[-1]:
+            continue
+        if len(points) >= 2 and (points[-1] - points[-2]) * (value - points[-1]) > 0:
+            points[-1] = value
+        else:
+            points.append(value)
+
+    cycles, stack = [], []
+    for point in points:
+        stack.append(point)
+        while len(stack) >= 4 and abs(stack[-3] - stack[-2]) <= abs(stack[-4] - stack[-3]) \
+                and abs(stack[-3] - stack[-2]) <= abs(stack[-2] - stack[-1]):
+            cycles.append([1, abs(stack[-3] - stack[-2]), (stack[-3] + stack[-2]) / 2])
+            del stack[-3:-1]
+    cycles += [[0.5, abs(end - start), (start + end) / 2] for start, end in zip(stack, stack[1:])]
+    return np.array(cycles, dtype=float).reshape(-1, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
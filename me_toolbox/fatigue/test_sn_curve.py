@@ -0,0 +1,73 @@
+import unittest
+from math import inf, log10
+
+import numpy as np
+
+from me_toolbox.fatigue import FatigueAnalysis, SNCurve
+from me_toolbox.fatigue.sn_curve import get_sn_curve
+
+
+class TestSNCurve(unittest.TestCase):
+    def setUp(self):
+        self.curve = SNCurve(Sut=700, Se=200, Sy=650)
+
+    def test_coefficients(self):
+        Sm = FatigueAnalysis.calc_Sm(700)
+        self.assertEqual(self.curve.Sm, Sm)
+        self.assertAlmostEqual(self.curve.hcf_a, Sm ** 2 / 200)
+        self.assertAlmostEqual(self.curve.hcf_b, -log10(Sm / 200) / 3)
+        self.assertAlmostEqual(self.curve.lcf_b, -log10(700 / Sm) / 3)
+
+    def test_life(self):
+        self.assertEqual(self.curve.life(100), inf)
+        self.assertEqual(self.curve.life(660), 0)
+        self.assertAlmostEqual(self.curve.life(self.curve.Sm - 1e-9), 1e3, places=3)
+        self.assertAlmostEqual(self.curve.life(200 + 1e-9), 1e6, places=-1)
+        stress = np.array([100, 300, 620, 660])
+        np.testing.assert_allclose(self.curve.life(stress),
+                                   [self.curve.life(value) for value in stress.tolist()])
+
+    def test_scalar_array_parity(self):
+        stress = [100., 200., 300., 440., 470., 500.]
+        for Sy in (None, 470, 600):
+            curve = SNCurve(480, 90, Sy)
+            array_curve = SNCurve(np.array([480.]), 90, Sy)
+            scalar_life = [curve.life(value) for value in stress]
+            np.testing.assert_array_equal(curve.life(np.array(stress)), scalar_life)
+            np.testing.assert_array_equal(array_curve.life(np.array(stress)), scalar_life)
+        # without Sy a stress above Sm fails at once
+        self.assertEqual(SNCurve(480, 90, None).life(np.array([440.]))[0], 0)
+
+    def test_strength(self):
+        for stress in (250, 400, 620):
+            self.assertAlmostEqual(self.curve.strength(self.curve.life(stress)), stress)
+        self.assertEqual(self.curve.strength(1e7), 200)
+        self.assertEqual(self.curve.strength(0.5), 700)
+        life = np.array([1, 1e2, 1e4, 1e8])
+        np.testing.assert_allclose(self.curve.strength(life),
+                                   [self.curve.strength(value) for value in life.tolist()])
+
+    def test_low_cycle_zeta(self):
+        curve = SNCurve(Sut=700, Se=200, Sy=650, z=-5)
+        self.assertEqual(curve.endurance_life, 1e8)
+        curve.life(300)
+        with self.assertRaises(ValueError):
+            curve.life(620)
+        with self.assertRaises(ValueError):
+            curve.strength(np.array([10, 1e4]))
+
+    def test_material_arrays(self):
+        curve = SNCurve(Sut=np.array([500, 700, 1500]), Se=200)
+        np.testing.assert_allclose(curve.life(300),
+                                   [SNCurve(Sut, 200).life(300) for Sut in (500, 700, 1500)])
+        with self.assertRaises(ValueError):
+            curve.Sm[0] = 1
+
+    def test_cache(self):
+        self.assertIs(get_sn_curve(700, 200, 650), get_sn_curve(700, 200, 650))
+        self.assertIsNot(get_sn_curve(700, 200, 650), get_sn_curve(700, 200, 650, -5))
+        self.assertFalse(get_sn_curve(np.array([700]), 200).Sut is get_sn_curve(700, 200).Sut)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import tempfile
+import unittest
+from math import gamma, sqrt
+
+import numpy as np
+
+from me_toolbox.fatigue import SpectralFatigue, SNCurve
+from me_toolbox.fatigue.rainflow import rainflow
+from me_toolbox.fatigue.sn_curve import calc_Sm
+
+
+def gaussian_process(frequency, psd, sample_rate, size, seed=0):
+    """A stationary Gaussian time series with a one-sided PSD (random phases)"""
+    rng = np.random.default_rng(seed)
+    frequencies = np.fft.rfftfreq(size, 1 / sample_rate)
+    amplitude = np.sqrt(np.interp(frequencies, frequency, psd, left=0, right=0) *
+                        sample_rate * size / 2)
+    phase = np.exp(2j * np.pi * rng.random(frequencies.size))
+    return np.fft.irfft(amplitude * phase, n=size)
+
+
+class TestSpectralFatigue(unittest.TestCase):
+    def setUp(self):
+        self.Sut, self.Se = 600, 250
+        # a bimodal (wide-band) PSD, [MPa^2/Hz]
+        self.frequency = np.linspace(0, 50, 2001)
+        self.psd = (60 * np.exp(-((self.frequency - 5) / 1) ** 2) +
+                    20 * np.exp(-((self.frequency - 30) / 2) ** 2))
+
+    def test_moments(self):
+        frequency = np.linspace(0, 10, 1001)
+        psd = np.where((frequency >= 4) & (frequency <= 6), 3.0, 0)
+        analysis = SpectralFatigue(frequency, psd, self.Sut, self.Se)
+        self.assertAlmostEqual(analysis.moments.m0, 6, delta=0.05)
+        self.assertAlmostEqual(analysis.moments.m1, 30, delta=0.3)
+        self.assertAlmostEqual(analysis.moments.m2, 3 * (6 ** 3 - 4 ** 3) / 3, delta=1.5)
+        self.assertTrue(0 < analysis.alpha2 < analysis.alpha1 < 1)
+
+    def test_narrow_band(self):
+        frequency = np.linspace(9, 11, 2001)
+        psd = np.where(np.abs(frequency - 10) <= 0.01, 500.0, 0)
+        analysis = SpectralFatigue(frequency, psd, self.Sut, self.Se)
+        curve = SNCurve(self.Sut, self.Se)
+        k, C = -1 / curve.hcf_b, curve.hcf_a ** (-1 / curve.hcf_b)
+        expected = analysis.zero_crossing_rate * (sqrt(2 * analysis.moments.m0)) ** k * \
+            gamma(1 + k / 2) / C
+        self.assertAlmostEqual(analysis.narrow_band() / expected, 1)
+        self.assertAlmostEqual(analysis.zero_crossing_rate, 10, places=3)
+        # the wide-band methods converge to the narrow-band damage
+        self.assertAlmostEqual(analysis.dirlik() / expected, 1, delta=0.02)
+        self.assertAlmostEqual(analysis.tovo_benasciutti() / expected, 1, delta=0.02)
+
+    def test_rainflow(self):
+        sample_rate = 200
+        series = gaussian_process(self.frequency, self.psd, sample_rate, 2 ** 20)
+        # Se = Sm / 10 gives k=3 where the wide-band estimations are most accurate
+        analysis = SpectralFatigue(self.frequency, self.psd, self.Sut, calc_Sm(self.Sut) / 10)
+        self.assertAlmostEqual(analysis.k, 3)
+
+        cycles = rainflow(series)
+        rainflow_rate = np.sum(cycles.count * (cycles.range / 2) ** analysis.k) / analysis.C / \
+            (series.size / sample_rate)
+        self.assertAlmostEqual(analysis.dirlik() / rainflow_rate, 1, delta=0.05)
+        self.assertAlmostEqual(analysis.tovo_benasciutti() / rainflow_rate, 1, delta=0.08)
+        self.assertGreater(analysis.narrow_band(), rainflow_rate)
+        self.assertAlmostEqual(analysis.life(), 1 / analysis.dirlik())
+
+    def test_welch_psd(self):
+        sample_rate = 200
+        series = 80 + gaussian_process(self.frequency, self.psd, sample_rate, 2 ** 18, seed=1)
+        frequency, psd = SpectralFatigue.welch_psd(series, sample_rate, segment_length=1024)
+        self.assertEqual(frequency[-1], sample_rate / 2)
+        moments = SpectralFatigue.spectral_moments(frequency, psd)
+        self.assertAlmostEqual(moments.m0 / np.var(series), 1, delta=0.01)
+
+        analysis = SpectralFatigue.from_time_series(series, sample_rate, self.Sut, self.Se,
+                                                    segment_length=1024)
+        self.assertAlmostEqual(analysis.mean_stress, 80, delta=1)
+        reference = SpectralFatigue(self.frequency, self.psd, self.Sut, self.Se,
+                                    mean_stress=analysis.mean_stress)
+        self.assertAlmostEqual(analysis.dirlik() / reference.dirlik(), 1, delta=0.1)
+
+    def test_welch_memmap(self):
+        series = np.random.default_rng(2).normal(size=10 ** 5)
+        expected = SpectralFatigue.welch_psd(series, 100, segment_length=256)
+        # white noise of unit variance, G = 2 / sample_rate
+        self.assertAlmostEqual(np.mean(expected[1][1:-1]) * 50, 1, delta=0.05)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'series.dat')
+            series.tofile(path)
+            record = np.memmap(path, dtype=float, mode='r')
+            np.testing.assert_allclose(
+                SpectralFatigue.welch_psd(record, 100, segment_length=256)[1], expected[1])
+            del record
+
+    def test_mean_stress(self):
+        analysis = SpectralFatigue(self.frequency, self.psd, self.Sut, self.Se, mean_stress=150)
+        reference = SpectralFatigue(self.frequency, self.psd, self.Sut, self.Se)
+        self.assertAlmostEqual(analysis.narrow_band() / reference.narrow_band(),
+                               (1 / (1 - 150 / self.Sut)) ** reference.k)
+
+    def test_unknown_method(self):
+        analysis = SpectralFatigue(self.frequency, self.psd, self.Sut, self.Se)
+        self.assertEqual(analysis.damage_rate('Narrow-Band'), analysis.narrow_band())
+        with self.assertRaises(ValueError):
+            analysis.damage_rate('wirsching')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+import numpy as np
+
+from me_toolbox.fatigue import StrainLife
+
+
+class TestStrainLife(unittest.TestCase):
+    def setUp(self):
+        # SAE 1045 like properties
+        self.material = StrainLife(E=200e3, fatigue_strength_coefficient=1000,
+                                   fatigue_strength_exponent=-0.08,
+                                   fatigue_ductility_coefficient=0.6,
+                                   fatigue_ductility_exponent=-0.6,
+                                   cyclic_strength_coefficient=1100,
+                                   cyclic_strain_hardening_exponent=0.15)
+        self.life = np.logspace(1, 8, 15).reshape(3, 5)
+
+    def test_inverse(self):
+        for correction, mean_stress in ((None, 0), ('morrow', 150), ('swt', 0)):
+            strain = self.material.strain_amplitude(self.life, mean_stress, correction)
+            if correction == 'swt':
+                # strain_amplitude returns the SWT parameter with a maximum stress of 1 MPa
+                life = self.material.life(strain, max_stress=1, correction=correction)
+            else:
+                life = self.material.life(strain, mean_stress, correction=correction)
+            np.testing.assert_allclose(life, self.life, rtol=1e-8)
+
+    def test_scalar(self):
+        life = self.material.life(0.004)
+        self.assertIsInstance(life, float)
+        self.assertAlmostEqual(self.material.strain_amplitude(life), 0.004)
+        # at the transition life the elastic and plastic strains are equal
+        reversals = 2 * self.material.transition_life
+        self.assertAlmostEqual(1000 / 200e3 * reversals ** -0.08, 0.6 * reversals ** -0.6)
+
+    def test_mean_stress(self):
+        strain = np.array([0.002, 0.004, 0.01])
+        reference = self.material.life(strain)
+        self.assertTrue(np.all(self.material.life(strain, 200, correction='morrow') < reference))
+        self.assertTrue(np.all(self.material.life(strain, -200, correction='morrow') > reference))
+        self.assertEqual(self.material.life(0.004, 1000, correction='morrow'), 0)
+        self.assertTrue(np.all(self.material.life(strain, 200, correction='swt') < reference))
+        # fully reversed SWT with σmax from the cyclic curve is close to the plain curve
+        np.testing.assert_allclose(self.material.life(strain, correction='swt'), reference,
+                                   rtol=0.5)
+        with self.assertRaises(ValueError):
+            self.material.life(0.004, correction='walker')
+
+    def test_convergence_mask(self):
+        strain = np.array([0.003, 0, -0.001, 0.02])
+        solution = self.material.life(strain, full_output=True)
+        self.assertTrue(solution.converged.all())
+        self.assertTrue(np.isinf(solution.value[1:3]).all())
+
+        solution = self.material.life(strain, max_iterations=1, full_output=True)
+        np.testing.assert_array_equal(solution.converged, [False, True, True, False])
+        self.assertTrue(np.isnan(solution.value[[0, 3]]).all())
+
+    def test_cyclic_curve(self):
+        strain = np.array([[0.001, -0.005], [0.02, 0]])
+        stress = self.material.stress_amplitude(strain)
+        np.testing.assert_allclose(self.material.strain(stress), strain, atol=1e-14)
+        self.assertEqual(stress[1, 1], 0)
+        with self.assertRaises(ValueError):
+            StrainLife(200e3, 1000, -0.08, 0.6, -0.6).stress_amplitude(0.01)
+
+    def test_notch(self):
+        nominal, Kt = np.array([100, 250, 0, -250]), 2.5
+        neuber = self.material.notch(nominal, Kt)
+        np.testing.assert_allclose(neuber.stress * neuber.strain, (Kt * nominal) ** 2 / 200e3)
+        np.testing.assert_allclose(self.material.strain(neuber.stress), neuber.strain)
+
+        glinka = self.material.notch(nominal, Kt, method='glinka')
+        # Glinka's strain energy density rule is less conservative than Neuber's rule
+        self.assertTrue(np.all(np.abs(glinka.strain) <= np.abs(neuber.strain)))
+        self.assertTrue(np.all(np.abs(glinka.stress) <= np.abs(neuber.stress)))
+        with self.assertRaises(ValueError):
+            self.material.notch(100, Kt, method='linear')
+
+    def test_notch_life(self):
+        life = self.material.notch_life([100, 150, 200], nominal_mean=50, Kt=2)
+        self.assertTrue(np.all(np.diff(life) < 0))
+        self.assertGreater(self.material.notch_life(150, 50, Kt=2, method='glinka'),
+                           self.material.notch_life(150, 50, Kt=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,12 @@
 """Module containing the Gear class"""
 
 from math import log, sqrt, pi, tan, radians
-import os
-import numpy as np
 
-from me_toolbox.tools import table_interpolation
+from me_toolbox.tools import register_table, get_interpolator
+
+# geometry factor tables (loaded once, on first use)
+SPUR_YJ_TABLES = {20: register_table(__package__, 'tables/20deg - spur gear geometry factors.csv'),
+                  25: register_table(__package__, 'tables/25deg - spur gear geometry factors.csv')}
 
 
 class Gear:
@@ -291,18 +293,15 @@ class Gear:
         N2 = gear2.teeth_num
         pressure_angle = gear1.pressure_angle
 
-        # load table according to pressure angle
-        if pressure_angle == 20:
-            path = os.path.dirname(__file__) + "\\tables\\20deg - spur gear geometry factors.csv"
-        elif pressure_angle == 25:
-            path = os.path.dirname(__file__) + "\\tables\\25deg - spur gear geometry factors.csv"
-        else:
+        # get table interpolator according to pressure angle
+        try:
+            interpolator = get_interpolator(*SPUR_YJ_TABLES[pressure_angle])
+        except KeyError:
             raise ValueError("at spur gear Yj Factor: pressure angle is wrong")
 
-        data = np.genfromtxt(path, delimiter=',')
         # try:
-        gear1.Yj = table_interpolation(N1, N2, data)
-        gear2.Yj = table_interpolation(N2, N1, data)
+        gear1.Yj = interpolator(N1, N2)
+        gear2.Yj = interpolator(N2, N1)
         # except NotInRangeError as not_in_range:
         # print(f"Error: Teeth number of one of the gears ({not_in_range.num})
         # not in range {not_in_range.range_}")
@@ -1,10 +1,13 @@
 """Module containing the HelicalGear class"""
 # I want the variables names to be the same as in AGMA pylint: disable=invalid-name
 from math import sin, cos, radians, pi, tan, atan, sqrt, degrees
-import os
-import numpy as np
+
 from me_toolbox.gears import SpurGear  # for inheritance
-from me_toolbox.tools import table_interpolation
+from me_toolbox.tools import register_table, get_interpolator
+
+# geometry factor tables (loaded once, on first use)
+J75_TABLE = register_table(__package__, 'tables/J75 - helix gear geometry factors.csv')
+JPRIME_TABLE = register_table(__package__, 'tables/JPrime - helix gear geometry factors.csv')
 
 
 class HelicalGear(SpurGear):
@@ -102,18 +105,9 @@ class HelicalGear(SpurGear):
         Ng = gear2.teeth_num
         helix_angle = gear1.helix_angle
 
-        # files path
-        j75_path = os.path.dirname(__file__) + "\\tables\\J75 - helix gear geometry factors.csv"
-        jPrime_path = os.path.dirname(
-            __file__) + "\\tables\\JPrime - helix gear geometry factors.csv"
-
-        # load data
-        j75_data = np.genfromtxt(j75_path, delimiter=',')
-        jPrime_data = np.genfromtxt(jPrime_path, delimiter=',')
-
         # data interpolation
-        j75 = table_interpolation(Np, helix_angle, j75_data)
-        jPrime = table_interpolation(Ng, helix_angle, jPrime_data)
+        j75 = get_interpolator(*J75_TABLE)(Np, helix_angle)
+        jPrime = get_interpolator(*JPRIME_TABLE)(Ng, helix_angle)
 
         # calculate geometric factor Yj
         Y_j = j75 * jPrime
@@ -1,7 +1,7 @@
 """A module containing the extension spring class"""
 from math import pi
 
-from me_toolbox.fatigue import FailureCriteria, FatigueAnalysis
+from me_toolbox.fatigue import FailureCriteria, FatigueAnalysis, MeanStressCorrection
 from me_toolbox.springs import HelicalCompressionSpring
 from me_toolbox.tools import percent_to_decimal
 
@@ -204,7 +204,8 @@ class ExtensionSpring(HelicalCompressionSpring):
         return {'n_body': n_body, 'n_hook_normal': n_hook_normal, 'n_hook_shear': n_hook_shear}
 
     def fatigue_analysis(self, max_force, min_force, reliability,
-                         criterion='gerber', z=-3, verbose=False, metric=True):
+                         criterion='gerber', z=-3, verbose=False, metric=True,
+                         mean_stress_correction='goodman'):
         """Fatigue analysis of the hook section, for normal and shear stress,and for the
         body section for shear and static yield.
 
@@ -215,12 +216,20 @@ class ExtensionSpring(HelicalCompressionSpring):
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for metal where N=5e8
         :param bool verbose: print more details
         :param bool metric: Metric or imperial
+        :param str or callable mean_stress_correction: The mean stress correction of the
+            number of cycles (see :class:`MeanStressCorrection`,
+            morrow and walker with their coefficients given explicitly)
 
         :returns: Normal and shear safety factors for the hook section and
             static and dynamic safety factors for body section
         :rtype: dict[str, float]
         """
 
+        # the body and hook shear strengths aren't tensile strengths
+        # (the morrow/walker defaults don't apply)
+        mean_stress_correction = MeanStressCorrection.get_correction(mean_stress_correction,
+                                                                     tensile_mpa=False)
+
         # calculating mean and alternating forces
         alt_force = abs(max_force - min_force) / 2
         mean_force = (max_force + min_force) / 2
@@ -246,14 +255,16 @@ class ExtensionSpring(HelicalCompressionSpring):
                                                hook_mean_normal_stress, criterion)
         N_hook_normal, Sf_hook_normal = FatigueAnalysis.calc_num_of_cycles(hook_mean_normal_stress,
                                                                            hook_alt_normal_stress,
-                                                                           Se, Sut, Sy_hook, z)
+                                                                           Se, Sut, Sy_hook, z,
+                                                                           mean_stress_correction)
 
         nf_hook_shear, ns_hook_shear = \
             FailureCriteria.get_safety_factors(Ssy_hook, Ssu, Sse, hook_alt_shear_stress,
                                                hook_mean_shear_stress, criterion)
         N_hook_shear, Sf_hook_shear = FatigueAnalysis.calc_num_of_cycles(hook_mean_shear_stress,
                                                                          hook_alt_shear_stress,
-                                                                         Sse, Ssu, Ssy_hook, z)
+                                                                         Sse, Ssu, Ssy_hook, z,
+                                                                         mean_stress_correction)
 
         # calculating mean and alternating stresses for the body section
         alt_body_shear_stress = self.calc_shear_stress(alt_force, self.factor_Kw)
@@ -269,7 +280,8 @@ class ExtensionSpring(HelicalCompressionSpring):
 
         N_body, Sf_body = FatigueAnalysis.calc_num_of_cycles(mean_body_shear_stress,
                                                          alt_body_shear_stress,
-                                                         Sse, Ssu, Ssy_body, z)
+                                                         Sse, Ssu, Ssy_body, z,
+                                                         mean_stress_correction)
         if verbose:
             print(f"Alternating force = {alt_force:.2f}, "
                   f"Mean force = {mean_force:.2f}\n\n"
@@ -1,11 +1,10 @@
 """A module containing the helical push spring class"""
-from math import pi  # , sqrt
+from math import pi
 
-from sympy import sqrt
-
-from me_toolbox.fatigue import FailureCriteria, FatigueAnalysis
+from me_toolbox.fatigue import FailureCriteria, FatigueAnalysis, MeanStressCorrection
 from me_toolbox.springs import Spring
 from me_toolbox.tools import percent_to_decimal
+from me_toolbox.tools.math_backend import sqrt
 
 
 class HelicalCompressionSpring(Spring):
@@ -270,7 +269,8 @@ class HelicalCompressionSpring(Spring):
         return self.shear_yield_strength / shear_stress
 
     def fatigue_analysis(self, max_force, min_force, reliability,
-                         criterion='modified goodman', z=-3, verbose=False, metric=True):
+                         criterion='modified goodman', z=-3, verbose=False, metric=True,
+                         mean_stress_correction='goodman'):
         """ Returns safety factors for fatigue and for first cycle according to Lange failure
         criteria.
 
@@ -281,12 +281,19 @@ class HelicalCompressionSpring(Spring):
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for metal where N=5e8
         :param bool verbose: print more details
         :param bool metric: Metric or imperial
+        :param str or callable mean_stress_correction: The mean stress correction of the
+            number of cycles (see :class:`MeanStressCorrection`,
+            morrow and walker with their coefficients given explicitly)
 
         :returns: static and dynamic safety factor
         :rtype: tuple[float, float, float, float] or tuple[float, float, float, None]
         """
         if max_force == min_force:
             raise ValueError("max_force can't equal the min_force")
+        # the strengths are shear strengths (the morrow/walker defaults don't apply)
+        mean_stress_correction = MeanStressCorrection.get_correction(mean_stress_correction,
+                                                                     tensile_mpa=False)
+
         # calculating mean and alternating forces
         alternating_force = abs(max_force - min_force) / 2
         mean_force = (max_force + min_force) / 2
@@ -301,7 +308,8 @@ class HelicalCompressionSpring(Spring):
         Ssy = self.shear_yield_strength
         nf, nl = FailureCriteria.get_safety_factors(Ssy, Ssu, Sse, alt_shear_stress,
                                                     mean_shear_stress, criterion)
-        N, Sf = FatigueAnalysis.calc_num_of_cycles(mean_shear_stress, alt_shear_stress, Sse, Ssu, Ssy, z)
+        N, Sf = FatigueAnalysis.calc_num_of_cycles(mean_shear_stress, alt_shear_stress, Sse, Ssu, Ssy, z,
+                                                   mean_stress_correction)
 
         if verbose:
             print(f"Alternating force = {alternating_force:.2f}, Mean force = {mean_force:.2f}\n"
@@ -234,7 +234,8 @@ class HelicalTorsionSpring(Spring):
         return self.yield_strength / self.max_stress
 
     def fatigue_analysis(self, max_moment, min_moment, fatigue_percent, reliability,
-                         criterion='gerber', z=-3, verbose=False):
+                         criterion='gerber', z=-3, verbose=False,
+                         mean_stress_correction='goodman'):
         """ Returns safety factors for fatigue and
         for first cycle according to Langer failure criteria.
 
@@ -245,6 +246,8 @@ class HelicalTorsionSpring(Spring):
         :param str criterion: fatigue criterion ('modified goodman', 'soderberg', 'gerber', 'asme-elliptic')
         :param float z: -3 for steel where N=1e6, -5 for metal where N=1e8, -5.69 for metal where N=5e8
         :param bool verbose: print more details
+        :param str or callable mean_stress_correction: The mean stress correction of the
+            number of cycles (see :class:`MeanStressCorrection`)
 
         :returns: static and dynamic safety factor
         :rtype: tuple[float, float]
@@ -263,7 +266,8 @@ class HelicalTorsionSpring(Spring):
         Sut = self.ultimate_tensile_strength
         Sy = self.yield_strength
         nf, nl = FailureCriteria.get_safety_factors(Sy, Sut, Se, alt_stress, mean_stress, criterion)
-        N, Sf = FatigueAnalysis.calc_num_of_cycles(mean_stress, alt_stress, Se, Sut, Sy, z)
+        N, Sf = FatigueAnalysis.calc_num_of_cycles(mean_stress, alt_stress, Se, Sut, Sy, z,
+                                                   mean_stress_correction)
         if verbose:
             print(f"Alternating moment = {alt_moment}, Mean moment = {mean_moment}\n\n"
                   f"Alternating stress = {alt_stress}, Mean stress = {mean_stress}\n\n"
@@ -1,12 +1,48 @@
 """A module containing the spring class"""
-import csv
-import os
+from bisect import bisect_left
+from collections import namedtuple
+
 import numpy as np
 
 from me_toolbox.tools import print_atributes
 from me_toolbox.tools import percent_to_decimal
+from me_toolbox.tools import register_table, get_table
 from abc import ABC, abstractmethod
 
+# wire materials table (loaded once, on first use)
+MATERIALS_TABLE = register_table(__package__, 'tables/ultimate _tensile_strength.csv',
+                                 names=True, dtype=None)
+
+# a material's diameter ranges (sorted) with their A and m values
+WireRanges = namedtuple('WireRanges', ['min_d', 'max_d', 'A', 'm'])
+
+
+# the materials table last parsed by _material_index and its index
+_material_cache = {'table': None, 'index': None}
+
+
+def _material_index():
+    """Parse the wire materials table once into a dictionary of
+    {material: {True: metric WireRanges, False: imperial WireRanges}},
+    the table is parsed again if the registry reloaded it (e.g. after a clear)
+    """
+    table = get_table(*MATERIALS_TABLE)
+    if _material_cache['table'] is table:
+        return _material_cache['index']
+
+    index = {}
+    for material in np.unique(table['type']):
+        rows = np.sort(table[table['type'] == material], order='min_d_mm')
+        m = tuple(rows['m'].astype(float).tolist())
+        index[str(material)] = {
+            metric: WireRanges(tuple(rows[f'min_d_{unit}'].astype(float).tolist()),
+                               tuple(rows[f'max_d_{unit}'].astype(float).tolist()),
+                               tuple(rows[f'A_{unit}'].astype(float).tolist()), m)
+            for metric, unit in ((True, 'mm'), (False, 'in'))}
+    _material_cache.update(table=table, index=index)
+    return index
+
+
 class Spring(ABC):
 
     def __repr__(self):
@@ -172,8 +208,8 @@ class Spring(ABC):
 
     @staticmethod
     def material_prop(material, diameter, metric=True, verbose=False):
-        """Reads table A_and_m.csv from file and returns the Sut estimation from the material
-         properties Ap and m
+        """Returns the Sut estimation from the material properties Ap and m
+        (from the ultimate_tensile_strength table)
         :param str material: The spring's material
         :param float diameter: Wire diameter
         :param bool metric: Metric or imperial
@@ -182,30 +218,62 @@ class Spring(ABC):
         :returns: ultimate tensile strength (Sut)
         :rtype: float
         """
+        ranges = Spring._material_ranges(material, metric)
 
-        path = os.path.dirname(__file__) + "\\tables\\ultimate _tensile_strength.csv"
-        with open(path, newline='') as file:
-            reader = csv.DictReader(file)
-            table = []
-            available_types = []
-            for line in reader:
-                table.append(line)
-                available_types.append(line['type'])
-
-        for line in table:
-            min_d = float(line['min_d_mm'] if metric else line['min_d_in'])
-            max_d = float(line['max_d_mm'] if metric else line['max_d_in'])
-            if line['type'] == material.lower() and min_d <= diameter <= max_d:
-                A, m = float(line['A_mm'] if metric else line['A_in']), float(line['m'])
-                if verbose:
-                    print(f"A={A}, m={m}")
-                return A / (diameter ** m)
-
-        if material not in available_types:
-            raise KeyError("The material is unknown")
-        else:
+        # first diameter range with an upper bound not smaller than the diameter
+        index = bisect_left(ranges.max_d, diameter)
+        if index == len(ranges.max_d) or diameter < ranges.min_d[index]:
             raise ValueError("The diameter don't match any of the values in the table")
 
+        A, m = ranges.A[index], ranges.m[index]
+        if verbose:
+            print(f"A={A}, m={m}")
+        return A / (diameter ** m)
+
+    @staticmethod
+    def material_prop_batch(material, diameter, metric=True):
+        """Vectorized version of :meth:`material_prop`, returns the Sut estimation
+        for arrays of wire diameters and/or materials
+
+        :param str or np.ndarray material: The spring's material (broadcast against diameter)
+        :param np.ndarray diameter: Wire diameters
+        :param bool metric: Metric or imperial
+
+        :returns: ultimate tensile strength (Sut), nan where the diameter is out of the
+            material's range, and the in-range mask
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        materials, diameters = np.broadcast_arrays(np.asarray(material, dtype=str),
+                                                   np.asarray(diameter, dtype=float))
+        Sut = np.full(diameters.shape, np.nan)
+        in_range = np.zeros(diameters.shape, dtype=bool)
+
+        for name in np.unique(materials):
+            ranges = Spring._material_ranges(name, metric)
+            selected = materials == name
+            d = diameters[selected]
+
+            index = np.searchsorted(ranges.max_d, d, side='left')
+            clipped = np.minimum(index, len(ranges.max_d) - 1)
+            valid = (index < len(ranges.max_d)) & (d >= np.take(ranges.min_d, clipped))
+
+            in_range[selected] = valid
+            with np.errstate(invalid='ignore', divide='ignore'):
+                Sut[selected] = np.where(valid, np.take(ranges.A, clipped) /
+                                         d ** np.take(ranges.m, clipped), np.nan)
+        return Sut, in_range
+
+    @staticmethod
+    def _material_ranges(material, metric):
+        """Returns the material's diameter ranges and their A and m values
+
+        :raises KeyError: if the material is unknown
+        """
+        try:
+            return _material_index()[material.lower()][metric]
+        except KeyError:
+            raise KeyError("The material is unknown")
+
     @abstractmethod
     def static_analysis(self):
         pass
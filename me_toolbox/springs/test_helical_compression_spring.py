@@ -114,6 +114,18 @@ class TestHelicalCompressionSpring(unittest.TestCase):
     def test_fatigue_analysis_nf_less_then_one(self):
         self.assertEqual(self.result2, (0.7915777277160205, 1.1068245376197978, 97221.28061023176, 468.23730587509914))
 
+    def test_fatigue_analysis_mean_stress_correction(self):
+        nf, nl, N, Sf = self.spring.fatigue_analysis(max_force=1000, min_force=100,
+                                                     reliability=99.999,
+                                                     mean_stress_correction='gerber')
+        self.assertEqual((nf, nl), self.result2[:2])
+        # the Gerber correction is less conservative than the default Goodman correction
+        self.assertGreater(N, self.result2[2])
+        # the morrow and walker defaults are estimated for tensile strengths
+        with self.assertRaises(ValueError):
+            self.spring.fatigue_analysis(max_force=1000, min_force=100, reliability=99.999,
+                                         mean_stress_correction='morrow')
+
     def test_buckling(self):
         _, free_length = self.spring.buckling('fixed-hinged')
         self.assertAlmostEqual(free_length, 190.139768448083)
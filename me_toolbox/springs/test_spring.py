@@ -0,0 +1,52 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from me_toolbox.springs import Spring
+from me_toolbox.springs.spring import MATERIALS_TABLE
+from me_toolbox.tools import get_table
+
+
+class TestMaterialProp(unittest.TestCase):
+    def test_material_prop(self):
+        self.assertEqual(Spring.material_prop('music wire', 6), 1705.1273138665858)
+        self.assertEqual(Spring.material_prop('Music Wire', 6),
+                         Spring.material_prop('music wire', 6))
+
+    def test_range_boundary(self):
+        # 2.5 [mm] is the upper bound of a range and the lower bound of the next one,
+        # the first matching range is used
+        self.assertAlmostEqual(Spring.material_prop('302 stainless wire', 2.5), 1867 / 2.5 ** 0.146)
+
+    def test_errors(self):
+        with self.assertRaises(KeyError):
+            Spring.material_prop('unobtainium', 6)
+        with self.assertRaises(ValueError):
+            Spring.material_prop('music wire', 100)
+
+    def test_material_prop_batch(self):
+        diameters = np.array([0.1, 2.5, 6, 100])
+        Sut, in_range = Spring.material_prop_batch('302 stainless wire', diameters)
+        np.testing.assert_array_equal(in_range, [False, True, True, False])
+        for d, value in zip(diameters[in_range], Sut[in_range]):
+            self.assertAlmostEqual(value, Spring.material_prop('302 stainless wire', d))
+        self.assertTrue(np.isnan(Sut[~in_range]).all())
+
+    def test_material_prop_batch_materials(self):
+        materials = ['music wire', 'hard-drawn wire', 'music wire']
+        Sut, in_range = Spring.material_prop_batch(materials, [6, 6, 7], metric=True)
+        np.testing.assert_array_equal(in_range, [True, True, False])
+        self.assertAlmostEqual(Sut[1], Spring.material_prop('hard-drawn wire', 6))
+
+    def test_reloaded_table(self):
+        # a table reloaded by the registry replaces the parsed materials
+        table = get_table(*MATERIALS_TABLE).copy()
+        table['A_mm'] *= 2
+        with mock.patch('me_toolbox.springs.spring.get_table', return_value=table):
+            self.assertAlmostEqual(Spring.material_prop('music wire', 6), 2 * 1705.1273138665858)
+        self.assertEqual(Spring.material_prop('music wire', 6), 1705.1273138665858)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# maximal import time [s] of a sub-package (including numpy) in a fresh interpreter
+IMPORT_TIME_BUDGET = 1.5
+
+# packages that mustn't be imported by the numerical paths
+HEAVY_MODULES = ('sympy', 'mpmath', 'icecream')
+
+SCRIPT = """
+import json, sys
+from time import perf_counter
+start = perf_counter()
+import {package}
+print(json.dumps({{'time': perf_counter() - start,
+                   'modules': [name for name in {heavy} if name in sys.modules]}}))
+"""
+
+
+def measure_import(package):
+    """Import the package in a fresh interpreter, returns the import time and
+    the heavy modules it imported"""
+    script = SCRIPT.format(package=package, heavy=HEAVY_MODULES)
+    # run from the directory containing me_toolbox
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            check=True, cwd=root).stdout
+    return json.loads(output)
+
+
+class TestImportTime(unittest.TestCase):
+    def check_import(self, package):
+        result = measure_import(package)
+        self.assertEqual(result['modules'], [], f"{package} imports {result['modules']}")
+        self.assertLess(result['time'], IMPORT_TIME_BUDGET,
+                        f"importing {package} took {result['time']:.3f}[s]")
+
+    def test_fatigue(self):
+        self.check_import('me_toolbox.fatigue')
+
+    def test_springs(self):
+        self.check_import('me_toolbox.springs')
+
+
+if __name__ == '__main__':
+    unittest.main()
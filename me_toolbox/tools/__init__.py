@@ -1,4 +1,9 @@
-from me_toolbox.tools.table_interpolation import table_interpolation
+from me_toolbox.tools.table_interpolation import table_interpolation, table_interpolation_batch
+from me_toolbox.tools.table_interpolation import TableInterpolator
 from me_toolbox.tools.table_interpolation import NotInRangeError
 from me_toolbox.tools.helpers import *
-from me_toolbox.tools.stress import *
\ No newline at end of file
+from me_toolbox.tools.stress import *
+from me_toolbox.tools.table_registry import TableRegistry, table_registry
+from me_toolbox.tools.table_registry import register_table, get_table, get_interpolator
+from me_toolbox.tools.table_registry import compile_tables, table_stats
+from me_toolbox.tools.math_backend import set_symbolic, is_symbolic, symbolic_mode
@@ -0,0 +1,11 @@
+"""Build step compiling the tables bundled with the package into a memory-mappable format
+
+usage: python -m me_toolbox.tools.build_tables
+"""
+# importing the packages registers their tables
+import me_toolbox.gears  # pylint: disable=unused-import
+import me_toolbox.springs  # pylint: disable=unused-import
+from me_toolbox.tools import compile_tables
+
+if __name__ == '__main__':
+    compile_tables(verbose=True)
@@ -73,74 +73,168 @@ def parse_input(obj, fields, kwargs):
 
 
 # unit conversions
-def conversion(val, factor):
+def conversion(val, factor, out=None):
     """Multiply the value by the conversion factor
 
-    :param float or list val: Value to convert
+    Note: lists are returned as lists, any other array-like (e.g. np.ndarray)
+    is multiplied as a numpy array without being copied to a list first
+
+    :param float or list or np.ndarray val: Value to convert
     :param factor: The conversion factor
+    :param np.ndarray or None out: Array to write the result to (may be val itself),
+        like numpy's out argument
 
-    :rtype: float or list
+    :rtype: float or list or np.ndarray
     """
-    if not isinstance(val, int) and not isinstance(val, float) and not isinstance(val, list):
-        raise ValueError(f"{type(val)} is not valid input type for this function")
-    if not isinstance(val, list):
-        return val * factor
-    else:
+    if isinstance(val, list):
+        if out is not None:
+            return np.multiply(val, factor, out=out)
         return [x * factor for x in val]
+    if out is None and isinstance(val, (int, float)):
+        return val * factor
+
+    array = np.asarray(val) if not isinstance(val, (str, bytes)) else None
+    if array is None or array.dtype.kind not in 'biuf':
+        raise ValueError(f"{type(val)} is not valid input type for this function")
+    return np.multiply(array, factor, out=out)
+
+
+# the conversion factors of the unit conversion functions
+UNIT_FACTORS = {
+    'lbs_per_in_to_newtons_per_mm': 0.175,
+    'newtons_per_mm_to_lbs_per_in': 5.71,
+    'lbs_to_newtons': 4.448,
+    'newtons_to_lbs': 0.2248,
+    'inch_to_millimetre': 25.4,
+    'millimetre_to_inch': 1 / 25.4,
+    'Nmm_per_rad_to_Nmm_per_deg': (2 * np.pi) / 360,
+    'Nmm_per_deg_to_Nmm_per_rad': 360 / (2 * np.pi),
+    'Nm_per_rad_to_Nmm_per_deg': 1e3 * ((2 * np.pi) / 360),
+    'Nmm_per_deg_to_Nm_per_rad': 1e-3 * (360 / (2 * np.pi)),
+}
 
 
-def lbs_per_in_to_newtons_per_mm(val: float or list) -> float or list:
+def lbs_per_in_to_newtons_per_mm(val: float or list, out=None) -> float or list:
     """converts lbs/in to N/mm"""
-    return conversion(val, 0.175)
+    return conversion(val, UNIT_FACTORS['lbs_per_in_to_newtons_per_mm'], out)
 
 
-def newtons_per_mm_to_lbs_per_in(val: float or list) -> float or list:
+def newtons_per_mm_to_lbs_per_in(val: float or list, out=None) -> float or list:
     """convert newtons to pound max_force"""
-    return conversion(val, 5.71)
+    return conversion(val, UNIT_FACTORS['newtons_per_mm_to_lbs_per_in'], out)
 
 
-def lbs_to_newtons(val: float or list) -> float or list:
+def lbs_to_newtons(val: float or list, out=None) -> float or list:
     """converts lbs/in to N/mm"""
-    return conversion(val, 4.448)
+    return conversion(val, UNIT_FACTORS['lbs_to_newtons'], out)
 
 
-def newtons_to_lbs(val: float or list) -> float or list:
+def newtons_to_lbs(val: float or list, out=None) -> float or list:
     """convert newtons to pound max_force"""
-    return conversion(val, 0.2248)
+    return conversion(val, UNIT_FACTORS['newtons_to_lbs'], out)
 
 
-def inch_to_millimetre(val: float or list) -> float or list:
+def inch_to_millimetre(val: float or list, out=None) -> float or list:
     """converts inches to millimeters"""
-    return conversion(val, 25.4)
+    return conversion(val, UNIT_FACTORS['inch_to_millimetre'], out)
 
 
-def millimetre_to_inch(val: float or list) -> float or list:
+def millimetre_to_inch(val: float or list, out=None) -> float or list:
     """converts millimetres to inches"""
-    return conversion(val, 1/25.4)
+    return conversion(val, UNIT_FACTORS['millimetre_to_inch'], out)
 
 
-def Nmm_per_rad_to_Nmm_per_deg(val: float or list) -> float or list:
+def Nmm_per_rad_to_Nmm_per_deg(val: float or list, out=None) -> float or list:
     """converts millimetres to inches"""
-    return conversion(val, (2 * np.pi) / 360)
+    return conversion(val, UNIT_FACTORS['Nmm_per_rad_to_Nmm_per_deg'], out)
 
 
-def Nmm_per_deg_to_Nmm_per_rad(val: float or list) -> float or list:
+def Nmm_per_deg_to_Nmm_per_rad(val: float or list, out=None) -> float or list:
     """converts millimetres to inches"""
-    return conversion(val, 360 / (2 * np.pi))
+    return conversion(val, UNIT_FACTORS['Nmm_per_deg_to_Nmm_per_rad'], out)
 
 
-def Nm_per_rad_to_Nmm_per_deg(val: float or list) -> float or list:
+def Nm_per_rad_to_Nmm_per_deg(val: float or list, out=None) -> float or list:
     """converts millimetres to inches"""
-    return conversion(val, 1e3 * ((2 * np.pi) / 360))
+    return conversion(val, UNIT_FACTORS['Nm_per_rad_to_Nmm_per_deg'], out)
 
 
-def Nmm_per_deg_to_Nm_per_rad(val: float or list) -> float or list:
+def Nmm_per_deg_to_Nm_per_rad(val: float or list, out=None) -> float or list:
     """converts millimetres to inches"""
-    return conversion(val, 1e-3 * (360 / (2 * np.pi)))
+    return conversion(val, UNIT_FACTORS['Nmm_per_deg_to_Nm_per_rad'], out)
 
 
-def percent_to_decimal(var: float or list or tuple) -> float or list:
-    """if input in percent (>=1) convert to decimal"""
+def convert_record_array(records, conversions, out=None):
+    """Convert the columns of a record (structured) array in one pass,
+    columns without a conversion are copied as is (converted integer columns
+    are promoted to float in the returned array)
+
+    .. code-block:: python
+
+        converted = convert_record_array(sweep, {'d': 'inch_to_millimetre',
+                                                 'F': 'lbs_to_newtons',
+                                                 'k': 0.175})
+
+    :param np.ndarray records: A structured array
+    :param dict conversions: {column name: conversion} where the conversion is
+        a name from :data:`UNIT_FACTORS` or a conversion factor
+    :param np.ndarray or None out: Structured array to write the result to
+        (pass the records array itself to convert in-place)
+
+    :returns: The converted records
+    :rtype: np.ndarray
+    :raises TypeError: if a converted column of out can't hold the converted values
+    """
+    if records.dtype.names is None:
+        raise ValueError("records is not a structured array")
+    unknown = set(conversions) - set(records.dtype.names)
+    if unknown:
+        raise KeyError(f"records has no {', '.join(sorted(unknown))} column(s)")
+
+    factors = {}
+    for name, factor in conversions.items():
+        if isinstance(factor, str):
+            try:
+                factor = UNIT_FACTORS[factor]
+            except KeyError:
+                raise KeyError(f"Unknown unit conversion - {factor}\n"
+                               f"Available conversions are: {', '.join(UNIT_FACTORS)}")
+        factors[name] = factor
+
+    if out is None:
+        # the converted columns get the type of the converted values (int * float -> float)
+        dtype = np.dtype([(name, np.result_type(records.dtype[name], factors[name])
+                           if name in factors else records.dtype[name])
+                          for name in records.dtype.names])
+        out = np.empty(records.shape, dtype=dtype)
+        for name in records.dtype.names:
+            out[name] = records[name]
+    else:
+        for name, factor in factors.items():
+            converted = np.result_type(records.dtype[name], factor)
+            if not np.can_cast(converted, out.dtype[name], casting='same_kind'):
+                raise TypeError(f"The {name} column of out ({out.dtype[name]}) can't hold "
+                                f"the converted values ({converted})")
+        if out is not records:
+            out[...] = records
+    for name, factor in factors.items():
+        np.multiply(out[name], factor, out=out[name])
+    return out
+
+
+def percent_to_decimal(var: float or list or tuple, out=None) -> float or list:
+    """if input in percent (>=1) convert to decimal
+
+    Note: lists and tuples are returned as lists, numpy arrays element-wise
+    as numpy arrays (written to out if given)
+    """
+    if isinstance(var, np.ndarray) or out is not None:
+        if out is None:
+            out = np.array(var, dtype=float)
+        elif out is not var:
+            np.copyto(out, var)
+        # only the values in percentage form are divided by 100
+        return np.divide(out, 100, out=out, where=out >= 1)
     if not isinstance(var, list) and not isinstance(var, tuple):
         dec = var / 100 if var >= 1 else var
     else:
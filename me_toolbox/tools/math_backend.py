@@ -0,0 +1,72 @@
+"""module containing the math backend used by the numerical calculations,
+plain numbers are handled by the math module and arrays by numpy,
+sympy is only used in symbolic mode (and only imported then)
+"""
+import math
+from contextlib import contextmanager
+from numbers import Real
+
+import numpy as np
+
+_symbolic = False
+
+
+def set_symbolic(enabled=True):
+    """Enable (or disable) the symbolic mode, in symbolic mode
+    sympy expressions can be passed to the calculations (requires sympy)
+
+    :param bool enabled: True to enable the symbolic mode
+    """
+    global _symbolic
+    if enabled:
+        import sympy  # pylint: disable=import-outside-toplevel, unused-import
+    _symbolic = bool(enabled)
+
+
+def is_symbolic():
+    """Returns True if the symbolic mode is enabled
+
+    :rtype: bool
+    """
+    return _symbolic
+
+
+@contextmanager
+def symbolic_mode():
+    """Context manager enabling the symbolic mode inside a with block
+
+    .. code-block:: python
+
+        with symbolic_mode():
+            fatigue = FatigueAnalysis(..., alt_normal_stress=symbols('F') / A, ...)
+    """
+    previous = _symbolic
+    set_symbolic(True)
+    try:
+        yield
+    finally:
+        set_symbolic(previous)
+
+
+def sqrt(x):
+    """Square root of a number, an array (element-wise)
+    or a sympy expression (in symbolic mode)
+
+    :param float or np.ndarray x: The value
+
+    :rtype: float or np.ndarray
+    :raises TypeError: if x is symbolic and the symbolic mode is disabled
+    """
+    if isinstance(x, (np.ndarray, np.generic)):
+        return np.sqrt(x)
+    if isinstance(x, Real):
+        return math.sqrt(x)
+    if _symbolic:
+        import sympy  # pylint: disable=import-outside-toplevel
+        return sympy.sqrt(x)
+    try:
+        return math.sqrt(x)
+    except TypeError:
+        raise TypeError(f"can't calculate the square root of {x!r} ({type(x).__name__}), "
+                        f"for symbolic expressions enable the symbolic mode with "
+                        f"me_toolbox.tools.set_symbolic() or me_toolbox.tools.symbolic_mode()")
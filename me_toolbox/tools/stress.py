@@ -1,4 +1,12 @@
 """A module containing stress calculation functions"""
+from collections import namedtuple
+
+import numpy as np
+
+__all__ = ['uniform_stress', 'bending_stress', 'shear_bending_stress', 'torsion_stress',
+           'max_shear_stress', 'SectionStresses', 'StressEnvelope', 'stress_tensor',
+           'principal_stresses', 'von_mises_stress', 'tresca_stress', 'section_stresses',
+           'iter_section_stresses', 'stress_envelope']
 
 
 # TODO: better stress calculation
@@ -78,3 +86,179 @@ def max_shear_stress(V, A, shape):
         return (3 * V) / (2 * A)
     else:
         raise ValueError(f"shape = {shape} is unknown")
+
+
+# batched (array) stress calculations
+# number of array elements (load cases x points) evaluated at once by the chunked functions
+CHUNK_ELEMENTS = 2 ** 20
+
+SectionStresses = namedtuple('SectionStresses', ['normal', 'shear_xy', 'shear_xz', 'principal',
+                                                 'von_mises', 'tresca'])
+SectionStresses.__doc__ = """Stresses of load cases (rows) at cross-section points (columns),
+principal has an extra last axis of the 3 principal stresses in descending order"""
+
+StressEnvelope = namedtuple('StressEnvelope', ['von_mises', 'von_mises_case',
+                                               'tresca', 'tresca_case'])
+StressEnvelope.__doc__ = """Maximal equivalent stresses at every cross-section point
+and the index of the load case causing them"""
+
+
+def stress_tensor(sx, sy=0, sz=0, txy=0, tyz=0, txz=0):
+    """Stack stress components into (..., 3, 3) stress tensors
+
+    :param float or np.ndarray sx: Normal stress in the x direction
+    :param float or np.ndarray sy: Normal stress in the y direction
+    :param float or np.ndarray sz: Normal stress in the z direction
+    :param float or np.ndarray txy: Shear stress in the xy plane
+    :param float or np.ndarray tyz: Shear stress in the yz plane
+    :param float or np.ndarray txz: Shear stress in the xz plane
+
+    :returns: Stress tensors
+    :rtype: np.ndarray
+    """
+    sx, sy, sz, txy, tyz, txz = np.broadcast_arrays(*(np.asarray(s, dtype=float) for s in
+                                                      (sx, sy, sz, txy, tyz, txz)))
+    tensor = np.empty(sx.shape + (3, 3))
+    tensor[..., 0, 0], tensor[..., 1, 1], tensor[..., 2, 2] = sx, sy, sz
+    tensor[..., 0, 1] = tensor[..., 1, 0] = txy
+    tensor[..., 1, 2] = tensor[..., 2, 1] = tyz
+    tensor[..., 0, 2] = tensor[..., 2, 0] = txz
+    return tensor
+
+
+def principal_stresses(sx, sy=0, sz=0, txy=0, tyz=0, txz=0):
+    """Principal stresses of any number of stress states (element-wise on the components)
+
+    :returns: The principal stresses in descending order (σ1, σ2, σ3) along the last axis
+    :rtype: np.ndarray
+    """
+    # eigvalsh returns the eigenvalues of symmetric matrices in ascending order
+    return np.linalg.eigvalsh(stress_tensor(sx, sy, sz, txy, tyz, txz))[..., ::-1]
+
+
+def von_mises_stress(sx, sy=0, sz=0, txy=0, tyz=0, txz=0):
+    """Von Mises equivalent stress (element-wise on the components)
+
+    :rtype: float or np.ndarray
+    """
+    return np.sqrt(0.5 * ((sx - sy) ** 2 + (sy - sz) ** 2 + (sz - sx) ** 2) +
+                   3 * (txy ** 2 + tyz ** 2 + txz ** 2))
+
+
+def tresca_stress(sx, sy=0, sz=0, txy=0, tyz=0, txz=0):
+    """Tresca equivalent stress (σ1 - σ3, element-wise on the components)
+
+    :rtype: float or np.ndarray
+    """
+    principal = principal_stresses(sx, sy, sz, txy, tyz, txz)
+    return principal[..., 0] - principal[..., 2]
+
+
+def section_stresses(y, z, A, Iy, Iz, J, N=0, My=0, Mz=0, T=0, Vy=0, Vz=0,
+                     Qy=None, Qz=None, b=None):
+    """Stresses of M load cases at N cross-section points in one vectorized call,
+    the sign conventions are those of :func:`bending_stress` and :func:`shear_bending_stress`
+
+    Note: the load arrays (N, My, Mz, T, Vy, Vz) are of length M (or scalars),
+    the point arrays (y, z, Qy, Qz, b) are of length N (or scalars),
+    the results are (M, N) arrays
+
+    :param np.ndarray y: Points y coordinates
+    :param np.ndarray z: Points z coordinates
+    :param float A: Cross section area
+    :param float Iy: Area moment of inertia around the y axis
+    :param float Iz: Area moment of inertia around the z axis
+    :param float J: Cross section polar moment of inertia
+    :param np.ndarray N: Normal forces
+    :param np.ndarray My: Bending moments around the y axis
+    :param np.ndarray Mz: Bending moments around the z axis
+    :param np.ndarray T: Torques
+    :param np.ndarray Vy: Shear forces in the y direction
+    :param np.ndarray Vz: Shear forces in the z direction
+    :param np.ndarray or None Qy: First moment of area for Vz at the points
+    :param np.ndarray or None Qz: First moment of area for Vy at the points
+    :param np.ndarray or None b: Section thickness at the points (for the transverse shear)
+
+    :rtype: SectionStresses
+    """
+    loads = [np.atleast_1d(np.asarray(load, dtype=float))[:, np.newaxis]
+             for load in (N, My, Mz, T, Vy, Vz)]
+    N, My, Mz, T, Vy, Vz = np.broadcast_arrays(*loads)
+    y, z = (np.atleast_1d(np.asarray(coordinate, dtype=float))[np.newaxis, :]
+            for coordinate in (y, z))
+
+    normal = uniform_stress(N, A) + bending_stress(My, Iy, z) - (Mz / Iz) * y
+    # torsion shear is perpendicular to the radius (τxy = -T*z/J, τxz = T*y/J)
+    shear_xy = -torsion_stress(T, z, J)
+    shear_xz = torsion_stress(T, y, J)
+    if b is not None:
+        if Qz is not None:
+            shear_xy = shear_xy + shear_bending_stress(Vy, np.asarray(Qz, dtype=float), Iz,
+                                                       np.asarray(b, dtype=float))
+        if Qy is not None:
+            shear_xz = shear_xz + shear_bending_stress(Vz, np.asarray(Qy, dtype=float), Iy,
+                                                       np.asarray(b, dtype=float))
+    normal, shear_xy, shear_xz = np.broadcast_arrays(normal, shear_xy, shear_xz)
+    return _uniaxial_shear_state(normal, shear_xy, shear_xz)
+
+
+def iter_section_stresses(y, z, A, Iy, Iz, J, N=0, My=0, Mz=0, T=0, Vy=0, Vz=0,
+                          Qy=None, Qz=None, b=None, chunk_elements=CHUNK_ELEMENTS):
+    """Evaluate :func:`section_stresses` in chunks of load cases,
+    so the memory used is bounded for any number of load cases
+
+    :param int chunk_elements: Maximal number of (load case, point) pairs in a chunk
+
+    :returns: Generator of the load cases slice and their stresses
+    :rtype: Iterator[tuple[slice, SectionStresses]]
+    """
+    loads = np.broadcast_arrays(*(np.atleast_1d(np.asarray(load, dtype=float))
+                                  for load in (N, My, Mz, T, Vy, Vz)))
+    num_of_points = np.broadcast(np.atleast_1d(y), np.atleast_1d(z)).size
+    cases_per_chunk = max(1, chunk_elements // num_of_points)
+    for start in range(0, loads[0].size, cases_per_chunk):
+        cases = slice(start, min(start + cases_per_chunk, loads[0].size))
+        yield cases, section_stresses(y, z, A, Iy, Iz, J, *(load[cases] for load in loads),
+                                      Qy=Qy, Qz=Qz, b=b)
+
+
+def stress_envelope(y, z, A, Iy, Iz, J, N=0, My=0, Mz=0, T=0, Vy=0, Vz=0,
+                    Qy=None, Qz=None, b=None, chunk_elements=CHUNK_ELEMENTS):
+    """The maximal von Mises and Tresca stresses at every cross-section point over all
+    the load cases (see :func:`section_stresses`), evaluated in chunks of load cases
+
+    :param int chunk_elements: Maximal number of (load case, point) pairs in a chunk
+
+    :rtype: StressEnvelope
+    """
+    von_mises = tresca = von_mises_case = tresca_case = None
+    for cases, stresses in iter_section_stresses(y, z, A, Iy, Iz, J, N, My, Mz, T, Vy, Vz,
+                                                 Qy, Qz, b, chunk_elements):
+        points = np.arange(stresses.von_mises.shape[1])
+        chunk_von_mises_case = np.argmax(stresses.von_mises, axis=0)
+        chunk_tresca_case = np.argmax(stresses.tresca, axis=0)
+        chunk_von_mises = stresses.von_mises[chunk_von_mises_case, points]
+        chunk_tresca = stresses.tresca[chunk_tresca_case, points]
+        if von_mises is None:
+            von_mises, tresca = chunk_von_mises, chunk_tresca
+            von_mises_case, tresca_case = chunk_von_mises_case, chunk_tresca_case
+            continue
+        larger = chunk_von_mises > von_mises
+        von_mises = np.where(larger, chunk_von_mises, von_mises)
+        von_mises_case = np.where(larger, chunk_von_mises_case + cases.start, von_mises_case)
+        larger = chunk_tresca > tresca
+        tresca = np.where(larger, chunk_tresca, tresca)
+        tresca_case = np.where(larger, chunk_tresca_case + cases.start, tresca_case)
+    return StressEnvelope(von_mises, von_mises_case, tresca, tresca_case)
+
+
+def _uniaxial_shear_state(normal, shear_xy, shear_xz):
+    """Principal and equivalent stresses of a normal stress (σx) with shear stresses
+    (τxy, τxz) in closed form (the other components are zero)
+    """
+    shear_squared = shear_xy ** 2 + shear_xz ** 2
+    radius = np.sqrt((0.5 * normal) ** 2 + shear_squared)
+    principal = np.stack([0.5 * normal + radius, np.zeros_like(normal),
+                          0.5 * normal - radius], axis=-1)
+    von_mises = np.sqrt(normal ** 2 + 3 * shear_squared)
+    return SectionStresses(normal, shear_xy, shear_xz, principal, von_mises, 2 * radius)
@@ -1,19 +1,27 @@
-"""module containing the table interpolation function"""
+"""module containing the table interpolation functions and the TableInterpolator class"""
+from bisect import bisect_right
+
 import numpy as np
 
 
 class NotInRangeError(ValueError):
-    def __init__(self, var, num, range_):
+    def __init__(self, var, num, range_, indices=None):
         """Error for when value is not in the specified range
 
         :param str var: var assigned to
-        :param float num: num to assign
+        :param float or np.ndarray num: num to assign (or all the offending values)
         :param tuple range_: permitted range
+        :param np.ndarray or None indices: indexes of the offending values (for batched input)
         """
 
         self.num = num
         self.range_ = range_
-        self.msg = f"{var} = {num} not in range {range_}"
+        self.indices = indices
+        if indices is None:
+            self.msg = f"{var} = {num} not in range {range_}"
+        else:
+            self.msg = f"{var} not in range {range_} at indices {indices.tolist()} " \
+                       f"(values {np.asarray(num).tolist()})"
         super().__init__(self.msg)
 
 
@@ -79,3 +87,165 @@ def table_interpolation(x_row, x_col, data):
         result = np.interp(x_col, range_, bounds)
 
     return result
+
+
+def table_interpolation_batch(x_rows, x_cols, data, errors='raise'):
+    """Vectorized version of :func:`table_interpolation`, interpolate the values in the table
+    corresponding to arrays of coordinates
+
+    :param np.ndarray x_rows: the x rows from which to retrieve the values
+    :param np.ndarray x_cols: the x cols from which to retrieve the values
+        (broadcast against x_rows)
+    :param np.ndarray data: the table as numpy array
+    :param str errors: 'raise' - raise NotInRangeError listing all the out of range points,
+        'mask' - return nan for the out of range points together with an in-range mask
+
+    :returns: the interpolated values (and the in-range mask if errors='mask')
+    :rtype: np.ndarray or tuple[np.ndarray, np.ndarray]
+
+    :raises NotInRangeError: if errors='raise' and any of the points is out of the table range
+    """
+    return _batch_interpolation(data[1:, 0], data[0, 1:], data[1:, 1:], x_rows, x_cols, errors)
+
+
+def _batch_interpolation(rows, cols, values, x_rows, x_cols, errors):
+    """Interpolate the values table (without its axes) on arrays of coordinates"""
+    if errors not in ('raise', 'mask'):
+        raise ValueError(f"errors={errors} but it can only be 'raise' or 'mask'")
+
+    x_rows, x_cols = np.broadcast_arrays(np.asarray(x_rows, dtype=float),
+                                         np.asarray(x_cols, dtype=float))
+
+    in_range = ((x_rows >= rows[0]) & (x_rows <= rows[-1]) &
+                (x_cols >= cols[0]) & (x_cols <= cols[-1]))
+
+    if errors == 'raise' and not in_range.all():
+        # report every offending point and not just the first one
+        indices = np.flatnonzero(~in_range)
+        points = np.column_stack((x_rows.ravel()[indices], x_cols.ravel()[indices]))
+        range_ = ((float(rows[0]), float(rows[-1])), (float(cols[0]), float(cols[-1])))
+        raise NotInRangeError("(x_row, x_col)", points, range_, indices)
+
+    result = _bilinear(rows, cols, values, x_rows, x_cols)
+    if errors == 'mask':
+        result[~in_range] = np.nan
+        return result, in_range
+    return result
+
+
+def _cells(axis, x):
+    """Returns the lower and upper neighbors indexes of x on the axis
+    and the distance of x from its lower neighbor (one searchsorted for the whole batch)
+    """
+    last = len(axis) - 1
+    low = np.clip(np.searchsorted(axis, x, side='right') - 1, 0, last)
+    high = np.minimum(low + 1, last)
+    return low, high, x - axis[low]
+
+
+def _interp(distance, low_value, high_value, span):
+    """Linear interpolation the same way np.interp does it
+    (exact hits return the table value)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = (high_value - low_value) / span
+        return np.where(distance == 0, low_value, slope * distance + low_value)
+
+
+def _bilinear(rows, cols, values, x_rows, x_cols):
+    """Bilinear interpolation of the values table on the rows and cols axes,
+    first along the rows and then along the columns like :func:`table_interpolation`
+    """
+    row_low, row_high, row_distance = _cells(rows, x_rows)
+    col_low, col_high, col_distance = _cells(cols, x_cols)
+    row_span = rows[row_high] - rows[row_low]
+
+    lower_bound = _interp(row_distance, values[row_low, col_low], values[row_high, col_low],
+                          row_span)
+    upper_bound = _interp(row_distance, values[row_low, col_high], values[row_high, col_high],
+                          row_span)
+    return _interp(col_distance, lower_bound, upper_bound, cols[col_high] - cols[col_low])
+
+
+class TableInterpolator:
+    """Interpolator of a fixed table, the axes, bounds and cells spans are computed once
+    so each call only does the interpolation itself.
+    Gives identical results to :func:`table_interpolation`
+    """
+
+    def __init__(self, data):
+        """Instantiating TableInterpolator object
+
+        :param np.ndarray data: the table as numpy array, the first row and column hold the
+            table's axes (like in :func:`table_interpolation`)
+        """
+        self.rows = np.array(data[1:, 0], dtype=float)
+        self.cols = np.array(data[0, 1:], dtype=float)
+        self.values = np.array(data[1:, 1:], dtype=float)
+        for array in (self.rows, self.cols, self.values):
+            array.setflags(write=False)
+
+        # plain python copies for the scalar path (avoids numpy dispatch overhead)
+        self._rows = self.rows.tolist()
+        self._cols = self.cols.tolist()
+        self._values = self.values.tolist()
+        self._row_spans = [high - low for low, high in zip(self._rows, self._rows[1:])] + [0.0]
+        self._col_spans = [high - low for low, high in zip(self._cols, self._cols[1:])] + [0.0]
+        self.row_range = (self._rows[0], self._rows[-1])
+        self.col_range = (self._cols[0], self._cols[-1])
+
+    def __repr__(self):
+        return f"TableInterpolator(rows={self.row_range}, cols={self.col_range}, " \
+               f"shape={self.values.shape})"
+
+    def __call__(self, x_row, x_col):
+        """Interpolate the value in the table corresponding to the coordinates,
+        arrays are passed on to :meth:`batch`
+
+        :param float x_row: the x row from which to retrieve the value
+        :param float x_col: the x col from which to retrieve the value
+
+        :rtype: float
+        """
+        if isinstance(x_row, np.ndarray) or isinstance(x_col, np.ndarray):
+            return self.batch(x_row, x_col)
+
+        col_low, col_high = self.col_range
+        if x_col > col_high or x_col < col_low:
+            raise NotInRangeError("x_col", x_col, self.col_range)
+
+        row_low, row_high = self.row_range
+        if x_row > row_high or x_row < row_low:
+            raise NotInRangeError("x_row", x_row, self.row_range)
+
+        rows, cols, values = self._rows, self._cols, self._values
+        # lower neighbors indexes of x_row and x_col (the upper neighbor is the next index)
+        i = bisect_right(rows, x_row) - 1
+        j = bisect_right(cols, x_col) - 1
+        row_distance = x_row - rows[i]
+        col_distance = x_col - cols[j]
+
+        lower_bound = values[i][j]
+        if col_distance == 0:
+            if row_distance != 0:
+                lower_bound += (values[i + 1][j] - lower_bound) / self._row_spans[i] * row_distance
+            return lower_bound
+
+        upper_bound = values[i][j + 1]
+        if row_distance != 0:
+            lower_bound += (values[i + 1][j] - lower_bound) / self._row_spans[i] * row_distance
+            upper_bound += (values[i + 1][j + 1] - upper_bound) / self._row_spans[i] * row_distance
+
+        return (upper_bound - lower_bound) / self._col_spans[j] * col_distance + lower_bound
+
+    def batch(self, x_rows, x_cols, errors='raise'):
+        """Interpolate the values in the table corresponding to arrays of coordinates
+        (see :func:`table_interpolation_batch`)
+
+        :param np.ndarray x_rows: the x rows from which to retrieve the values
+        :param np.ndarray x_cols: the x cols from which to retrieve the values
+        :param str errors: 'raise' or 'mask'
+
+        :rtype: np.ndarray or tuple[np.ndarray, np.ndarray]
+        """
+        return _batch_interpolation(self.rows, self.cols, self.values, x_rows, x_cols, errors)
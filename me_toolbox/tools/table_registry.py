@@ -0,0 +1,252 @@
+"""module containing the TableRegistry class, a process-wide cache
+for the design tables bundled with the package
+"""
+import hashlib
+import json
+import os
+from importlib import resources
+from pathlib import Path, PurePosixPath
+from threading import Lock
+from time import perf_counter
+
+import numpy as np
+
+from me_toolbox.tools.table_interpolation import TableInterpolator
+
+# version of the compiled tables format, compiled tables of other versions are ignored
+COMPILED_FORMAT_VERSION = 1
+
+
+class TableRegistry:
+    """Loads every registered table once (lazily, on first use)
+    and hands out read-only numpy arrays of its content.
+
+    If a table was compiled (see :meth:`compile`) and the compiled file is up-to-date
+    with the source CSV, the table is memory-mapped instead of parsed,
+    so processes loading the same table share its pages
+    """
+
+    def __init__(self):
+        self._specs = {}
+        self._tables = {}
+        self._interpolators = {}
+        self._stats = {}
+        self._lock = Lock()
+
+    def register(self, package, resource, **parse_kwargs):
+        """Register a table bundled with a package, the table isn't read until first requested
+
+        :param str package: The package containing the table (e.g. 'me_toolbox.gears')
+        :param str resource: The table file path relative to the package
+            (e.g. 'tables/J75 - helix gear geometry factors.csv')
+        :param parse_kwargs: Keyword arguments passed to np.genfromtxt
+            (default is delimiter=',')
+
+        :returns: The table key
+        :rtype: tuple[str, str]
+        """
+        key = (package, resource)
+        parse_kwargs.setdefault('delimiter', ',')
+        with self._lock:
+            if key in self._specs and self._specs[key] != parse_kwargs:
+                raise ValueError(f"{resource} is already registered with different parse options")
+            self._specs[key] = parse_kwargs
+            self._stats.setdefault(key, {'loads': 0, 'hits': 0, 'load_time': 0.0,
+                                         'source': None})
+        return key
+
+    def get(self, package, resource):
+        """Returns the table as a read-only numpy array,
+        the table is read from disk only on the first call
+
+        :param str package: The package containing the table
+        :param str resource: The table file path relative to the package
+
+        :rtype: np.ndarray
+        """
+        key = (package, resource)
+        try:
+            table = self._tables[key]
+        except KeyError:
+            with self._lock:
+                if key not in self._specs:
+                    raise KeyError(f"{resource} is not a registered table of {package}")
+                # another thread might have loaded the table while we waited for the lock
+                if key not in self._tables:
+                    self._tables[key] = self._load(key)
+                table = self._tables[key]
+        else:
+            self._stats[key]['hits'] += 1
+        return table
+
+    def interpolator(self, package, resource):
+        """Returns a :class:`TableInterpolator` of the table (built once per table)
+
+        :param str package: The package containing the table
+        :param str resource: The table file path relative to the package
+
+        :rtype: TableInterpolator
+        """
+        key = (package, resource)
+        try:
+            return self._interpolators[key]
+        except KeyError:
+            interpolator = TableInterpolator(self.get(package, resource))
+            return self._interpolators.setdefault(key, interpolator)
+
+    def _load(self, key):
+        """Reads the table (compiled if up-to-date, otherwise the CSV)
+        from the package resources and updates the load statistics
+        """
+        package, resource = key
+        start = perf_counter()
+        source = resources.files(package).joinpath(resource)
+        source_bytes = source.read_bytes()
+
+        table = self._load_compiled(key, source_bytes)
+        if table is None:
+            table = _parse(source_bytes, self._specs[key])
+            table.setflags(write=False)
+            self._stats[key]['source'] = 'csv'
+        else:
+            self._stats[key]['source'] = 'compiled'
+
+        stats = self._stats[key]
+        stats['loads'] += 1
+        stats['load_time'] += perf_counter() - start
+        return table
+
+    def _load_compiled(self, key, source_bytes):
+        """Memory-map the compiled table, returns None if the table wasn't compiled
+        or if the compiled table is stale (different source checksum, format version
+        or parse options)
+        """
+        package, resource = key
+        table_path, meta_path = _compiled_paths(resources.files(package).joinpath(resource))
+        try:
+            metadata = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+        if metadata != self._metadata(key, source_bytes):
+            return None
+
+        if isinstance(table_path, Path):
+            return np.load(table_path, mmap_mode='r', allow_pickle=False)
+        # the package isn't on the file system (e.g. zipped), load the table to memory
+        with table_path.open('rb') as file:
+            table = np.load(file, allow_pickle=False)
+        table.setflags(write=False)
+        return table
+
+    def _metadata(self, key, source_bytes):
+        """The metadata identifying an up-to-date compiled table"""
+        return {'format_version': COMPILED_FORMAT_VERSION,
+                'source': PurePosixPath(key[1]).name,
+                'source_sha256': hashlib.sha256(source_bytes).hexdigest(),
+                'parse_kwargs': {name: str(value) for name, value in self._specs[key].items()}}
+
+    def compile(self, package=None, verbose=False):
+        """Compile the registered tables into a binary (.npy) format next to their CSV source,
+        together with a metadata file holding the source checksum and the format version
+
+        :param str or None package: Compile only the tables of this package (all if None)
+        :param bool verbose: Print the compiled tables
+
+        :returns: The paths of the compiled tables
+        :rtype: list[pathlib.Path]
+        """
+        compiled = []
+        for key, parse_kwargs in list(self._specs.items()):
+            if package is not None and key[0] != package:
+                continue
+            source = resources.files(key[0]).joinpath(key[1])
+            if not isinstance(source, Path):
+                raise OSError(f"can't compile {key[1]}, {key[0]} is not on the file system")
+
+            source_bytes = source.read_bytes()
+            table = _parse(source_bytes, parse_kwargs)
+            table_path, meta_path = _compiled_paths(source)
+
+            # write to temporary files first so a concurrent reader never sees a partial table
+            _atomic_write(table_path, lambda file: np.save(file, table, allow_pickle=False))
+            metadata = json.dumps(self._metadata(key, source_bytes), indent=2).encode('utf-8')
+            _atomic_write(meta_path, lambda file: file.write(metadata))
+
+            compiled.append(table_path)
+            if verbose:
+                print(f"compiled {source} -> {table_path.name}")
+        return compiled
+
+    def stats(self):
+        """Returns the number of disk loads, cache hits, the total load time in [s]
+        and the source the table was loaded from ('compiled' or 'csv') of every registered table
+
+        :rtype: dict
+        """
+        return {f"{package}/{resource}": dict(stats)
+                for (package, resource), stats in self._stats.items()}
+
+    def clear(self):
+        """Drop all the loaded tables (they will be reloaded on the next request)
+        and reset the statistics, the registrations are kept
+        """
+        with self._lock:
+            self._tables.clear()
+            self._interpolators.clear()
+            for stats in self._stats.values():
+                stats.update(loads=0, hits=0, load_time=0.0, source=None)
+
+
+def _parse(source_bytes, parse_kwargs):
+    """Parse the CSV content of a table"""
+    return np.genfromtxt(source_bytes.decode('utf-8-sig').splitlines(), **parse_kwargs)
+
+
+def _compiled_paths(source):
+    """Returns the paths of the compiled table and of its metadata file"""
+    stem = PurePosixPath(source.name).stem
+    return source.parent.joinpath(stem + '.npy'), source.parent.joinpath(stem + '.meta.json')
+
+
+def _atomic_write(path, write):
+    """Write a file through a temporary file and replace the destination in one step"""
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, 'wb') as file:
+            write(file)
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink()
+
+
+# the process-wide registry
+table_registry = TableRegistry()
+
+
+def register_table(package, resource, **parse_kwargs):
+    """Register a table in the process-wide registry (see :meth:`TableRegistry.register`)"""
+    return table_registry.register(package, resource, **parse_kwargs)
+
+
+def get_table(package, resource):
+    """Get a table from the process-wide registry (see :meth:`TableRegistry.get`)"""
+    return table_registry.get(package, resource)
+
+
+def get_interpolator(package, resource):
+    """Get a table interpolator from the process-wide registry
+    (see :meth:`TableRegistry.interpolator`)
+    """
+    return table_registry.interpolator(package, resource)
+
+
+def compile_tables(package=None, verbose=False):
+    """Compile the tables of the process-wide registry (see :meth:`TableRegistry.compile`)"""
+    return table_registry.compile(package, verbose)
+
+
+def table_stats():
+    """Load statistics of the process-wide registry (see :meth:`TableRegistry.stats`)"""
+    return table_registry.stats()
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from me_toolbox.tools import inch_to_millimetre, lbs_to_newtons, percent_to_decimal
+from me_toolbox.tools import convert_record_array, UNIT_FACTORS
+
+
+class TestUnitConversions(unittest.TestCase):
+    def test_scalar_and_list(self):
+        self.assertEqual(inch_to_millimetre(2), 50.8)
+        self.assertEqual(inch_to_millimetre([1, 2]), [25.4, 50.8])
+        with self.assertRaises(ValueError):
+            inch_to_millimetre('2')
+
+    def test_array(self):
+        values = np.linspace(0, 10, 11)
+        np.testing.assert_array_equal(lbs_to_newtons(values), values * 4.448)
+
+    def test_array_out(self):
+        values = np.linspace(0, 10, 11)
+        expected = values * 25.4
+        result = inch_to_millimetre(values, out=values)
+        self.assertIs(result, values)
+        np.testing.assert_array_equal(values, expected)
+
+    def test_percent_to_decimal(self):
+        self.assertEqual(percent_to_decimal(45), 0.45)
+        self.assertEqual(percent_to_decimal((45, 0.3)), [0.45, 0.3])
+        values = np.array([45, 0.3, 1])
+        np.testing.assert_array_equal(percent_to_decimal(values), [0.45, 0.3, 0.01])
+        percent_to_decimal(values, out=values)
+        np.testing.assert_array_equal(values, [0.45, 0.3, 0.01])
+
+    def test_convert_record_array(self):
+        records = np.array([(1., 10., 3), (2., 20., 4)],
+                           dtype=[('d', float), ('F', float), ('n', int)])
+        converted = convert_record_array(records, {'d': 'inch_to_millimetre', 'F': 2})
+        np.testing.assert_array_equal(converted['d'], [25.4, 50.8])
+        np.testing.assert_array_equal(converted['F'], [20., 40.])
+        np.testing.assert_array_equal(converted['n'], [3, 4])
+        # the input is untouched unless passed as out
+        np.testing.assert_array_equal(records['d'], [1., 2.])
+        convert_record_array(records, {'F': 'lbs_to_newtons'}, out=records)
+        np.testing.assert_array_equal(records['F'],
+                                      np.array([10., 20.]) * UNIT_FACTORS['lbs_to_newtons'])
+
+    def test_convert_record_array_int_column(self):
+        records = np.array([(1, 3), (2, 4)], dtype=[('d', int), ('n', int)])
+        converted = convert_record_array(records, {'d': 'inch_to_millimetre', 'n': 2})
+        self.assertEqual(converted.dtype['d'].kind, 'f')
+        np.testing.assert_allclose(converted['d'], [25.4, 50.8])
+        # an integer factor keeps the integer column
+        self.assertEqual(converted.dtype['n'].kind, 'i')
+        np.testing.assert_array_equal(converted['n'], [6, 8])
+        with self.assertRaises(TypeError):
+            convert_record_array(records, {'d': 'inch_to_millimetre'}, out=records)
+
+    def test_convert_record_array_unknown(self):
+        records = np.zeros(2, dtype=[('d', float)])
+        with self.assertRaises(KeyError):
+            convert_record_array(records, {'d': 'furlongs_to_metres'})
+        with self.assertRaises(KeyError):
+            convert_record_array(records, {'x': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
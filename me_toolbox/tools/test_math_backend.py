@@ -0,0 +1,44 @@
+import importlib.util
+import math
+import unittest
+
+import numpy as np
+
+from me_toolbox.tools import set_symbolic, is_symbolic, symbolic_mode
+from me_toolbox.tools.math_backend import sqrt
+
+HAS_SYMPY = importlib.util.find_spec('sympy') is not None
+
+
+class TestMathBackend(unittest.TestCase):
+    def test_float(self):
+        self.assertIsInstance(sqrt(2), float)
+        self.assertEqual(sqrt(2.0), math.sqrt(2.0))
+
+    def test_array(self):
+        values = np.array([1., 4., 9.])
+        np.testing.assert_array_equal(sqrt(values), [1., 2., 3.])
+
+    @unittest.skipUnless(HAS_SYMPY, "sympy (the symbolic extra) isn't installed")
+    def test_symbolic(self):
+        import sympy
+        x = sympy.Symbol('x', positive=True)
+        with self.assertRaises(TypeError):
+            sqrt(x)
+        with symbolic_mode():
+            self.assertTrue(is_symbolic())
+            self.assertEqual(sqrt(x ** 2), x)
+        self.assertFalse(is_symbolic())
+
+    @unittest.skipUnless(HAS_SYMPY, "sympy (the symbolic extra) isn't installed")
+    def test_set_symbolic(self):
+        set_symbolic()
+        try:
+            self.assertTrue(is_symbolic())
+        finally:
+            set_symbolic(False)
+        self.assertFalse(is_symbolic())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from math import pi, sqrt
+
+import numpy as np
+
+from me_toolbox.tools import principal_stresses, von_mises_stress, tresca_stress
+from me_toolbox.tools import section_stresses, iter_section_stresses, stress_envelope
+from me_toolbox.tools import bending_stress, torsion_stress
+
+
+class TestStressStates(unittest.TestCase):
+    def test_principal_stresses(self):
+        principal = principal_stresses(np.array([100., -50.]), txy=np.array([0., 30.]))
+        np.testing.assert_allclose(principal[0], [100, 0, 0], atol=1e-12)
+        radius = sqrt(25 ** 2 + 30 ** 2)
+        np.testing.assert_allclose(principal[1], [-25 + radius, 0, -25 - radius], atol=1e-12)
+
+    def test_equivalent_stresses(self):
+        self.assertAlmostEqual(von_mises_stress(100., txy=50.), sqrt(100 ** 2 + 3 * 50 ** 2))
+        self.assertAlmostEqual(tresca_stress(100., txy=50.), 2 * sqrt(50 ** 2 + 50 ** 2))
+        self.assertAlmostEqual(von_mises_stress(100., 100., 100.), 0)
+
+    def test_star_import(self):
+        namespace = {}
+        exec('from me_toolbox.tools.stress import *', namespace)  # pylint: disable=exec-used
+        self.assertNotIn('np', namespace)
+        self.assertNotIn('namedtuple', namespace)
+        self.assertIn('section_stresses', namespace)
+        self.assertIn('SectionStresses', namespace)
+
+
+class TestSectionStresses(unittest.TestCase):
+    def setUp(self):
+        r = 10
+        angles = np.linspace(0, 2 * pi, 36, endpoint=False)
+        self.y, self.z = r * np.cos(angles), r * np.sin(angles)
+        self.A, self.I, self.J = pi * r ** 2, pi * r ** 4 / 4, pi * r ** 4 / 2
+        rng = np.random.default_rng(1)
+        self.loads = {'N': rng.normal(size=50) * 1e3, 'My': rng.normal(size=50) * 1e5,
+                      'Mz': rng.normal(size=50) * 1e5, 'T': rng.normal(size=50) * 1e5}
+        self.r = r
+
+    def test_components(self):
+        stresses = section_stresses(self.y, self.z, self.A, self.I, self.I, self.J, **self.loads)
+        self.assertEqual(stresses.von_mises.shape, (50, 36))
+        case, point = 4, 9
+        normal = (self.loads['N'][case] / self.A +
+                  bending_stress(self.loads['My'][case], self.I, self.z[point]) -
+                  self.loads['Mz'][case] / self.I * self.y[point])
+        self.assertAlmostEqual(stresses.normal[case, point], normal)
+        shear = np.hypot(stresses.shear_xy[case, point], stresses.shear_xz[case, point])
+        self.assertAlmostEqual(shear, abs(torsion_stress(self.loads['T'][case], self.r, self.J)))
+
+    def test_closed_form_matches_eigenvalues(self):
+        stresses = section_stresses(self.y, self.z, self.A, self.I, self.I, self.J, **self.loads)
+        principal = principal_stresses(stresses.normal, txy=stresses.shear_xy,
+                                       txz=stresses.shear_xz)
+        np.testing.assert_allclose(stresses.principal, principal, atol=1e-9)
+
+    def test_chunks_and_envelope(self):
+        stresses = section_stresses(self.y, self.z, self.A, self.I, self.I, self.J, **self.loads)
+        chunks = list(iter_section_stresses(self.y, self.z, self.A, self.I, self.I, self.J,
+                                            chunk_elements=100, **self.loads))
+        self.assertEqual(len(chunks), 25)
+        np.testing.assert_array_equal(np.concatenate([chunk.von_mises for _, chunk in chunks]),
+                                      stresses.von_mises)
+
+        envelope = stress_envelope(self.y, self.z, self.A, self.I, self.I, self.J,
+                                   chunk_elements=100, **self.loads)
+        np.testing.assert_array_equal(envelope.von_mises, stresses.von_mises.max(axis=0))
+        np.testing.assert_array_equal(envelope.von_mises_case, stresses.von_mises.argmax(axis=0))
+        np.testing.assert_array_equal(envelope.tresca_case, stresses.tresca.argmax(axis=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
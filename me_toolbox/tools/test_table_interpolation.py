@@ -0,0 +1,65 @@
+from unittest import TestCase
+import numpy as np
+
+from me_toolbox.tools import table_interpolation, table_interpolation_batch, NotInRangeError
+from me_toolbox.tools import TableInterpolator, get_table
+from me_toolbox.gears.gear import SPUR_YJ_TABLES
+
+
+class TestTableInterpolationBatch(TestCase):
+    def setUp(self):
+        self.data = get_table(*SPUR_YJ_TABLES[20])
+        rows, cols = self.data[1:, 0], self.data[0, 1:]
+        # table values and points between them
+        x_rows = np.unique(np.concatenate([rows, np.linspace(rows[0], rows[-1], 37)]))
+        x_cols = np.unique(np.concatenate([cols, np.linspace(cols[0], cols[-1], 41)]))
+        self.x_rows, self.x_cols = np.meshgrid(x_rows, x_cols, indexing='ij')
+
+    def test_same_as_scalar(self):
+        result = table_interpolation_batch(self.x_rows, self.x_cols, self.data)
+        expected = [table_interpolation(x_row, x_col, self.data)
+                    for x_row, x_col in zip(self.x_rows.ravel(), self.x_cols.ravel())]
+        np.testing.assert_array_equal(result.ravel(), expected)
+
+    def test_broadcast(self):
+        result = table_interpolation_batch(self.x_rows[:, 0], 17, self.data)
+        self.assertEqual(result.shape, self.x_rows[:, 0].shape)
+
+    def test_not_in_range(self):
+        with self.assertRaises(NotInRangeError) as error:
+            table_interpolation_batch([18, 10, 25, 1e4], [17, 17, 0.5, 17], self.data)
+        np.testing.assert_array_equal(error.exception.indices, [1, 2, 3])
+
+    def test_mask(self):
+        result, in_range = table_interpolation_batch([18, 10, 25], [17, 17, 0.5], self.data,
+                                                     errors='mask')
+        np.testing.assert_array_equal(in_range, [True, False, False])
+        self.assertAlmostEqual(result[0], 0.32404)
+        self.assertTrue(np.isnan(result[1:]).all())
+
+
+class TestTableInterpolator(TestCase):
+    def setUp(self):
+        self.data = get_table(*SPUR_YJ_TABLES[25])
+        self.interpolator = TableInterpolator(self.data)
+        rows, cols = self.data[1:, 0], self.data[0, 1:]
+        self.points = [(x_row, x_col)
+                       for x_row in np.unique(np.concatenate([rows, np.linspace(rows[0], rows[-1], 29)]))
+                       for x_col in np.unique(np.concatenate([cols, np.linspace(cols[0], cols[-1], 31)]))]
+
+    def test_scalar_same_as_function(self):
+        for x_row, x_col in self.points:
+            self.assertEqual(self.interpolator(x_row, x_col),
+                             table_interpolation(x_row, x_col, self.data))
+
+    def test_scalar_returns_float(self):
+        self.assertIs(type(self.interpolator(20, 40)), float)
+
+    def test_array_same_as_function(self):
+        x_rows, x_cols = np.array(self.points).T
+        expected = [table_interpolation(x_row, x_col, self.data) for x_row, x_col in self.points]
+        np.testing.assert_array_equal(self.interpolator(x_rows, x_cols), expected)
+
+    def test_not_in_range(self):
+        self.assertRaises(NotInRangeError, self.interpolator, 12, 20)
+        self.assertRaises(NotInRangeError, self.interpolator, 20, 1001)
@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+
+from me_toolbox.tools import TableRegistry
+
+
+class TestTableRegistry(TestCase):
+    def setUp(self):
+        self.registry = TableRegistry()
+        self.key = self.registry.register('me_toolbox.gears',
+                                          'tables/J75 - helix gear geometry factors.csv')
+
+    def test_loaded_once(self):
+        for _ in range(10):
+            self.registry.get(*self.key)
+        stats = self.registry.stats()['me_toolbox.gears/tables/J75 - helix gear geometry factors.csv']
+        self.assertEqual(stats['loads'], 1)
+        self.assertEqual(stats['hits'], 9)
+
+    def test_same_array(self):
+        self.assertIs(self.registry.get(*self.key), self.registry.get(*self.key))
+
+    def test_read_only(self):
+        table = self.registry.get(*self.key)
+        with self.assertRaises(ValueError):
+            table[1, 1] = 0
+
+    def test_content(self):
+        table = self.registry.get(*self.key)
+        self.assertEqual(table.shape, (5, 4))
+        self.assertAlmostEqual(table[1, 1], 0.495)
+
+    def test_unregistered_table(self):
+        self.assertRaises(KeyError, self.registry.get, 'me_toolbox.gears', 'tables/unknown.csv')
+
+    def test_clear(self):
+        self.registry.get(*self.key)
+        self.registry.clear()
+        self.registry.get(*self.key)
+        stats = self.registry.stats()['me_toolbox.gears/tables/J75 - helix gear geometry factors.csv']
+        self.assertEqual(stats['loads'], 1)
+
+    def test_interpolator_built_once(self):
+        self.assertIs(self.registry.interpolator(*self.key), self.registry.interpolator(*self.key))
+        self.assertAlmostEqual(self.registry.interpolator(*self.key)(20, 10), 0.495)
+
+
+class TestCompiledTables(TestCase):
+    def setUp(self):
+        # a temporary package with a table so the compiled files don't end up in the source tree
+        self.temp_dir = TemporaryDirectory()
+        tables = Path(self.temp_dir.name, 'compiled_tables_test_package', 'tables')
+        tables.mkdir(parents=True)
+        tables.parent.joinpath('__init__.py').touch()
+        self.csv = tables / 'table.csv'
+        self.csv.write_text('x,10,20\n1,0.1,0.2\n2,0.3,0.4\n')
+        sys.path.insert(0, self.temp_dir.name)
+
+        self.registry = TableRegistry()
+        self.key = self.registry.register('compiled_tables_test_package', 'tables/table.csv')
+
+    def tearDown(self):
+        sys.path.remove(self.temp_dir.name)
+        sys.modules.pop('compiled_tables_test_package', None)
+        self.temp_dir.cleanup()
+
+    def source(self):
+        return self.registry.stats()['compiled_tables_test_package/tables/table.csv']['source']
+
+    def test_csv_when_not_compiled(self):
+        self.registry.get(*self.key)
+        self.assertEqual(self.source(), 'csv')
+
+    def test_compiled(self):
+        expected = self.registry.get(*self.key)
+        self.registry.compile()
+        self.registry.clear()
+        table = self.registry.get(*self.key)
+        self.assertEqual(self.source(), 'compiled')
+        self.assertIsInstance(table, np.memmap)
+        np.testing.assert_array_equal(table, expected)
+
+    def test_stale_compiled_table(self):
+        self.registry.compile()
+        self.csv.write_text('x,10,20\n1,0.5,0.2\n2,0.3,0.4\n')
+        table = self.registry.get(*self.key)
+        self.assertEqual(self.source(), 'csv')
+        self.assertAlmostEqual(table[1, 1], 0.5)
+
+    def test_build_script_import(self):
+        # the build script module doesn't shadow the compile_tables function
+        import me_toolbox.tools.build_tables  # pylint: disable=import-outside-toplevel,unused-import
+        import me_toolbox.tools  # pylint: disable=import-outside-toplevel
+        self.assertTrue(callable(me_toolbox.tools.compile_tables))
@@ -26,6 +26,7 @@ setuptools.setup(
     package_dir={"me_toolbox": "me_toolbox"},
     packages=setuptools.find_packages(),
     include_package_data=True,
-    install_requires=['sympy', 'numpy', 'mpmath'],
+    install_requires=['numpy'],
+    extras_require={'symbolic': ['sympy']},
     python_requires=">=3.9",
 )